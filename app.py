@@ -1,4 +1,3 @@
-import asyncio
 from datetime import datetime, timedelta
 import streamlit as st
 from loguru import logger
@@ -7,6 +6,7 @@ from src.services.news_service import NewsService
 from src.utils.config import get_settings
 from src.utils.exceptions import NewsAutomationError
 from src.models.database import create_db_and_tables
+from src.utils.background import run_in_background
 
 settings = get_settings()
 
@@ -16,8 +16,10 @@ def init_session_state():
         st.session_state.articles = []
     if 'selected_articles' not in st.session_state:
         st.session_state.selected_articles = []
+    if 'search_hits' not in st.session_state:
+        st.session_state.search_hits = []
 
-def render_article_card(article, index):
+def render_article_card(article, index, service):
     """Render an article card with selection checkbox."""
     with st.container():
         col1, col2 = st.columns([1, 6])
@@ -40,7 +42,9 @@ def render_article_card(article, index):
             st.markdown(f"**Source:** {article.source}")
             st.markdown(f"**Published:** {article.publication_date.strftime('%Y-%m-%d %H:%M:%S')}")
             st.markdown(f"**Topic:** {article.topic}")
-            with st.expander("Content"):
+            # Bodies are stored separately and only loaded when shown
+            if st.toggle("Show content", key=f"content_{index}"):
+                service.load_content([article])
                 st.write(article.content[:500] + "..." if len(article.content) > 500 else article.content)
         
         st.divider()
@@ -50,15 +54,19 @@ def init_session_state():
         st.session_state.articles = []
     if "selected_articles" not in st.session_state:
         st.session_state.selected_articles = []
+    if "search_hits" not in st.session_state:
+        st.session_state.search_hits = []
 
-def main():
-    """Main Streamlit application."""
-
+@st.cache_resource
+def get_service() -> NewsService:
+    """Create the database and the news service once per server, not on every rerun."""
     print("Creating database and tables...")
     create_db_and_tables()
     print("Database and tables created.")
+    return NewsService()
 
-
+def main():
+    """Main Streamlit application."""
 
     st.set_page_config(
         page_title="News Automation",
@@ -70,7 +78,7 @@ def main():
     init_session_state()
     
     # Initialize service
-    service = NewsService()
+    service = get_service()
     
     # Sidebar
     with st.sidebar:
@@ -118,7 +126,7 @@ def main():
                     end_dt = datetime.combine(end_date, datetime.max.time())
                     
                     # Collect and filter articles
-                    st.session_state.articles = asyncio.run(
+                    st.session_state.articles = run_in_background(
                         service.collect_and_filter_articles(
                             source=source,
                             topic=topic,
@@ -135,6 +143,30 @@ def main():
             except NewsAutomationError as e:
                 st.error(f"Error: {str(e)}")
                 logger.error(f"Failed to fetch articles: {e}")
+        
+        st.divider()
+        
+        # Full-text search over saved articles
+        query = st.text_input(
+            "Search Archive",
+            placeholder="e.g., chip export controls",
+            help="Find saved articles containing all of these words"
+        )
+        if st.button("Search"):
+            try:
+                st.session_state.search_hits = service.search(query)
+                if not st.session_state.search_hits:
+                    st.info("No saved articles match")
+            except NewsAutomationError as e:
+                st.error(f"Error: {str(e)}")
+                logger.error(f"Failed to search articles: {e}")
+    
+    # Search results
+    if st.session_state.search_hits:
+        st.title("Search results")
+        for i, hit in enumerate(st.session_state.search_hits):
+            st.markdown(hit.snippet)
+            render_article_card(hit.article, f"search_{i}", service)
     
     # Main content
     if st.session_state.articles:
@@ -142,7 +174,7 @@ def main():
         
         # Article list
         for i, article in enumerate(st.session_state.articles):
-            render_article_card(article, i)
+            render_article_card(article, i, service)
         
         # PDF generation
         if st.session_state.selected_articles:
@@ -0,0 +1,208 @@
+"""
+Benchmark moving article bodies out of the article table.
+
+Builds a SQLite database in the old layout, with bodies inline in
+``article.content``, then migrates it with ``move_inline_bodies`` so
+bodies are stored compressed in ``articlebody``. It reports the
+database size and the latency of listing queries before and after the
+move. The listing walks keyset pages of article metadata the way
+``NewsService.get_articles_page`` does. Loading one body, as when a
+card is expanded, is timed too.
+
+Usage:
+    python -m benchmarks.bench_bodies [--articles 50000] [--pages 200]
+"""
+import argparse
+import random
+import statistics
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from itertools import accumulate
+from typing import Dict, List, Tuple
+
+from loguru import logger
+from sqlalchemy import Engine, text
+from sqlmodel import SQLModel, create_engine
+
+from src.models.body import move_inline_bodies
+from src.models.compression import decompress
+
+# Article table as it was before bodies moved out
+LEGACY_SCHEMA = [
+    """CREATE TABLE article (
+        id INTEGER PRIMARY KEY,
+        title VARCHAR NOT NULL,
+        url VARCHAR NOT NULL UNIQUE,
+        publication_date DATETIME NOT NULL,
+        source VARCHAR NOT NULL,
+        content VARCHAR NOT NULL,
+        topic VARCHAR,
+        url_hash INTEGER,
+        created_at DATETIME NOT NULL,
+        updated_at DATETIME NOT NULL
+    )""",
+    "CREATE INDEX ix_article_publication_date ON article (publication_date)",
+    "CREATE INDEX ix_article_source ON article (source)",
+    "CREATE INDEX ix_article_title ON article (title)",
+    "CREATE INDEX ix_article_topic ON article (topic)",
+    "CREATE INDEX ix_article_url_hash ON article (url_hash)",
+    "CREATE INDEX ix_article_topic_publication_date_id ON article (topic, publication_date, id)",
+]
+
+LISTING = """
+    SELECT id, title, url, publication_date, source, topic, created_at FROM article
+    WHERE (publication_date, id) < (:published, :id)
+    ORDER BY publication_date DESC, id DESC LIMIT 50
+"""
+MONTH_LISTING = """
+    SELECT id, title, url, publication_date, source, topic, created_at FROM article
+    WHERE publication_date >= :start AND publication_date < :end
+    ORDER BY publication_date DESC, id DESC
+"""
+TOPIC_LISTING = """
+    SELECT id, title, url, publication_date, source, topic, created_at FROM article
+    WHERE topic = :topic AND (publication_date, id) < (:published, :id)
+    ORDER BY publication_date DESC, id DESC LIMIT 50
+"""
+
+BOILERPLATE = {
+    source: [
+        f"Sign up for the {source} morning briefing to get the day's top stories in your inbox.",
+        f"Copyright {source} 2024. All rights reserved. This material may not be published or redistributed.",
+        "Reporting by staff correspondents; additional reporting from wire services.",
+    ]
+    for source in ("example.com", "daily.example.org", "wire.example.net")
+}
+
+STEMS = ("market", "govern", "report", "energ", "tech", "health", "polic",
+         "trade", "court", "climat", "elect", "bank", "price", "worker")
+SUFFIXES = ("", "s", "ed", "ing", "er", "al", "ity", "ment")
+FUNCTION_WORDS = ("the", "of", "and", "to", "in", "a", "said", "on", "for", "that", "with", "was", "by", "as")
+
+def make_vocabulary(rng: random.Random) -> Tuple[List[str], List[float]]:
+    """Words in random rank order with cumulative Zipf weights."""
+    words = [stem + suffix for stem in STEMS for suffix in SUFFIXES]
+    words += [*FUNCTION_WORDS, *(f"name{i}" for i in range(3000))]
+    rng.shuffle(words)
+    return words, list(accumulate(1 / rank for rank in range(1, len(words) + 1)))
+
+def make_body(rng: random.Random, words: List[str], weights: List[float], source: str) -> str:
+    """A news-like body: Zipf-distributed words framed by the source's boilerplate."""
+    sentences = [
+        " ".join(rng.choices(words, cum_weights=weights, k=rng.randint(12, 28))).capitalize() + "."
+        for _ in range(rng.randint(15, 30))
+    ]
+    return " ".join([BOILERPLATE[source][0], *sentences, *BOILERPLATE[source][1:]])
+
+def build_legacy(engine: Engine, count: int) -> None:
+    rng = random.Random(42)
+    words, weights = make_vocabulary(rng)
+    start = datetime(2024, 1, 1)
+    now = datetime.utcnow()
+    with engine.begin() as conn:
+        for statement in LEGACY_SCHEMA:
+            conn.execute(text(statement))
+        for offset in range(0, count, 1000):
+            rows = []
+            for i in range(offset, min(offset + 1000, count)):
+                source = rng.choice(list(BOILERPLATE))
+                rows.append({
+                    "id": i + 1,
+                    "title": f"Headline {i} about {rng.choice(words)} and {rng.choice(words)}",
+                    "url": f"https://{source}/news/{i}",
+                    "publication_date": start + timedelta(minutes=7 * i),
+                    "source": source,
+                    "content": make_body(rng, words, weights, source),
+                    "topic": rng.choice(["markets", "politics", "science", "sport"]),
+                    "url_hash": i,
+                    "created_at": now,
+                    "updated_at": now,
+                })
+            conn.execute(
+                text(
+                    "INSERT INTO article VALUES (:id, :title, :url, :publication_date, :source, :content, "
+                    ":topic, :url_hash, :created_at, :updated_at)"
+                ),
+                rows
+            )
+
+def database_size(path: Path) -> float:
+    return path.stat().st_size / 2**20
+
+def time_listing(engine: Engine, pages: int) -> Dict[str, float]:
+    """Median milliseconds per listing page, per month of listings and to load one body."""
+    results = {}
+    with engine.connect() as conn:
+        for name, query, params in (("page", LISTING, {}), ("topic page", TOPIC_LISTING, {"topic": "markets"})):
+            cursor = {"published": datetime.max, "id": 0}
+            timings = []
+            for _ in range(pages):
+                started = time.perf_counter()
+                rows = conn.execute(text(query), {**params, **cursor}).all()
+                timings.append(time.perf_counter() - started)
+                if not rows:
+                    break
+                cursor = {"published": rows[-1].publication_date, "id": rows[-1].id}
+            results[name] = statistics.median(timings) * 1000
+
+        timings = []
+        for month in range(1, 7):
+            started = time.perf_counter()
+            conn.execute(text(MONTH_LISTING), {"start": datetime(2024, month, 1), "end": datetime(2024, month + 1, 1)}).all()
+            timings.append(time.perf_counter() - started)
+        results["month"] = statistics.median(timings) * 1000
+
+        columns = {row[1] for row in conn.execute(text("PRAGMA table_info(article)"))}
+        ids = [row[0] for row in conn.execute(text("SELECT id FROM article ORDER BY random() LIMIT 200"))]
+        started = time.perf_counter()
+        for article_id in ids:
+            if "content" in columns:
+                conn.execute(text("SELECT content FROM article WHERE id = :id"), {"id": article_id}).scalar()
+            else:
+                data, dictionary = conn.execute(
+                    text(
+                        "SELECT articlebody.data, articlebodydictionary.data FROM articlebody "
+                        "LEFT JOIN articlebodydictionary ON articlebodydictionary.id = articlebody.dictionary_id "
+                        "WHERE article_id = :id"
+                    ),
+                    {"id": article_id}
+                ).one()
+                decompress(data, dictionary)
+        results["body"] = (time.perf_counter() - started) / len(ids) * 1000
+    return results
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--articles", type=int, default=50_000)
+    parser.add_argument("--pages", type=int, default=200)
+    args = parser.parse_args()
+
+    logger.remove()
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "bench.db"
+        engine = create_engine(f"sqlite:///{path}")
+        build_legacy(engine, args.articles)
+        with engine.connect() as conn:
+            conn.exec_driver_sql("VACUUM")
+        before = {"size": database_size(path), **time_listing(engine, args.pages)}
+
+        SQLModel.metadata.create_all(engine)
+        started = time.perf_counter()
+        with engine.begin() as conn:
+            move_inline_bodies(conn)
+        migration = time.perf_counter() - started
+        with engine.connect() as conn:
+            conn.exec_driver_sql("VACUUM")
+        after = {"size": database_size(path), **time_listing(engine, args.pages)}
+        engine.dispose()
+
+    print(f"{args.articles} articles, migrated in {migration:.1f} s")
+    print(f"{'':<22} {'inline':>10} {'separate':>10}")
+    for key, label in (("size", "database size (MiB)"), ("page", "listing page (ms)"),
+                       ("topic page", "topic page (ms)"), ("month", "month listing (ms)"), ("body", "load one body (ms)")):
+        print(f"{label:<22} {before[key]:>10.2f} {after[key]:>10.2f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+Benchmark provider payload normalization.
+
+Compares the original per-article path (one ``ArticleCreate`` build with
+``HttpUrl``/``fromisoformat`` and a try/except per record) with the batch
+path in ``src.collectors.normalize``.
+
+Usage:
+    python -m benchmarks.bench_normalize [--records 10000] [--repeat 5]
+"""
+import argparse
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Any, Callable, Dict, List
+
+from loguru import logger
+from pydantic import HttpUrl
+
+from src.collectors.normalize import NEWSAPI_FIELDS, normalize_records
+from src.models.article import ArticleCreate
+
+def make_records(count: int, invalid_every: int = 100) -> List[Dict[str, Any]]:
+    """Build NewsAPI-shaped records, with one invalid record every ``invalid_every``."""
+    records = []
+    for i in range(count):
+        records.append({
+            "title": f"Article {i} about markets, models and more",
+            "url": f"https://example.com/news/2024/01/01/article-{i}" if i % invalid_every else "not a url",
+            "publishedAt": f"2024-01-01T{i % 24:02d}:{i % 60:02d}:00Z",
+            "content": "Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 4,
+            "description": "Short description",
+        })
+    return records
+
+def legacy_normalize(records: List[Dict[str, Any]], source: str) -> List[ArticleCreate]:
+    """The per-article conversion the collectors used before batch normalization."""
+    articles = []
+    for article in records:
+        try:
+            articles.append(
+                ArticleCreate(
+                    title=article['title'],
+                    url=HttpUrl(article['url']),
+                    publication_date=datetime.fromisoformat(
+                        article['publishedAt'].replace('Z', '+00:00')
+                    ),
+                    source=source,
+                    content=article.get('content', article.get('description', '')),
+                )
+            )
+        except Exception as e:
+            logger.warning(f"Failed to process article: {e}")
+            continue
+    return articles
+
+def batch_normalize(records: List[Dict[str, Any]], source: str) -> List[ArticleCreate]:
+    return normalize_records(records, NEWSAPI_FIELDS, source)
+
+def measure(fn: Callable, records: List[Dict[str, Any]], repeat: int) -> Dict[str, float]:
+    """Return the best wall time, peak allocated memory and output size."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn(records, "example.com")
+        best = min(best, time.perf_counter() - started)
+
+    tracemalloc.start()
+    articles = fn(records, "example.com")
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"seconds": best, "peak_mb": peak / 1e6, "articles": len(articles)}
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--records", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    # Keep log formatting in the measurement but do not flood the terminal
+    logger.remove()
+    logger.add(lambda message: None, level="WARNING")
+
+    records = make_records(args.records)
+    results = {
+        "per-article": measure(legacy_normalize, records, args.repeat),
+        "batch": measure(batch_normalize, records, args.repeat),
+    }
+
+    print(f"{'path':<12} {'articles':>9} {'ms/10k':>9} {'records/s':>12} {'peak MB':>9}")
+    for name, result in results.items():
+        per_10k = result["seconds"] * 10_000 / args.records * 1000
+        print(
+            f"{name:<12} {result['articles']:>9} {per_10k:>9.1f} "
+            f"{args.records / result['seconds']:>12,.0f} {result['peak_mb']:>9.1f}"
+        )
+    speedup = results["per-article"]["seconds"] / results["batch"]["seconds"]
+    print(f"batch speedup: {speedup:.2f}x")
+
+if __name__ == "__main__":
+    main()
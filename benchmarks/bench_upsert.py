@@ -0,0 +1,94 @@
+"""
+Benchmark saving filtered articles.
+
+Compares the original per-article save loop (``SELECT`` by URL, then
+``add``/``commit``/``refresh`` for each row) with the batched
+``INSERT ... ON CONFLICT ... RETURNING`` path in ``src.models.bulk``,
+both on a fresh temporary SQLite file. The bulk path is also timed on
+a second pass where every article already exists.
+
+Usage:
+    python -m benchmarks.bench_upsert [--articles 10000]
+"""
+import argparse
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable, Dict, List
+
+from loguru import logger
+from sqlmodel import Session, SQLModel, create_engine, select
+
+from src.models.article import Article, ArticleCreate
+from src.models.bulk import upsert_articles
+
+def make_articles(count: int) -> List[ArticleCreate]:
+    """Build distinct articles with realistic field sizes."""
+    start = datetime(2024, 1, 1)
+    return [
+        ArticleCreate(
+            title=f"Article {i} about markets, models and more",
+            url=f"https://example.com/news/2024/01/01/article-{i}",
+            publication_date=start + timedelta(minutes=i),
+            source="example.com",
+            content="Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 20,
+            topic="markets",
+        )
+        for i in range(count)
+    ]
+
+def legacy_save(session: Session, articles: List[ArticleCreate]) -> int:
+    """The per-article save loop NewsService used before the bulk path."""
+    saved = 0
+    for article in articles:
+        article_dict = article.model_dump()
+        article_dict["url"] = str(article_dict["url"])
+        db_article = Article.model_validate(article_dict)
+        existing_article = session.exec(select(Article).where(Article.url == db_article.url)).first()
+        if existing_article is None:
+            session.add(db_article)
+            session.commit()
+            session.refresh(db_article)
+        saved += 1
+    return saved
+
+def bulk_save(session: Session, articles: List[ArticleCreate]) -> int:
+    ids = upsert_articles(session, articles)
+    session.commit()
+    return len(ids)
+
+def measure(save: Callable[[Session, List[ArticleCreate]], int], articles: List[ArticleCreate], passes: int) -> List[Dict[str, float]]:
+    """Run ``save`` ``passes`` times against one fresh database."""
+    with tempfile.TemporaryDirectory() as directory:
+        engine = create_engine(f"sqlite:///{Path(directory) / 'bench.db'}")
+        SQLModel.metadata.create_all(engine)
+        results = []
+        for _ in range(passes):
+            with Session(engine) as session:
+                started = time.perf_counter()
+                saved = save(session, articles)
+                results.append({"seconds": time.perf_counter() - started, "saved": saved})
+        engine.dispose()
+    return results
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--articles", type=int, default=10_000)
+    args = parser.parse_args()
+
+    logger.remove()
+    articles = make_articles(args.articles)
+    legacy = measure(legacy_save, articles, passes=1)[0]
+    bulk_new, bulk_existing = measure(bulk_save, articles, passes=2)
+
+    print(f"{'path':<22} {'articles':>9} {'seconds':>9} {'articles/s':>12}")
+    for name, result in (("per-article insert", legacy), ("bulk insert", bulk_new), ("bulk, all existing", bulk_existing)):
+        print(
+            f"{name:<22} {result['saved']:>9} {result['seconds']:>9.2f} "
+            f"{result['saved'] / result['seconds']:>12,.0f}"
+        )
+    print(f"bulk speedup: {legacy['seconds'] / bulk_new['seconds']:.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional
 from src.models.article import ArticleCreate
 
 class ArticleCollectorInterface(ABC):
@@ -15,3 +15,24 @@ class ArticleCollectorInterface(ABC):
     ) -> List[ArticleCreate]:
         """Get articles from the source."""
         pass
+    
+    async def iter_articles(
+        self,
+        source: str,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ) -> AsyncIterator[List[ArticleCreate]]:
+        """
+        Stream articles from the source one page at a time.
+        
+        Collectors backed by a paginated API override this to follow
+        pagination; the default yields the result of ``get_articles``
+        as a single page.
+        """
+        articles = await self.get_articles(
+            source=source,
+            start_date=start_date,
+            end_date=end_date
+        )
+        if articles:
+            yield articles
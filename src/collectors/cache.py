@@ -0,0 +1,153 @@
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional
+from loguru import logger
+
+from src.models.article import ArticleCreate
+from src.utils.config import get_settings
+
+settings = get_settings()
+
+def normalize_window(start_date: datetime, end_date: datetime) -> tuple[datetime, datetime]:
+    """Truncate a window to whole minutes so near-identical requests share a cache entry."""
+    return (
+        start_date.replace(second=0, microsecond=0),
+        end_date.replace(second=0, microsecond=0)
+    )
+
+class ResponseCache:
+    """Persistent, size-bounded cache of collector responses with age-dependent TTL."""
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        max_entries: Optional[int] = None,
+        ttl_recent: Optional[int] = None,
+        ttl_past: Optional[int] = None
+    ):
+        """
+        Open (or create) the cache database.
+
+        Args:
+            path: SQLite file holding the cache (defaults to ``collector_cache_path``)
+            max_entries: Entries kept before least recently used ones are evicted
+            ttl_recent: Seconds to keep windows that reach into the last day
+            ttl_past: Seconds to keep windows that ended more than a day ago
+        """
+        self.path = Path(path or settings.collector_cache_path)
+        self.max_entries = max_entries or settings.collector_cache_max_entries
+        self.ttl_recent = ttl_recent or settings.collector_cache_ttl_recent
+        self.ttl_past = ttl_past or settings.collector_cache_ttl_past
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS response_cache (
+                key TEXT PRIMARY KEY,
+                collector TEXT NOT NULL,
+                source TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                expires_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS ix_response_cache_last_access ON response_cache (last_access)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def _key(collector: str, source: str, start_date: datetime, end_date: datetime) -> str:
+        raw = f"{collector}|{source.lower()}|{start_date.isoformat()}|{end_date.isoformat()}"
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    def _ttl(self, end_date: datetime) -> int:
+        """Windows that ended over a day ago no longer change, so keep them longer."""
+        now = datetime.now(end_date.tzinfo) if end_date.tzinfo else datetime.utcnow()
+        return self.ttl_past if end_date < now - timedelta(days=1) else self.ttl_recent
+
+    def get(
+        self,
+        collector: str,
+        source: str,
+        start_date: datetime,
+        end_date: datetime
+    ) -> Optional[List[ArticleCreate]]:
+        """Return cached articles, or None on a miss or expired entry."""
+        key = self._key(collector, source, start_date, end_date)
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload, expires_at FROM response_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or row[1] < now:
+                if row is not None:
+                    self._conn.execute("DELETE FROM response_cache WHERE key = ?", (key,))
+                    self._conn.commit()
+                self.misses += 1
+                return None
+            self._conn.execute(
+                "UPDATE response_cache SET last_access = ? WHERE key = ?", (now, key)
+            )
+            self._conn.commit()
+            self.hits += 1
+        return [ArticleCreate.model_validate(item) for item in json.loads(row[0])]
+
+    def put(
+        self,
+        collector: str,
+        source: str,
+        start_date: datetime,
+        end_date: datetime,
+        articles: List[ArticleCreate]
+    ) -> None:
+        """Store a response and evict least recently used entries past the size limit."""
+        key = self._key(collector, source, start_date, end_date)
+        payload = json.dumps([article.model_dump(mode="json") for article in articles])
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO response_cache "
+                "(key, collector, source, payload, expires_at, last_access) VALUES (?, ?, ?, ?, ?, ?)",
+                (key, collector, source, payload, now + self._ttl(end_date), now)
+            )
+            overflow = self._conn.execute("SELECT COUNT(*) FROM response_cache").fetchone()[0] - self.max_entries
+            if overflow > 0:
+                self._conn.execute(
+                    "DELETE FROM response_cache WHERE key IN "
+                    "(SELECT key FROM response_cache ORDER BY last_access LIMIT ?)",
+                    (overflow,)
+                )
+                self.evictions += overflow
+                logger.debug(f"Evicted {overflow} collector cache entries")
+            self._conn.commit()
+
+    def clear(self) -> None:
+        """Remove every cached response."""
+        with self._lock:
+            self._conn.execute("DELETE FROM response_cache")
+            self._conn.commit()
+
+    def stats(self) -> Dict[str, float]:
+        """Return hit/miss/eviction counters and the current entry count."""
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM response_cache").fetchone()[0]
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "entries": entries,
+        }
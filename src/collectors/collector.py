@@ -1,12 +1,29 @@
+import asyncio
+import time
 from datetime import datetime, timedelta
-from typing import List, Optional
+from typing import AsyncIterator, Dict, List, Optional, Tuple
 from loguru import logger
+from pydantic import BaseModel
 
 from .base import ArticleCollectorInterface
+from .cache import ResponseCache, normalize_window
+from .feed import FeedCollector
+from .health import CollectorHealth
 from .newsapi import NewsAPICollector
 from .newsdataapi import NewsDataAPICollector
+from .sharding import merge_unique, shard_window, split_in_half
 from src.models.article import ArticleCreate
+from src.utils.config import get_settings
+from src.utils.dates import to_naive_utc
 from src.utils.exceptions import ArticleCollectionError
+from src.utils.rate_limit import get_rate_scheduler
+
+settings = get_settings()
+
+class MultiSourceResult(BaseModel):
+    """Per-source outcome of a multi-source collection run."""
+    articles: Dict[str, List[ArticleCreate]] = {}
+    errors: Dict[str, str] = {}
 
 class ArticleCollector:
     """Main article collector using a pool of collectors."""
@@ -16,34 +33,177 @@ class ArticleCollector:
         self.collectors = [
             NewsAPICollector(),
             NewsDataAPICollector(),
+            FeedCollector(),
             # Add more collectors here in the future
         ]
+        self.health: Dict[str, CollectorHealth] = {
+            collector.__class__.__name__: CollectorHealth(
+                collector.__class__.__name__,
+                failure_threshold=settings.collector_failure_threshold,
+                cooldown=settings.collector_circuit_cooldown
+            )
+            for collector in self.collectors
+        }
+        self.cache = ResponseCache() if settings.collector_cache_enabled else None
+        # source -> collector -> newest publication date it returned; incremental
+        # collection reads this to advance per-collector watermarks
+        self.latest_published: Dict[str, Dict[str, datetime]] = {}
+
+    def _apply_watermark(
+        self,
+        name: str,
+        start_date: datetime,
+        since: Optional[Dict[str, datetime]]
+    ) -> datetime:
+        """
+        Move the window start up to the collector's watermark, if it is later.
+
+        A collector without a watermark of its own starts from the newest one,
+        so falling back to it does not re-fetch the whole window.
+        """
+        if since:
+            watermark = since.get(name, max(since.values()))
+            if watermark > to_naive_utc(start_date):
+                return watermark
+        return start_date
+
+    def _record_published(self, name: str, source: str, articles: List[ArticleCreate]) -> None:
+        """Remember the newest publication date a collector returned for a source."""
+        if not articles:
+            return
+        newest = max(to_naive_utc(article.publication_date) for article in articles)
+        per_collector = self.latest_published.setdefault(source, {})
+        if name not in per_collector or newest > per_collector[name]:
+            per_collector[name] = newest
+
+    def _ranked_collectors(self) -> List[ArticleCollectorInterface]:
+        """Return collectors with a closed circuit, healthiest first."""
+        available = [
+            collector for collector in self.collectors
+            if not self.health[collector.__class__.__name__].is_open
+        ]
+        # sorted() is stable, so collectors without statistics keep the pool order
+        return sorted(available, key=lambda c: self.health[c.__class__.__name__].rank())
+
+    def _default_window(
+        self,
+        start_date: Optional[datetime],
+        end_date: Optional[datetime]
+    ) -> Tuple[datetime, datetime]:
+        """Fill in the default one-day window ending now."""
+        if not end_date:
+            end_date = datetime.utcnow()
+        if not start_date:
+            start_date = end_date - timedelta(days=1)
+        return start_date, end_date
+
+    def stats(self) -> Dict[str, Dict[str, object]]:
+        """Return latency and error statistics per collector, plus cache and quota usage."""
+        stats = {name: health.snapshot() for name, health in self.health.items()}
+        if self.cache:
+            stats["cache"] = self.cache.stats()
+        stats["rate_limits"] = get_rate_scheduler().usage()
+        return stats
+
+    async def _fetch(
+        self,
+        collector: ArticleCollectorInterface,
+        source: str,
+        start_date: datetime,
+        end_date: datetime,
+        since: Optional[Dict[str, datetime]] = None
+    ) -> List[ArticleCreate]:
+        """Call a single collector through the response cache and record its latency and outcome."""
+        name = collector.__class__.__name__
+        start_date = self._apply_watermark(name, start_date, since)
+        if to_naive_utc(start_date) >= to_naive_utc(end_date):
+            logger.debug(f"{name} is up to date for {source}, nothing to fetch")
+            return []
+        start_date, end_date = normalize_window(start_date, end_date)
+        if self.cache:
+            cached = self.cache.get(name, source, start_date, end_date)
+            if cached is not None:
+                logger.debug(f"Collector cache hit for {name} {source} {start_date} - {end_date}")
+                self._record_published(name, source, cached)
+                return cached
+
+        health = self.health[name]
+        started = time.monotonic()
+        try:
+            articles = await collector.get_articles(
+                source=source,
+                start_date=start_date,
+                end_date=end_date
+            )
+        except Exception:
+            health.record_failure(time.monotonic() - started)
+            raise
+        health.record_success(time.monotonic() - started)
+        if self.cache:
+            self.cache.put(name, source, start_date, end_date, articles)
+        self._record_published(name, source, articles)
+        return articles
 
     async def get(
         self,
         source: str,
         start_date: Optional[datetime] = None,
-        end_date: Optional[datetime] = None
+        end_date: Optional[datetime] = None,
+        hedged: Optional[bool] = None,
+        sharded: Optional[bool] = None,
+        since: Optional[Dict[str, datetime]] = None
     ) -> List[ArticleCreate]:
         """
         Try each collector in order until one returns articles.
+
+        Collectors are ordered by observed health and skipped while their
+        circuit is open. In hedged mode the next collector is started when
+        the current one has not answered within ``collector_hedge_delay``.
+        Windows longer than ``collector_shard_threshold_days`` are split into
+        sub-windows fetched in parallel (see ``_get_sharded``). ``since`` maps
+        collector names to watermarks; each collector is only asked for
+        articles published after its own watermark. With ``since`` a
+        collector that answers without new articles ends the search with an
+        empty result instead of falling back to the next one.
         """
-        if not end_date:
-            end_date = datetime.utcnow()
-        if not start_date:
-            start_date = end_date - timedelta(days=1)
+        start_date, end_date = self._default_window(start_date, end_date)
+
+        if sharded is None:
+            sharded = settings.collector_sharding
+        if sharded and end_date - start_date > timedelta(days=settings.collector_shard_threshold_days):
+            return await self._get_sharded(source, start_date, end_date, hedged, since)
+        return await self._get_window(source, start_date, end_date, hedged, since)
+
+    async def _get_window(
+        self,
+        source: str,
+        start_date: datetime,
+        end_date: datetime,
+        hedged: Optional[bool],
+        since: Optional[Dict[str, datetime]] = None
+    ) -> List[ArticleCreate]:
+        """Collect a single window with the first healthy collector that returns articles."""
+        collectors = self._ranked_collectors()
+        if not collectors:
+            raise ArticleCollectionError(
+                f"All collectors are unavailable (circuit open) for {source}"
+            )
+
+        if hedged is None:
+            hedged = settings.collector_hedging
+        if hedged:
+            return await self._get_hedged(collectors, source, start_date, end_date, since)
 
         last_exception = None
-        for collector in self.collectors:
+        for collector in collectors:
             try:
-                articles = await collector.get_articles(
-                    source=source,
-                    start_date=start_date,
-                    end_date=end_date
-                )
+                articles = await self._fetch(collector, source, start_date, end_date, since)
                 if articles:
                     logger.info(f"Successfully retrieved articles from {collector.__class__.__name__}")
                     return articles
+                if since:
+                    logger.info(f"No new articles for {source} from {collector.__class__.__name__}")
+                    return []
             except ArticleCollectionError as e:
                 logger.warning(f"{collector.__class__.__name__} failed: {e}")
                 last_exception = e
@@ -51,3 +211,216 @@ class ArticleCollector:
         raise ArticleCollectionError(
             f"No articles found for {source} between {start_date} and {end_date}. Last error: {last_exception}"
         )
+
+    async def _get_sharded(
+        self,
+        source: str,
+        start_date: datetime,
+        end_date: datetime,
+        hedged: Optional[bool],
+        since: Optional[Dict[str, datetime]] = None
+    ) -> List[ArticleCreate]:
+        """
+        Fetch ``collector_shard_days`` sub-windows in parallel and merge them.
+
+        A shard returning ``collector_shard_result_cap`` articles or more has
+        most likely been truncated by the provider, so it is split in half and
+        refetched until shards get down to ``collector_min_shard_hours``.
+        """
+        semaphore = asyncio.Semaphore(settings.collector_max_concurrency)
+        min_span = timedelta(hours=settings.collector_min_shard_hours)
+        errors: List[ArticleCollectionError] = []
+
+        async def fetch_shard(shard_start: datetime, shard_end: datetime) -> List[ArticleCreate]:
+            async with semaphore:
+                try:
+                    articles = await self._get_window(source, shard_start, shard_end, hedged, since)
+                except ArticleCollectionError as e:
+                    errors.append(e)
+                    return []
+            # Recurse outside the semaphore so nested shards cannot deadlock it
+            if len(articles) >= settings.collector_shard_result_cap and shard_end - shard_start > min_span:
+                logger.info(f"Shard {shard_start} - {shard_end} for {source} is dense, splitting")
+                halves = await asyncio.gather(
+                    *(fetch_shard(half_start, half_end) for half_start, half_end in split_in_half(shard_start, shard_end))
+                )
+                return merge_unique([articles, *halves])
+            return articles
+
+        shards = shard_window(start_date, end_date, timedelta(days=settings.collector_shard_days))
+        batches = await asyncio.gather(*(fetch_shard(shard_start, shard_end) for shard_start, shard_end in shards))
+        articles = merge_unique(batches)
+        if not articles and not (since and not errors):
+            raise ArticleCollectionError(
+                f"No articles found for {source} between {start_date} and {end_date}. "
+                f"Last error: {errors[-1] if errors else None}"
+            )
+
+        logger.info(f"Collected {len(articles)} articles for {source} from {len(shards)} shards")
+        return articles
+
+    async def _get_hedged(
+        self,
+        collectors: List[ArticleCollectorInterface],
+        source: str,
+        start_date: datetime,
+        end_date: datetime,
+        since: Optional[Dict[str, datetime]] = None
+    ) -> List[ArticleCreate]:
+        """Race collectors, starting the next one on timeout or empty result."""
+        remaining = iter(collectors)
+        tasks: Dict[asyncio.Task, ArticleCollectorInterface] = {}
+        last_exception = None
+
+        def launch_next() -> None:
+            collector = next(remaining, None)
+            if collector is not None:
+                task = asyncio.create_task(self._fetch(collector, source, start_date, end_date, since))
+                tasks[task] = collector
+
+        launch_next()
+        try:
+            while tasks:
+                done, _ = await asyncio.wait(
+                    tasks,
+                    timeout=settings.collector_hedge_delay,
+                    return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    collector = tasks.pop(task)
+                    name = collector.__class__.__name__
+                    try:
+                        articles = task.result()
+                    except Exception as e:
+                        logger.warning(f"{name} failed: {e}")
+                        last_exception = e
+                        continue
+                    if articles:
+                        logger.info(f"Successfully retrieved articles from {name} (hedged)")
+                        return articles
+                    if since:
+                        logger.info(f"No new articles for {source} from {name}")
+                        return []
+                if not done:
+                    logger.info(f"No answer within {settings.collector_hedge_delay}s for {source}, hedging")
+                # Start the next collector on timeout, or when every running one came back empty
+                if not done or not tasks:
+                    launch_next()
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        raise ArticleCollectionError(
+            f"No articles found for {source} between {start_date} and {end_date}. Last error: {last_exception}"
+        )
+
+    async def stream(
+        self,
+        source: str,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        since: Optional[Dict[str, datetime]] = None
+    ) -> AsyncIterator[List[ArticleCreate]]:
+        """
+        Stream pages of articles from the first collector that yields any.
+
+        A collector failing before its first page falls back to the next one.
+        A failure after pages were yielded is raised, since those pages are
+        already downstream. With ``since`` a collector without new articles
+        ends the stream without falling back.
+        """
+        start_date, end_date = self._default_window(start_date, end_date)
+
+        collectors = self._ranked_collectors()
+        if not collectors:
+            raise ArticleCollectionError(
+                f"All collectors are unavailable (circuit open) for {source}"
+            )
+
+        last_exception = None
+        for collector in collectors:
+            name = collector.__class__.__name__
+            collector_start = self._apply_watermark(name, start_date, since)
+            if to_naive_utc(collector_start) >= to_naive_utc(end_date):
+                logger.debug(f"{name} is up to date for {source}, nothing to fetch")
+                if since:
+                    return
+                continue
+            health = self.health[name]
+            started = time.monotonic()
+            # Time to first page, so slow consumers do not count as collector latency
+            latency = None
+            try:
+                async for page in collector.iter_articles(
+                    source=source,
+                    start_date=collector_start,
+                    end_date=end_date
+                ):
+                    if latency is None:
+                        latency = time.monotonic() - started
+                    self._record_published(name, source, page)
+                    yield page
+            except ArticleCollectionError as e:
+                health.record_failure(latency if latency is not None else time.monotonic() - started)
+                if latency is not None:
+                    raise
+                logger.warning(f"{name} failed: {e}")
+                last_exception = e
+                continue
+
+            health.record_success(latency if latency is not None else time.monotonic() - started)
+            if latency is not None:
+                logger.info(f"Successfully streamed articles from {name}")
+                return
+            if since:
+                logger.info(f"No new articles for {source} from {name}")
+                return
+
+        raise ArticleCollectionError(
+            f"No articles found for {source} between {start_date} and {end_date}. Last error: {last_exception}"
+        )
+
+    async def get_many(
+        self,
+        sources: List[str],
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        max_concurrency: Optional[int] = None
+    ) -> MultiSourceResult:
+        """
+        Collect articles for several sources concurrently.
+
+        Args:
+            sources: Domain names of the news sources
+            start_date: Start date for article search
+            end_date: End date for article search
+            max_concurrency: Maximum number of sources fetched at once
+                (defaults to ``settings.collector_max_concurrency``)
+
+        Returns:
+            MultiSourceResult with articles and errors keyed by source
+        """
+        start_date, end_date = self._default_window(start_date, end_date)
+
+        semaphore = asyncio.Semaphore(max_concurrency or settings.collector_max_concurrency)
+        result = MultiSourceResult()
+
+        async def collect(source: str) -> None:
+            async with semaphore:
+                try:
+                    result.articles[source] = await self.get(
+                        source=source,
+                        start_date=start_date,
+                        end_date=end_date
+                    )
+                except Exception as e:
+                    logger.warning(f"Collection failed for {source}: {e}")
+                    result.errors[source] = str(e)
+
+        # dict.fromkeys drops duplicate sources while keeping their order
+        await asyncio.gather(*(collect(source) for source in dict.fromkeys(sources)))
+
+        logger.info(
+            f"Collected articles for {len(result.articles)} of {len(result.articles) + len(result.errors)} sources"
+        )
+        return result
@@ -0,0 +1,227 @@
+import asyncio
+import sqlite3
+import threading
+import time
+from html.parser import HTMLParser
+from pathlib import Path
+from typing import Dict, List, Optional
+from loguru import logger
+
+from src.models.article import ArticleCreate
+from src.utils.config import get_settings
+from src.utils.http import PooledHTTPClient, get_http_client
+from src.utils.urls import canonicalize_url
+
+settings = get_settings()
+
+# Elements whose text is never part of the article body
+SKIPPED_TAGS = {"script", "style", "noscript", "nav", "header", "footer", "aside", "form", "figure", "template"}
+
+class _MainTextParser(HTMLParser):
+    """Collect paragraph text, separately for paragraphs inside ``<article>``."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.skip_depth = 0
+        self.article_depth = 0
+        self.paragraph: Optional[List[str]] = None
+        self.in_article = False
+        self.paragraphs: List[str] = []
+        self.article_paragraphs: List[str] = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag in SKIPPED_TAGS:
+            self.skip_depth += 1
+        elif tag == "article":
+            self.article_depth += 1
+        elif tag == "p" and not self.skip_depth:
+            self._close_paragraph()
+            self.paragraph = []
+            self.in_article = self.article_depth > 0
+        elif tag == "br" and self.paragraph is not None:
+            self.paragraph.append(" ")
+
+    def handle_endtag(self, tag):
+        if tag in SKIPPED_TAGS and self.skip_depth:
+            self.skip_depth -= 1
+        elif tag == "article" and self.article_depth:
+            self.article_depth -= 1
+        elif tag == "p":
+            self._close_paragraph()
+
+    def handle_data(self, data):
+        if self.paragraph is not None and not self.skip_depth:
+            self.paragraph.append(data)
+
+    def _close_paragraph(self):
+        if self.paragraph is None:
+            return
+        text = " ".join("".join(self.paragraph).split())
+        # Very short paragraphs are usually bylines, captions or buttons
+        if len(text) >= 40:
+            self.paragraphs.append(text)
+            if self.in_article:
+                self.article_paragraphs.append(text)
+        self.paragraph = None
+
+def extract_main_text(html: str) -> str:
+    """
+    Extract the main text of an article page.
+
+    Prefers the paragraphs inside ``<article>`` and falls back to all
+    paragraphs outside navigation, headers, footers and scripts.
+    """
+    parser = _MainTextParser()
+    parser.feed(html)
+    parser.close()
+    parser._close_paragraph()
+    return "\n\n".join(parser.article_paragraphs or parser.paragraphs)
+
+class ContentCache:
+    """Persistent extracted article text keyed by canonical URL, with HTTP validators."""
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path or settings.enrichment_cache_path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS article_content (
+                url TEXT PRIMARY KEY,
+                etag TEXT,
+                last_modified TEXT,
+                content TEXT NOT NULL,
+                checked_at REAL NOT NULL
+            )
+            """
+        )
+
+    def get(self, url: str) -> Optional[Dict[str, object]]:
+        """Return the cached entry of a canonical URL."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT etag, last_modified, content, checked_at FROM article_content WHERE url = ?", (url,)
+            ).fetchone()
+        if row is None:
+            return None
+        return {"etag": row[0], "last_modified": row[1], "content": row[2], "checked_at": row[3]}
+
+    def put(self, url: str, etag: Optional[str], last_modified: Optional[str], content: str) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO article_content (url, etag, last_modified, content, checked_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (url, etag, last_modified, content, time.time())
+            )
+            self._conn.commit()
+
+    def touch(self, url: str) -> None:
+        """Mark a cached entry as revalidated now."""
+        with self._lock:
+            self._conn.execute("UPDATE article_content SET checked_at = ? WHERE url = ?", (time.time(), url))
+            self._conn.commit()
+
+class ContentFetcher:
+    """Fetch article pages and replace truncated provider content with the page's main text."""
+
+    def __init__(
+        self,
+        client: Optional[PooledHTTPClient] = None,
+        cache: Optional[ContentCache] = None,
+        concurrency: Optional[int] = None
+    ):
+        """
+        Initialize the fetcher.
+
+        Args:
+            client: HTTP client to use (defaults to the shared pooled client,
+                whose per-host limit also bounds page fetches)
+            cache: Extracted content cache
+            concurrency: Page fetches in flight across all hosts
+        """
+        self.client = client
+        self.cache = cache or ContentCache()
+        self.concurrency = concurrency or settings.enrichment_concurrency
+
+    def needs_content(self, article: ArticleCreate) -> bool:
+        """Whether the article's content looks truncated."""
+        return len(article.content) < settings.enrichment_min_length
+
+    async def fetch(self, url: str) -> Optional[str]:
+        """
+        Return the main text of a page, revalidating a cached copy when it is stale.
+
+        Args:
+            url: Article URL
+
+        Returns:
+            Extracted text, or None if the page could not be fetched
+        """
+        key = canonicalize_url(url)
+        cached = self.cache.get(key)
+        if cached and time.time() - cached["checked_at"] < settings.enrichment_cache_ttl:
+            return cached["content"]
+
+        headers = {}
+        if cached and cached["etag"]:
+            headers["If-None-Match"] = cached["etag"]
+        if cached and cached["last_modified"]:
+            headers["If-Modified-Since"] = cached["last_modified"]
+
+        client = self.client or get_http_client()
+        try:
+            async with client.stream("GET", url, headers=headers) as response:
+                if response.status_code == 304 and cached:
+                    self.cache.touch(key)
+                    return cached["content"]
+                response.raise_for_status()
+                if "html" not in response.headers.get("content-type", "html"):
+                    return None
+                body = bytearray()
+                async for chunk in response.aiter_bytes():
+                    body.extend(chunk)
+                    if len(body) > settings.enrichment_max_bytes:
+                        break
+                html = body.decode(response.encoding or "utf-8", errors="replace")
+                content = extract_main_text(html)
+                self.cache.put(key, response.headers.get("etag"), response.headers.get("last-modified"), content)
+                return content
+        except Exception as e:
+            logger.debug(f"Failed to fetch article page {url}: {e}")
+            return cached["content"] if cached else None
+
+    async def enrich(self, articles: List[ArticleCreate]) -> List[ArticleCreate]:
+        """
+        Replace truncated content with the full text of each article's page.
+
+        Articles keep their provider content when the page cannot be
+        fetched or yields less text.
+
+        Args:
+            articles: Articles to enrich in place
+
+        Returns:
+            The same articles
+        """
+        pending = [article for article in articles if self.needs_content(article)]
+        if not pending:
+            return articles
+
+        slots = asyncio.Semaphore(self.concurrency)
+
+        async def enrich_one(article: ArticleCreate) -> bool:
+            async with slots:
+                content = await self.fetch(str(article.url))
+            if content and len(content) > len(article.content):
+                article.content = content
+                return True
+            return False
+
+        started = time.monotonic()
+        enriched = await asyncio.gather(*(enrich_one(article) for article in pending))
+        logger.info(
+            f"Enriched {sum(enriched)} of {len(pending)} truncated articles "
+            f"in {time.monotonic() - started:.1f}s"
+        )
+        return articles
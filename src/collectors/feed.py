@@ -0,0 +1,318 @@
+import asyncio
+import json
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from email.utils import parsedate_to_datetime
+from html.parser import HTMLParser
+from pathlib import Path
+from typing import Dict, List, Optional
+from urllib.parse import urljoin
+from xml.etree.ElementTree import Element, XMLPullParser
+from pydantic import HttpUrl
+from tenacity import retry, stop_after_attempt, wait_exponential
+from loguru import logger
+
+from src.collectors.base import ArticleCollectorInterface
+from src.models.article import ArticleCreate
+from src.utils.config import get_settings
+from src.utils.dates import to_naive_utc
+from src.utils.exceptions import ArticleCollectionError
+from src.utils.http import get_http_client
+
+settings = get_settings()
+
+FEED_TYPES = {"application/rss+xml", "application/atom+xml", "application/feed+xml"}
+COMMON_FEED_PATHS = ["/feed", "/rss", "/rss.xml", "/feed.xml", "/atom.xml", "/index.xml", "/feeds/all.rss"]
+
+class _FeedLinkParser(HTMLParser):
+    """Collect ``<link rel="alternate">`` feed URLs from an HTML page."""
+
+    def __init__(self):
+        super().__init__()
+        self.feeds: List[str] = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag != "link":
+            return
+        attributes = dict(attrs)
+        rel = (attributes.get("rel") or "").lower().split()
+        if "alternate" in rel and attributes.get("type", "").lower() in FEED_TYPES and attributes.get("href"):
+            self.feeds.append(attributes["href"])
+
+def _local_name(tag: str) -> str:
+    """Strip the XML namespace from a tag name."""
+    return tag.rsplit("}", 1)[-1]
+
+def _parse_date(value: str) -> Optional[datetime]:
+    """Parse RFC 822 (RSS) or ISO 8601 (Atom) dates."""
+    value = value.strip()
+    try:
+        return parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        pass
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+
+def _parse_entry(element: Element) -> Optional[Dict[str, str]]:
+    """Extract title, link, date and summary from an RSS item or Atom entry."""
+    entry: Dict[str, str] = {}
+    for child in element:
+        name = _local_name(child.tag)
+        text = (child.text or "").strip()
+        if name == "title":
+            entry["title"] = text
+        elif name == "link":
+            # RSS puts the URL in the text, Atom in href (prefer rel="alternate")
+            href = child.get("href")
+            if href and child.get("rel", "alternate") == "alternate":
+                entry["link"] = href
+            elif text and "link" not in entry:
+                entry["link"] = text
+        elif name in ("pubDate", "published", "updated", "date") and text:
+            entry.setdefault("published", text)
+        elif name in ("description", "summary", "content", "encoded") and text:
+            entry.setdefault("summary", text)
+    if not entry.get("title") or not entry.get("link") or not entry.get("published"):
+        return None
+    return entry
+
+class FeedStateStore:
+    """Persistent per-domain feed URLs and per-feed conditional GET state."""
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path or settings.feed_cache_path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS feed_discovery (
+                domain TEXT PRIMARY KEY,
+                feeds TEXT NOT NULL,
+                discovered_at REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS feed_state (
+                url TEXT PRIMARY KEY,
+                etag TEXT,
+                last_modified TEXT,
+                entries TEXT NOT NULL
+            );
+            """
+        )
+
+    def get_feeds(self, domain: str) -> Optional[List[str]]:
+        """Return discovered feed URLs for a domain, or None if unknown or stale."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT feeds, discovered_at FROM feed_discovery WHERE domain = ?", (domain,)
+            ).fetchone()
+        if row is None or time.time() - row[1] > settings.feed_discovery_ttl:
+            return None
+        return json.loads(row[0])
+
+    def set_feeds(self, domain: str, feeds: List[str]) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO feed_discovery (domain, feeds, discovered_at) VALUES (?, ?, ?)",
+                (domain, json.dumps(feeds), time.time())
+            )
+            self._conn.commit()
+
+    def get_state(self, url: str) -> Optional[Dict[str, object]]:
+        """Return the validators and last parsed entries of a feed."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT etag, last_modified, entries FROM feed_state WHERE url = ?", (url,)
+            ).fetchone()
+        if row is None:
+            return None
+        return {"etag": row[0], "last_modified": row[1], "entries": json.loads(row[2])}
+
+    def set_state(
+        self,
+        url: str,
+        etag: Optional[str],
+        last_modified: Optional[str],
+        entries: List[Dict[str, str]]
+    ) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO feed_state (url, etag, last_modified, entries) VALUES (?, ?, ?, ?)",
+                (url, etag, last_modified, json.dumps(entries))
+            )
+            self._conn.commit()
+
+class FeedCollector(ArticleCollectorInterface):
+    """RSS/Atom implementation of article collector with conditional GET."""
+
+    def __init__(self, store: Optional[FeedStateStore] = None):
+        """Initialize the persistent feed state store."""
+        self.store = store or FeedStateStore()
+
+    async def _discover_feeds(self, source: str) -> List[str]:
+        """Find the feed URLs of a domain, caching the result per domain."""
+        feeds = self.store.get_feeds(source)
+        if feeds is not None:
+            return feeds
+
+        client = get_http_client()
+        homepage = f"https://{source}/"
+        feeds = []
+        reachable = False
+        try:
+            response = await client.get(homepage)
+            reachable = True
+            parser = _FeedLinkParser()
+            parser.feed(response.text)
+            feeds = [urljoin(str(response.url), href) for href in parser.feeds]
+        except Exception as e:
+            logger.warning(f"Feed discovery on {homepage} failed: {e}")
+
+        if not feeds:
+            for path in COMMON_FEED_PATHS:
+                url = urljoin(homepage, path)
+                try:
+                    response = await client.get(url)
+                except Exception:
+                    continue
+                reachable = True
+                content_type = response.headers.get("content-type", "")
+                if response.status_code == 200 and "xml" in content_type:
+                    feeds = [str(response.url)]
+                    break
+
+        # dict.fromkeys keeps order while dropping duplicates
+        feeds = list(dict.fromkeys(feeds))
+        # Network failures are not cached, so the domain is probed again next time
+        if reachable:
+            self.store.set_feeds(source, feeds)
+        logger.info(f"Discovered {len(feeds)} feeds for {source}")
+        return feeds
+
+    async def _fetch_feed(self, url: str) -> List[Dict[str, str]]:
+        """Fetch a feed with a conditional GET, parsing it incrementally on change."""
+        state = self.store.get_state(url)
+        headers = {}
+        if state and state["etag"]:
+            headers["If-None-Match"] = state["etag"]
+        if state and state["last_modified"]:
+            headers["If-Modified-Since"] = state["last_modified"]
+
+        async with get_http_client().stream("GET", url, headers=headers) as response:
+            if response.status_code == 304 and state:
+                logger.debug(f"Feed {url} not modified")
+                return state["entries"]
+            response.raise_for_status()
+
+            # Parse chunks as they arrive and drop each item once read
+            parser = XMLPullParser(events=("end",))
+            entries = []
+            async for chunk in response.aiter_bytes():
+                parser.feed(chunk)
+                for _, element in parser.read_events():
+                    if _local_name(element.tag) in ("item", "entry"):
+                        entry = _parse_entry(element)
+                        if entry:
+                            entries.append(entry)
+                        element.clear()
+            parser.close()
+
+            self.store.set_state(
+                url,
+                response.headers.get("etag"),
+                response.headers.get("last-modified"),
+                entries
+            )
+        return entries
+
+    @retry(
+        stop=stop_after_attempt(settings.max_retries),
+        wait=wait_exponential(multiplier=settings.retry_delay),
+        reraise=True
+    )
+    async def _collect(
+        self,
+        source: str,
+        feeds: List[str],
+        start: Optional[datetime],
+        end: Optional[datetime]
+    ) -> List[ArticleCreate]:
+        """Fetch the feeds of a source and keep the entries inside the window."""
+        try:
+            results = await asyncio.gather(
+                *(self._fetch_feed(feed_url) for feed_url in feeds),
+                return_exceptions=True
+            )
+
+            articles = {}
+            for feed_url, entries in zip(feeds, results):
+                if isinstance(entries, Exception):
+                    logger.warning(f"Failed to fetch feed {feed_url}: {entries}")
+                    continue
+
+                for entry in entries:
+                    try:
+                        pub_date = _parse_date(entry["published"])
+                        if pub_date is None:
+                            continue
+
+                        # Filter by date range if specified
+                        published = to_naive_utc(pub_date)
+                        if start and published < start:
+                            continue
+                        if end and published > end:
+                            continue
+
+                        articles.setdefault(entry["link"], ArticleCreate(
+                            title=entry["title"],
+                            url=HttpUrl(entry["link"]),
+                            publication_date=published,
+                            source=source,
+                            content=entry.get("summary", ""),
+                        ))
+                    except Exception as e:
+                        logger.warning(f"Failed to process article: {e}")
+                        continue
+
+            logger.info(f"Successfully collected {len(articles)} articles from feeds")
+            return list(articles.values())
+
+        except Exception as e:
+            logger.error(f"Feed collection failed: {e}")
+            raise ArticleCollectionError("Failed to collect articles from feeds") from e
+
+    async def get_articles(
+        self,
+        source: str,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ) -> List[ArticleCreate]:
+        """
+        Get articles from the RSS/Atom feeds of a source.
+
+        Args:
+            source: Domain name of the news source
+            start_date: Start date for article search
+            end_date: End date for article search
+
+        Returns:
+            List of ArticleCreate objects
+
+        Raises:
+            ArticleCollectionError: If the source has no feed or article collection fails
+        """
+        # Discovery caches its answer, so a source without feeds is not worth retrying
+        feeds = await self._discover_feeds(source)
+        if not feeds:
+            raise ArticleCollectionError(f"No RSS feed found for {source}")
+
+        return await self._collect(
+            source,
+            feeds,
+            to_naive_utc(start_date) if start_date else None,
+            to_naive_utc(end_date) if end_date else None
+        )
@@ -0,0 +1,82 @@
+import time
+from typing import Dict, Optional, Tuple
+
+
+class CollectorHealth:
+    """Latency, error and circuit-breaker state for a single collector."""
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int,
+        cooldown: float,
+        smoothing: float = 0.3
+    ):
+        """
+        Initialize health tracking.
+
+        Args:
+            name: Collector name used in logs and statistics
+            failure_threshold: Consecutive failures that open the circuit
+            cooldown: Seconds an open circuit skips the collector
+            smoothing: Weight of the newest sample in the latency average
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.smoothing = smoothing
+        self.latency: Optional[float] = None
+        self.successes = 0
+        self.failures = 0
+        self.consecutive_failures = 0
+        self.opened_at: Optional[float] = None
+
+    @property
+    def error_rate(self) -> float:
+        """Share of failed calls so far."""
+        total = self.successes + self.failures
+        return self.failures / total if total else 0.0
+
+    @property
+    def is_open(self) -> bool:
+        """Whether the circuit is open and the collector must be skipped."""
+        if self.opened_at is None:
+            return False
+        # Once the cool-down has elapsed the circuit is half-open: the next
+        # call goes through and its outcome closes or re-opens the circuit.
+        return time.monotonic() - self.opened_at < self.cooldown
+
+    def rank(self) -> Tuple[float, float]:
+        """Sort key, healthiest collector first; unmeasured ones keep their position."""
+        return (self.error_rate, self.latency if self.latency is not None else float("inf"))
+
+    def _observe_latency(self, latency: float) -> None:
+        if self.latency is None:
+            self.latency = latency
+        else:
+            self.latency = self.smoothing * latency + (1 - self.smoothing) * self.latency
+
+    def record_success(self, latency: float) -> None:
+        """Record a successful call and close the circuit."""
+        self._observe_latency(latency)
+        self.successes += 1
+        self.consecutive_failures = 0
+        self.opened_at = None
+
+    def record_failure(self, latency: float) -> None:
+        """Record a failed call, opening the circuit past the threshold."""
+        self._observe_latency(latency)
+        self.failures += 1
+        self.consecutive_failures += 1
+        if self.consecutive_failures >= self.failure_threshold:
+            self.opened_at = time.monotonic()
+
+    def snapshot(self) -> Dict[str, object]:
+        """Return the current statistics as a plain dict."""
+        return {
+            "latency": self.latency,
+            "successes": self.successes,
+            "failures": self.failures,
+            "error_rate": self.error_rate,
+            "circuit_open": self.is_open,
+        }
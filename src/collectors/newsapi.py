@@ -1,27 +1,29 @@
-from datetime import datetime
-from typing import List, Optional
-from newsapi import NewsApiClient
-from pydantic import HttpUrl
-from tenacity import retry, stop_after_attempt, wait_exponential
+from datetime import datetime, timedelta
+from typing import Any, AsyncIterator, Dict, List, Optional
+from tenacity import retry, retry_if_not_exception_type, stop_after_attempt, wait_exponential
 from loguru import logger
 
 from src.collectors.base import ArticleCollectorInterface
+from src.collectors.normalize import NEWSAPI_FIELDS, normalize_records
 from src.models.article import ArticleCreate
 from src.utils.config import get_settings
-from src.utils.exceptions import ArticleCollectionError
+from src.utils.exceptions import ArticleCollectionError, QuotaExceededError
+from src.utils.http import get_http_client
+from src.utils.rate_limit import get_rate_scheduler
 
 settings = get_settings()
 
+NEWSAPI_EVERYTHING_URL = "https://newsapi.org/v2/everything"
+NEWSAPI_PAGE_SIZE = 100
+
 class NewsAPICollector(ArticleCollectorInterface):
     """NewsAPI implementation of article collector."""
     
     def __init__(self):
-        """Initialize NewsAPI client."""
-        try:
-            self.client = NewsApiClient(api_key=settings.news_api_key)
-        except Exception as e:
-            logger.error(f"Failed to initialize NewsAPI client: {e}")
-            raise ArticleCollectionError("NewsAPI initialization failed") from e
+        """Initialize NewsAPI credentials."""
+        if not settings.news_api_key:
+            raise ArticleCollectionError("NewsAPI initialization failed: missing API key")
+        self.headers = {"X-Api-Key": settings.news_api_key}
     
 
     
@@ -36,8 +38,87 @@ class NewsAPICollector(ArticleCollectorInterface):
     @retry(
         stop=stop_after_attempt(settings.max_retries),
         wait=wait_exponential(multiplier=settings.retry_delay),
+        retry=retry_if_not_exception_type(QuotaExceededError),
         reraise=True
     )
+    async def _fetch_page(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Fetch a single page of results over the shared connection pool."""
+        scheduler = get_rate_scheduler()
+        await scheduler.acquire("newsapi", params['domains'])
+        http_response = await get_http_client().get(
+            NEWSAPI_EVERYTHING_URL,
+            params=params,
+            headers=self.headers
+        )
+        if http_response.status_code == 429:
+            scheduler.penalize(
+                "newsapi",
+                float(http_response.headers.get("Retry-After", settings.rate_limit_pause))
+            )
+            raise ArticleCollectionError("NewsAPI rate limit reached")
+        return http_response.json()
+    
+    def _parse_articles(self, raw_articles: List[Dict[str, Any]], source: str) -> List[ArticleCreate]:
+        """Convert raw NewsAPI articles to ArticleCreate objects."""
+        return normalize_records(raw_articles, NEWSAPI_FIELDS, source)
+    
+    async def iter_articles(
+        self,
+        source: str,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ) -> AsyncIterator[List[ArticleCreate]]:
+        """
+        Stream articles from NewsAPI page by page.
+        
+        Follows pagination until ``totalResults`` is reached or a page
+        comes back empty, so only one page is held in memory at a time.
+        
+        Raises:
+            ArticleCollectionError: If article collection fails
+        """
+        try:
+            # Format dates for NewsAPI (must be YYYY-MM-DD or YYYY-MM-DDTHH:MM:SS)
+            params = {
+                'domains': source,
+                'language': 'en',
+                'sortBy': 'publishedAt',
+                'pageSize': NEWSAPI_PAGE_SIZE,
+            }
+            if start_date:
+                params['from'] = start_date.strftime('%Y-%m-%dT%H:%M:%S')
+            if end_date:
+                params['to'] = end_date.strftime('%Y-%m-%dT%H:%M:%S')
+            
+            page = 1
+            received = 0
+            while True:
+                response = await self._fetch_page({**params, 'page': page})
+                
+                if response['status'] != 'ok':
+                    # Plans with a result cap refuse pages past it; keep what we have
+                    if page > 1 and response.get('code') == 'maximumResultsReached':
+                        logger.warning(f"NewsAPI result cap reached for {source} after {received} articles")
+                        break
+                    raise ArticleCollectionError(
+                        f"NewsAPI error: {response.get('message', 'Unknown error')}"
+                    )
+                
+                raw_articles = response['articles']
+                received += len(raw_articles)
+                articles = self._parse_articles(raw_articles, source)
+                logger.debug(f"NewsAPI page {page} for {source}: {len(articles)} articles")
+                if articles:
+                    yield articles
+                
+                if not raw_articles or received >= response.get('totalResults', 0):
+                    break
+                page += 1
+            
+        except Exception as e:
+            logger.error(f"NewsAPI collection failed: {e}")
+            raise ArticleCollectionError("Failed to collect articles from NewsAPI") from e
+    
     async def get_articles(
         self,
         source: str,
@@ -58,47 +139,9 @@ class NewsAPICollector(ArticleCollectorInterface):
         Raises:
             ArticleCollectionError: If article collection fails
         """
-        try:
-            # Format dates for NewsAPI (must be YYYY-MM-DD or YYYY-MM-DDTHH:MM:SS)
-            from_param = start_date.strftime('%Y-%m-%dT%H:%M:%S') if start_date else None
-            to_param = end_date.strftime('%Y-%m-%dT%H:%M:%S') if end_date else None
-            
-            # Get articles from NewsAPI
-            response = self.client.get_everything(
-                domains=source,
-                from_param=from_param,
-                to=to_param,
-                language='en',
-                sort_by='publishedAt'
-            )
-            
-            if response['status'] != 'ok':
-                raise ArticleCollectionError(
-                    f"NewsAPI error: {response.get('message', 'Unknown error')}"
-                )
-            
-            # Convert response to ArticleCreate objects
-            articles = []
-            for article in response['articles']:
-                try:
-                    articles.append(
-                        ArticleCreate(
-                            title=article['title'],
-                            url=HttpUrl(article['url']),
-                            publication_date=datetime.fromisoformat(
-                                article['publishedAt'].replace('Z', '+00:00')
-                            ),
-                            source=source,
-                            content=article.get('content', article.get('description', '')),
-                        )
-                    )
-                except Exception as e:
-                    logger.warning(f"Failed to process article: {e}")
-                    continue
-            
-            logger.info(f"Successfully collected {len(articles)} articles from NewsAPI")
-            return articles
-            
-        except Exception as e:
-            logger.error(f"NewsAPI collection failed: {e}")
-            raise ArticleCollectionError("Failed to collect articles from NewsAPI") from e
+        articles = []
+        async for page in self.iter_articles(source, start_date, end_date):
+            articles.extend(page)
+        
+        logger.info(f"Successfully collected {len(articles)} articles from NewsAPI")
+        return articles
@@ -1,72 +1,98 @@
 from datetime import datetime
-from typing import List, Optional
-from newsdataapi import NewsDataApiClient
-from pydantic import HttpUrl
-from tenacity import retry, stop_after_attempt, wait_exponential
+from typing import Any, AsyncIterator, Dict, List, Optional
+from tenacity import retry, retry_if_not_exception_type, stop_after_attempt, wait_exponential
 from loguru import logger
 
 from src.collectors.base import ArticleCollectorInterface
+from src.collectors.normalize import NEWSDATA_FIELDS, normalize_records
 from src.models.article import ArticleCreate
 from src.utils.config import get_settings
-from src.utils.exceptions import ArticleCollectionError
+from src.utils.exceptions import ArticleCollectionError, QuotaExceededError
+from src.utils.http import get_http_client
+from src.utils.rate_limit import get_rate_scheduler
 
 settings = get_settings()
 
+NEWSDATA_ARCHIVE_URL = "https://newsdata.io/api/1/archive"
+
 class NewsDataAPICollector(ArticleCollectorInterface):
     """NewsDataAPI implementation of article collector."""
     def __init__(self):
-        try:
-            self.client = NewsDataApiClient(apikey=settings.news_api_key)
-        except Exception as e:
-            logger.error(f"Failed to initialize NewsDataApiClient: {e}")
-            raise ArticleCollectionError("NewsDataAPI initialization failed") from e
+        if not settings.news_data_api_key:
+            raise ArticleCollectionError("NewsDataAPI initialization failed: missing API key")
+        self.api_key = settings.news_data_api_key
 
     @retry(
         stop=stop_after_attempt(settings.max_retries),
         wait=wait_exponential(multiplier=settings.retry_delay),
+        retry=retry_if_not_exception_type(QuotaExceededError),
         reraise=True
     )
-    async def get_articles(
+    async def _fetch_page(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Fetch a single page of results over the shared connection pool."""
+        scheduler = get_rate_scheduler()
+        await scheduler.acquire("newsdata", params['domainurl'])
+        http_response = await get_http_client().get(NEWSDATA_ARCHIVE_URL, params=params)
+        if http_response.status_code == 429:
+            scheduler.penalize(
+                "newsdata",
+                float(http_response.headers.get("Retry-After", settings.rate_limit_pause))
+            )
+            raise ArticleCollectionError("NewsDataAPI rate limit reached")
+        return http_response.json()
+
+    def _parse_articles(self, raw_articles: List[Dict[str, Any]], source: str) -> List[ArticleCreate]:
+        """Convert raw NewsDataAPI results to ArticleCreate objects."""
+        return normalize_records(raw_articles, NEWSDATA_FIELDS, source)
+
+    async def iter_articles(
         self,
         source: str,
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None
-    ) -> List[ArticleCreate]:
+    ) -> AsyncIterator[List[ArticleCreate]]:
+        """Stream articles from NewsDataAPI, following ``nextPage`` tokens."""
         try:
             # Format dates for NewsDataAPI
-            from_param = start_date.strftime('%Y-%m-%d') if start_date else None
-            to_param = end_date.strftime('%Y-%m-%d') if end_date else None
-
-            # Get articles from NewsDataAPI
-            response = self.client.news_api(
-                domain=source,
-                from_param=from_param,
-                to_param=to_param,
-                language='en',
-            )
+            params = {
+                'apikey': self.api_key,
+                'domainurl': source,
+                'language': 'en',
+            }
+            if start_date:
+                params['from_date'] = start_date.strftime('%Y-%m-%d')
+            if end_date:
+                params['to_date'] = end_date.strftime('%Y-%m-%d')
 
-            if response['status'] != 'success':
-                raise ArticleCollectionError(
-                    f"NewsDataAPI error: {response.get('message', 'Unknown error')}"
-                )
+            while True:
+                response = await self._fetch_page(params)
 
-            articles = []
-            for article in response['results']:
-                try:
-                    articles.append(
-                        ArticleCreate(
-                            title=article['title'],
-                            url=HttpUrl(article['link']),
-                            publication_date=datetime.fromisoformat(article['pubDate'].replace('Z', '+00:00')),
-                            source=source,
-                            content=article.get('description', ''),
-                        )
+                if response['status'] != 'success':
+                    raise ArticleCollectionError(
+                        f"NewsDataAPI error: {response.get('message', 'Unknown error')}"
                     )
-                except Exception as e:
-                    logger.warning(f"Failed to process article: {e}")
-                    continue
-            logger.info(f"Successfully collected {len(articles)} articles from NewsDataAPI")
-            return articles
+
+                raw_articles = response.get('results') or []
+                articles = self._parse_articles(raw_articles, source)
+                if articles:
+                    yield articles
+
+                next_page = response.get('nextPage')
+                if not raw_articles or not next_page:
+                    break
+                params = {**params, 'page': next_page}
         except Exception as e:
             logger.error(f"NewsDataAPI collection failed: {e}")
             raise ArticleCollectionError("Failed to collect articles from NewsDataAPI") from e
+
+    async def get_articles(
+        self,
+        source: str,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ) -> List[ArticleCreate]:
+        articles = []
+        async for page in self.iter_articles(source, start_date, end_date):
+            articles.extend(page)
+        logger.info(f"Successfully collected {len(articles)} articles from NewsDataAPI")
+        return articles
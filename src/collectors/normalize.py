@@ -0,0 +1,88 @@
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
+from pydantic import HttpUrl, TypeAdapter, ValidationError
+from loguru import logger
+
+from src.models.article import ArticleCreate
+
+class FieldMap(NamedTuple):
+    """Names of the provider fields that map onto an article."""
+    title: str
+    url: str
+    published: str
+    content: str
+    content_fallback: Optional[str] = None
+
+NEWSAPI_FIELDS = FieldMap("title", "url", "publishedAt", "content", "description")
+NEWSDATA_FIELDS = FieldMap("title", "link", "pubDate", "description")
+
+# Compact intermediate row: (title, url, publication_date, content)
+RawRow = Tuple[Any, Any, Any, Any]
+
+# Validates a whole page of rows in a single pydantic-core call
+_ROWS = TypeAdapter(List[Tuple[str, HttpUrl, datetime, str]])
+
+def _extract(records: Iterable[Dict[str, Any]], fields: FieldMap) -> List[RawRow]:
+    """Pull the mapped fields out of raw provider records as tuples."""
+    title, url, published, content, fallback = fields
+    if fallback:
+        rows = [
+            (r.get(title), r.get(url), r.get(published), r.get(content) or r.get(fallback) or "")
+            for r in records
+        ]
+    else:
+        rows = [(r.get(title), r.get(url), r.get(published), r.get(content) or "") for r in records]
+    # Cheap screen for the usual bad records (missing fields, relative or non-http
+    # links) so the batch validation below rarely has to run twice
+    screened = [
+        row for row in rows
+        if row[0] and row[2] and isinstance(row[1], str) and row[1].startswith(("http://", "https://"))
+    ]
+    if len(screened) < len(rows):
+        logger.warning(f"Dropping {len(rows) - len(screened)} of {len(rows)} incomplete articles")
+    return screened
+
+def _validate(rows: List[RawRow]) -> List[Tuple[str, HttpUrl, datetime, str]]:
+    """Validate rows in batch, dropping the invalid ones."""
+    try:
+        return _ROWS.validate_python(rows)
+    except ValidationError as e:
+        invalid = {error["loc"][0] for error in e.errors()}
+        logger.warning(f"Dropping {len(invalid)} of {len(rows)} invalid articles")
+        return _ROWS.validate_python([row for i, row in enumerate(rows) if i not in invalid])
+
+def _build(
+    title: str,
+    url: HttpUrl,
+    publication_date: datetime,
+    content: str,
+    source: str
+) -> ArticleCreate:
+    """Create an ArticleCreate from already validated values without revalidating."""
+    return ArticleCreate.model_construct(
+        title=title,
+        url=url,
+        publication_date=publication_date,
+        source=source,
+        content=content,
+        topic=None,
+    )
+
+def normalize_records(
+    records: Iterable[Dict[str, Any]],
+    fields: FieldMap,
+    source: str
+) -> List[ArticleCreate]:
+    """
+    Convert raw provider records to ArticleCreate objects in one batch.
+
+    Args:
+        records: Raw article dicts as returned by the provider
+        fields: Field names of this provider
+        source: Domain name of the news source
+
+    Returns:
+        List of ArticleCreate objects; invalid records are skipped
+    """
+    rows = _validate(_extract(records, fields))
+    return [_build(title, url, published, content, source) for title, url, published, content in rows]
@@ -0,0 +1,41 @@
+from datetime import datetime, timedelta
+from typing import Iterable, List, Tuple
+
+from src.models.article import ArticleCreate
+
+def shard_window(
+    start_date: datetime,
+    end_date: datetime,
+    step: timedelta
+) -> List[Tuple[datetime, datetime]]:
+    """
+    Split ``[start_date, end_date]`` into consecutive sub-windows.
+
+    Args:
+        start_date: Start of the window
+        end_date: End of the window
+        step: Length of each sub-window; the last one may be shorter
+
+    Returns:
+        List of ``(start, end)`` tuples covering the whole window
+    """
+    shards = []
+    shard_start = start_date
+    while shard_start < end_date:
+        shard_end = min(shard_start + step, end_date)
+        shards.append((shard_start, shard_end))
+        shard_start = shard_end
+    return shards or [(start_date, end_date)]
+
+def split_in_half(start_date: datetime, end_date: datetime) -> List[Tuple[datetime, datetime]]:
+    """Split a window into two equal halves."""
+    middle = start_date + (end_date - start_date) / 2
+    return [(start_date, middle), (middle, end_date)]
+
+def merge_unique(batches: Iterable[List[ArticleCreate]]) -> List[ArticleCreate]:
+    """Merge article batches, keeping the first article seen for each URL."""
+    merged = {}
+    for batch in batches:
+        for article in batch:
+            merged.setdefault(str(article.url), article)
+    return list(merged.values())
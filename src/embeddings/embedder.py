@@ -0,0 +1,78 @@
+import hashlib
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from typing import List
+import numpy as np
+import openai
+
+from src.filters.lexical import tokenize
+from src.models.article import ArticleBase
+from src.utils.config import get_settings
+
+settings = get_settings()
+
+def article_text(article: ArticleBase) -> str:
+    """Text of an article that gets embedded."""
+    return f"{article.title}\n{article.content[:1000]}"
+
+class EmbedderInterface(ABC):
+    """Base interface for text embedders."""
+    
+    #: Identifies the vectors in storage; vectors of different names are never compared
+    name: str
+    
+    @abstractmethod
+    async def embed(self, texts: List[str]) -> np.ndarray:
+        """Return a float32 matrix with one L2-normalised row per text."""
+        pass
+
+@lru_cache(maxsize=200_000)
+def _bucket(token: str, dim: int) -> int:
+    """Signed bucket of a token; the sign is encoded as the sign of the result."""
+    digest = int.from_bytes(hashlib.blake2b(token.encode(), digest_size=8).digest(), "little")
+    index = digest % dim + 1
+    return index if digest >> 63 else -index
+
+class HashingEmbedder(EmbedderInterface):
+    """Deterministic local embedder using signed feature hashing of words and bigrams."""
+    
+    def __init__(self, dim: int = 256):
+        self.dim = dim
+        self.name = f"hashing-{dim}"
+    
+    async def embed(self, texts: List[str]) -> np.ndarray:
+        matrix = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            tokens = tokenize(text)
+            features = tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+            buckets = np.fromiter((_bucket(feature, self.dim) for feature in features), dtype=np.int64)
+            np.add.at(matrix[row], np.abs(buckets) - 1, np.sign(buckets).astype(np.float32))
+        # Dampen repeated terms, then normalise so dot products are cosines
+        matrix = np.sign(matrix) * np.log1p(np.abs(matrix))
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        return matrix / np.where(norms > 0, norms, 1.0)
+
+class OpenAIEmbedder(EmbedderInterface):
+    """Embedder backed by the OpenAI embeddings API."""
+    
+    def __init__(self, model: str):
+        self.openai_client = openai.AsyncOpenAI(api_key=settings.openai_api_key)
+        self.model = model
+        self.name = f"openai-{model}"
+    
+    async def embed(self, texts: List[str]) -> np.ndarray:
+        rows = []
+        # The API caps the number of inputs per request
+        for i in range(0, len(texts), 512):
+            response = await self.openai_client.embeddings.create(model=self.model, input=texts[i:i + 512])
+            rows.extend(item.embedding for item in response.data)
+        if not rows:
+            return np.zeros((0, 0), dtype=np.float32)
+        matrix = np.array(rows, dtype=np.float32)
+        return matrix / np.linalg.norm(matrix, axis=1, keepdims=True)
+
+def get_embedder() -> EmbedderInterface:
+    """Create the embedder selected by ``settings.embedding_provider``."""
+    if settings.embedding_provider == "openai":
+        return OpenAIEmbedder(settings.embedding_model)
+    return HashingEmbedder(settings.embedding_dim)
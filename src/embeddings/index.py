@@ -0,0 +1,149 @@
+from typing import List, Optional, Sequence, Tuple
+import numpy as np
+from loguru import logger
+from sqlmodel import Session, col, select
+
+from src.embeddings.embedder import EmbedderInterface, article_text, get_embedder
+from src.models.article import Article
+from src.models.body import load_bodies, with_body
+from src.models.database import run_in_session
+from src.models.embedding import ArticleEmbedding
+
+class EmbeddingIndex:
+    """
+    In-memory cosine similarity index over the embeddings of saved articles.
+    
+    Vectors are persisted as float32 blobs in ``ArticleEmbedding`` and kept
+    in memory as one contiguous, normalised matrix, so a search is a single
+    matrix-vector product followed by a partial sort. The matrix is the
+    filled prefix of a buffer whose capacity doubles when full, so adding
+    articles copies each vector a constant number of times on average.
+    """
+    
+    def __init__(self, embedder: Optional[EmbedderInterface] = None):
+        self.embedder = embedder or get_embedder()
+        self._ids = np.zeros(0, dtype=np.int64)
+        self._vectors: Optional[np.ndarray] = None
+        self.size = 0
+        self.loaded = False
+    
+    @property
+    def ids(self) -> np.ndarray:
+        """Article id of each matrix row."""
+        return self._ids[:self.size]
+    
+    @property
+    def matrix(self) -> Optional[np.ndarray]:
+        """Normalised vectors of the indexed articles, one row per article."""
+        return None if self._vectors is None else self._vectors[:self.size]
+    
+    def _reset(self) -> None:
+        self._ids = np.zeros(0, dtype=np.int64)
+        self._vectors = None
+        self.size = 0
+    
+    def _append(self, ids: Sequence[int], vectors: np.ndarray) -> None:
+        if not len(ids):
+            return
+        end = self.size + len(ids)
+        if self._vectors is None or end > len(self._vectors):
+            capacity = max(end, 2 * len(self._ids), 1024)
+            grown = np.empty((capacity, vectors.shape[1]), dtype=np.float32)
+            grown_ids = np.empty(capacity, dtype=np.int64)
+            if self._vectors is not None:
+                grown[:self.size] = self._vectors[:self.size]
+                grown_ids[:self.size] = self._ids[:self.size]
+            self._vectors, self._ids = grown, grown_ids
+        self._vectors[self.size:end] = vectors
+        self._ids[self.size:end] = ids
+        self.size = end
+    
+    async def load(self, chunk_size: int = 10_000) -> None:
+        """Load stored vectors and embed saved articles that have none yet."""
+        rows = await run_in_session(lambda session: session.exec(
+            select(ArticleEmbedding.article_id, ArticleEmbedding.vector)
+            .where(ArticleEmbedding.model == self.embedder.name)
+            .order_by(ArticleEmbedding.article_id)
+        ).all())
+        self._reset()
+        if rows:
+            ids, blobs = zip(*rows)
+            self._append(ids, np.frombuffer(b"".join(blobs), dtype=np.float32).reshape(len(rows), -1))
+        self.loaded = True
+        
+        embedded = select(ArticleEmbedding.article_id).where(ArticleEmbedding.model == self.embedder.name)
+        while True:
+            missing = await run_in_session(lambda session: session.exec(
+                select(Article).where(col(Article.id).not_in(embedded)).limit(chunk_size).options(with_body())
+            ).all())
+            if not missing:
+                break
+            await self.add(missing)
+        logger.info(f"Loaded {len(self.ids)} article embeddings ({self.embedder.name})")
+    
+    async def add(self, articles: Sequence[Article]) -> None:
+        """Embed and store saved articles that are not indexed yet, loading their bodies if needed."""
+        if not articles:
+            return
+        
+        def unindexed(session: Session) -> List[Article]:
+            known = set(session.exec(
+                select(ArticleEmbedding.article_id).where(
+                    ArticleEmbedding.model == self.embedder.name,
+                    col(ArticleEmbedding.article_id).in_([article.id for article in articles])
+                )
+            ).all())
+            # dict keeps the first of any repeated article
+            pending = list({article.id: article for article in articles if article.id not in known}.values())
+            load_bodies(session, pending)
+            return pending
+        
+        pending = await run_in_session(unindexed)
+        if not pending:
+            return
+        
+        vectors = (await self.embedder.embed([article_text(article) for article in pending])).astype(np.float32)
+        
+        def write(session: Session) -> None:
+            session.add_all(
+                ArticleEmbedding(article_id=article.id, model=self.embedder.name, vector=vector.tobytes())
+                for article, vector in zip(pending, vectors)
+            )
+            session.commit()
+        
+        await run_in_session(write)
+        if self.loaded:
+            self._append([article.id for article in pending], vectors)
+    
+    def vector_of(self, article_id: int) -> Optional[np.ndarray]:
+        """Return the stored vector of an article."""
+        positions = np.flatnonzero(self.ids == article_id)
+        return self.matrix[positions[0]] if len(positions) else None
+    
+    def search(
+        self,
+        query: np.ndarray,
+        k: int = 10,
+        exclude: Sequence[int] = ()
+    ) -> List[Tuple[int, float]]:
+        """
+        Find the articles closest to a normalised query vector.
+        
+        Args:
+            query: Query vector from the same embedder
+            k: Number of results
+            exclude: Article ids to leave out
+            
+        Returns:
+            List of (article id, cosine similarity), most similar first
+        """
+        if not self.size or k <= 0:
+            return []
+        scores = self.matrix @ query.astype(np.float32)
+        if exclude:
+            scores[np.isin(self.ids, exclude)] = -np.inf
+        k = min(k, len(scores))
+        # Partial selection of the top k, then sort only those
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [(int(self.ids[i]), float(scores[i])) for i in top if np.isfinite(scores[i])]
@@ -1,20 +1,65 @@
-from typing import List
+import asyncio
+import json
+import math
+import time
+from collections import Counter, deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+import numpy as np
 import openai
-from tenacity import retry, stop_after_attempt, wait_exponential
+from tenacity import retry, retry_if_not_exception_type, stop_after_attempt, wait_exponential
 from loguru import logger
 
+from src.filters.concurrency import AdaptiveConcurrencyLimiter
+from src.filters.lexical import LexicalPrefilter
+from src.filters.verdict_cache import VerdictCache
 from src.models.article import ArticleCreate
 from src.utils.config import get_settings
 from src.utils.exceptions import ArticleFilterError
 
 settings = get_settings()
 
+# Bump whenever the classification prompts change so cached verdicts are dropped
+PROMPT_VERSION = "2"
+
+def _answer_confidence(top_logprobs: List[Any]) -> Tuple[Optional[bool], float]:
+    """Read a yes/no verdict and its probability from the first token's top logprobs."""
+    p_yes = sum(math.exp(c.logprob) for c in top_logprobs if c.token.strip().lower() == "yes")
+    p_no = sum(math.exp(c.logprob) for c in top_logprobs if c.token.strip().lower() == "no")
+    if not p_yes and not p_no:
+        return None, 0.0
+    return p_yes >= p_no, max(p_yes, p_no)
+
 class ArticleFilter:
     """Filter articles based on topic using OpenAI GPT-4."""
     
     def __init__(self):
-        """Initialize OpenAI async client."""
-        self.openai_client = openai.AsyncOpenAI(api_key=settings.openai_api_key)
+        """Initialize OpenAI async client, the concurrency limiter, the pre-filter and the verdict cache."""
+        # Retries are handled by tenacity so rate-limit errors reach the limiter
+        self.openai_client = openai.AsyncOpenAI(api_key=settings.openai_api_key, max_retries=0)
+        self.limiter = AdaptiveConcurrencyLimiter(
+            initial=settings.filter_initial_concurrency,
+            minimum=settings.filter_min_concurrency,
+            maximum=settings.filter_max_concurrency,
+            latency_target=settings.filter_latency_target,
+            cooldown=settings.filter_backoff_cooldown
+        )
+        self.prefilter = LexicalPrefilter()
+        # Articles decided at each stage, accumulated over all filter() calls
+        self.stage_counts: Counter = Counter()
+        # Recent call latencies per model
+        self.latencies: Dict[str, Deque[float]] = {}
+        # Cached verdicts are only reused by the same model setup
+        self.model_label = settings.openai_model
+        if settings.filter_cascade_enabled:
+            self.model_label = (
+                f"{settings.filter_cheap_model}>{settings.openai_model}@{settings.filter_cascade_confidence}"
+            )
+        self.verdict_cache: Optional[VerdictCache] = None
+        if settings.verdict_cache_enabled:
+            try:
+                self.verdict_cache = VerdictCache(self.model_label, PROMPT_VERSION)
+            except Exception as e:
+                logger.warning(f"Verdict cache unavailable: {e}")
     
     def _create_filter_prompt(self, article: ArticleCreate, topic: str) -> str:
         """Create prompt for OpenAI API."""
@@ -27,6 +72,63 @@ class ArticleFilter:
         Respond with only 'yes' if the article is related to the topic, or 'no' if it's not.
         """
     
+    def _create_batch_prompt(self, articles: List[ArticleCreate], topics: List[str]) -> str:
+        """Create prompt classifying several articles against several topics in one request."""
+        topic_list = "\n".join(f"        [{j}] {topic}" for j, topic in enumerate(topics))
+        entries = "\n".join(
+            f"        [{i}] Article Title: {article.title}\n"
+            f"        Article Content: {article.content[:1000]}\n"
+            for i, article in enumerate(articles)
+        )
+        return f"""
+        Analyze which of the following topics each article is related to.
+        
+        Topics:
+{topic_list}
+        
+{entries}
+        Respond with a JSON object of the form
+        {{"verdicts": [{{"id": 0, "topics": [0, 2]}}, ...]}}
+        containing exactly one verdict per article id, listing the ids of the
+        topics the article is related to (an empty list if none).
+        """
+    
+    async def _complete(self, messages: List[Dict[str, str]], **kwargs: Any) -> Any:
+        """Send a chat completion under the adaptive concurrency limit."""
+        model = kwargs.pop("model", settings.openai_model)
+        await self.limiter.acquire()
+        started = time.monotonic()
+        try:
+            response = await self.openai_client.chat.completions.create(
+                model=model,
+                messages=messages,
+                temperature=settings.temperature,
+                max_tokens=kwargs.pop("max_tokens", settings.max_tokens),
+                **kwargs
+            )
+        except openai.RateLimitError:
+            self.limiter.record_overload()
+            raise
+        finally:
+            self.limiter.release()
+        latency = time.monotonic() - started
+        self.limiter.record_success(latency)
+        self.latencies.setdefault(model, deque(maxlen=1000)).append(latency)
+        return response
+    
+    def _relevance_messages(self, article: ArticleCreate, topic: str) -> List[Dict[str, str]]:
+        """Messages asking for a yes/no relevance answer."""
+        return [
+            {
+                "role": "system",
+                "content": "You are a precise article classifier that responds only with 'yes' or 'no'."
+            },
+            {
+                "role": "user",
+                "content": self._create_filter_prompt(article, topic)
+            }
+        ]
+    
     @retry(
         stop=stop_after_attempt(settings.max_retries),
         wait=wait_exponential(multiplier=settings.retry_delay),
@@ -47,63 +149,363 @@ class ArticleFilter:
             ArticleFilterError: If OpenAI API call fails
         """
         try:
-            response = await self.openai_client.chat.completions.create(
-                model=settings.openai_model,
-                messages=[
+            response = await self._complete(self._relevance_messages(article, topic))
+            answer = response.choices[0].message.content.strip().lower()
+            return answer == "yes"
+            
+        except Exception as e:
+            logger.error(f"OpenAI API call failed: {e}")
+            raise ArticleFilterError("Failed to check article relevance") from e
+    
+    @retry(
+        stop=stop_after_attempt(settings.max_retries),
+        wait=wait_exponential(multiplier=settings.retry_delay),
+        # A malformed reply is split by _check_batch rather than asked for again
+        retry=retry_if_not_exception_type((ValueError, KeyError, TypeError)),
+        reraise=True
+    )
+    async def _classify_batch(self, articles: List[ArticleCreate], topics: List[str]) -> List[Dict[str, bool]]:
+        """
+        Classify several articles against all topics with a single chat completion.
+        
+        Raises:
+            ArticleFilterError: If OpenAI API call fails
+            ValueError, KeyError, TypeError: If the response is not a complete verdict list
+        """
+        try:
+            response = await self._complete(
+                [
                     {
                         "role": "system",
-                        "content": "You are a precise article classifier that responds only with 'yes' or 'no'."
+                        "content": "You are a precise article classifier that responds only with JSON verdicts."
                     },
                     {
                         "role": "user",
-                        "content": self._create_filter_prompt(article, topic)
+                        "content": self._create_batch_prompt(articles, topics)
                     }
                 ],
-                temperature=settings.temperature,
-                max_tokens=settings.max_tokens
+                max_tokens=(settings.filter_batch_tokens_per_article + 4 * len(topics)) * len(articles) + 20,
+                response_format={"type": "json_object"}
             )
-            answer = response.choices[0].message.content.strip().lower()
-            return answer == "yes"
-            
         except Exception as e:
             logger.error(f"OpenAI API call failed: {e}")
             raise ArticleFilterError("Failed to check article relevance") from e
+        
+        verdicts = json.loads(response.choices[0].message.content)["verdicts"]
+        by_id = {int(verdict["id"]): {int(j) for j in verdict["topics"]} for verdict in verdicts}
+        if set(by_id) != set(range(len(articles))):
+            raise ValueError(f"Expected {len(articles)} verdicts, got ids {sorted(by_id)}")
+        return [{topic: j in by_id[i] for j, topic in enumerate(topics)} for i in range(len(articles))]
     
-    async def filter(
+    async def _check_article(self, article: ArticleCreate, topics: List[str]) -> Dict[str, Optional[bool]]:
+        """Classify one article per topic, with None where classification fails."""
+        results = await asyncio.gather(
+            *(self._is_article_relevant(article, topic) for topic in topics),
+            return_exceptions=True
+        )
+        verdicts: Dict[str, Optional[bool]] = {}
+        for topic, result in zip(topics, results):
+            if isinstance(result, ArticleFilterError):
+                logger.warning(f"Failed to filter article '{article.title}' for '{topic}': {result}")
+                result = None
+            elif isinstance(result, BaseException):
+                raise result
+            verdicts[topic] = result
+        return verdicts
+    
+    async def _check_batch(
         self,
         articles: List[ArticleCreate],
-        topic: str
-    ) -> List[ArticleCreate]:
+        topics: List[str]
+    ) -> List[Dict[str, Optional[bool]]]:
         """
-        Filter articles based on topic.
+        Classify a batch, splitting it in half when the response is malformed.
+        
+        API failures that outlast the retries leave the whole batch with None
+        verdicts: smaller batches would only fail the same way, more often.
+        """
+        if len(articles) == 1:
+            return [await self._check_article(articles[0], topics)]
+        try:
+            return await self._classify_batch(articles, topics)
+        except ArticleFilterError as e:
+            logger.warning(f"Failed to filter batch of {len(articles)} articles: {e}")
+            return [{topic: None for topic in topics} for _ in articles]
+        except (ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Batch of {len(articles)} articles returned an unusable response ({e}), splitting")
+            middle = len(articles) // 2
+            first, second = await asyncio.gather(
+                self._check_batch(articles[:middle], topics),
+                self._check_batch(articles[middle:], topics)
+            )
+            return first + second
+    
+    async def _classify(
+        self,
+        articles: List[ArticleCreate],
+        topics: List[str],
+        batch_size: int
+    ) -> List[Dict[str, Optional[bool]]]:
+        """Return the verdicts per topic for each article, in article order (None on failure)."""
+        # Classify concurrently; the limiter caps how many calls are in flight
+        if batch_size <= 1:
+            return list(await asyncio.gather(*(self._check_article(article, topics) for article in articles)))
+        batches = [articles[i:i + batch_size] for i in range(0, len(articles), batch_size)]
+        results = await asyncio.gather(*(self._check_batch(batch, topics) for batch in batches))
+        return [verdict for verdicts in results for verdict in verdicts]
+    
+    async def _cheap_verdict(self, article: ArticleCreate, topic: str) -> Tuple[Optional[bool], float]:
+        """Ask the cheap model for a yes/no answer and return it with its probability."""
+        try:
+            response = await self._complete(
+                self._relevance_messages(article, topic),
+                model=settings.filter_cheap_model,
+                max_tokens=1,
+                logprobs=True,
+                top_logprobs=5
+            )
+            return _answer_confidence(response.choices[0].logprobs.content[0].top_logprobs)
+        except Exception as e:
+            logger.warning(f"Cheap model failed on '{article.title}', escalating: {e}")
+            return None, 0.0
+    
+    async def _classify_cascade(
+        self,
+        articles: List[ArticleCreate],
+        topics: List[str],
+        batch_size: int,
+        stages: Counter
+    ) -> List[Dict[str, Optional[bool]]]:
+        """
+        Classify with the cheap model first and escalate low-confidence answers.
+        
+        Verdicts whose probability reaches ``settings.filter_cascade_confidence``
+        are kept; the articles with any other verdict go to the strong model.
+        """
+        pairs = [(i, topic) for i in range(len(articles)) for topic in topics]
+        answers = await asyncio.gather(*(self._cheap_verdict(articles[i], topic) for i, topic in pairs))
+        
+        verdicts: List[Dict[str, Optional[bool]]] = [dict.fromkeys(topics) for _ in articles]
+        for (i, topic), (verdict, confidence) in zip(pairs, answers):
+            if verdict is not None and confidence >= settings.filter_cascade_confidence:
+                verdicts[i][topic] = verdict
+                stages["cheap_accepted"] += 1
+            else:
+                stages["escalated"] += 1
+        
+        escalated = [i for i, verdict in enumerate(verdicts) if None in verdict.values()]
+        if escalated:
+            open_topics = [topic for topic in topics if any(verdicts[i][topic] is None for i in escalated)]
+            strong = await self._classify([articles[i] for i in escalated], open_topics, batch_size)
+            for i, decided in zip(escalated, strong):
+                for topic, value in decided.items():
+                    if verdicts[i][topic] is None:
+                        verdicts[i][topic] = value
+        return verdicts
+    
+    async def _classify_cached(
+        self,
+        articles: List[ArticleCreate],
+        verdicts: List[Dict[str, Optional[bool]]],
+        batch_size: int,
+        stages: Counter
+    ) -> None:
+        """Fill in undecided verdicts from the cache, then from the model for the rest."""
+        if self.verdict_cache is not None:
+            for topic in {topic for verdict in verdicts for topic, value in verdict.items() if value is None}:
+                rows = [i for i, verdict in enumerate(verdicts) if verdict[topic] is None]
+                try:
+                    cached = await self.verdict_cache.lookup([articles[i] for i in rows], topic)
+                except Exception as e:
+                    logger.warning(f"Verdict cache lookup failed: {e}")
+                    continue
+                for i, value in zip(rows, cached):
+                    if value is not None:
+                        verdicts[i][topic] = value
+                        stages["cached"] += 1
+        
+        # Group the articles by the topics still open for them, so the model is
+        # only asked about (article, topic) pairs that are actually missing
+        groups: Dict[Tuple[str, ...], List[int]] = {}
+        for i, verdict in enumerate(verdicts):
+            open_topics = tuple(topic for topic, value in verdict.items() if value is None)
+            if open_topics:
+                groups.setdefault(open_topics, []).append(i)
+        if not groups:
+            return
+        
+        async def classify(rows: List[int], topics: List[str]) -> List[Dict[str, Optional[bool]]]:
+            pending = [articles[i] for i in rows]
+            if settings.filter_cascade_enabled:
+                return await self._classify_cascade(pending, topics, batch_size, stages)
+            return await self._classify(pending, topics, batch_size)
+        
+        results = await asyncio.gather(*(classify(rows, list(topics)) for topics, rows in groups.items()))
+        for (topics, rows), fresh in zip(groups.items(), results):
+            for i, decided in zip(rows, fresh):
+                for topic in topics:
+                    verdicts[i][topic] = decided[topic]
+                    stages["model"] += 1
+            if self.verdict_cache is not None:
+                pending = [articles[i] for i in rows]
+                for topic in topics:
+                    try:
+                        await self.verdict_cache.store(pending, topic, [decided[topic] for decided in fresh])
+                    except Exception as e:
+                        logger.warning(f"Failed to store verdicts: {e}")
+    
+    async def _decide(
+        self,
+        articles: List[ArticleCreate],
+        topics: List[str],
+        batch_size: int
+    ) -> List[Dict[str, Optional[bool]]]:
+        """Run the filter cascade: lexical pre-filter, verdict cache, then the model."""
+        stages: Counter = Counter()
+        verdicts: List[Dict[str, Optional[bool]]] = [dict.fromkeys(topics) for _ in articles]
+        if settings.filter_prefilter_enabled and articles:
+            verdicts, _ = self.prefilter.split(
+                articles,
+                topics,
+                settings.filter_reject_threshold,
+                settings.filter_accept_threshold,
+                settings.filter_topic_terms
+            )
+            for verdict in verdicts:
+                values = list(verdict.values())
+                stages["prefilter_accepted"] += values.count(True)
+                stages["prefilter_rejected"] += values.count(False)
+        
+        undecided = [i for i, verdict in enumerate(verdicts) if None in verdict.values()]
+        if undecided:
+            subset = [verdicts[i] for i in undecided]
+            await self._classify_cached([articles[i] for i in undecided], subset, batch_size, stages)
+        
+        self.stage_counts.update(stages)
+        logger.info(
+            f"Decided {len(articles)} articles x {len(topics)} topics: "
+            f"{stages['prefilter_accepted']} accepted and {stages['prefilter_rejected']} rejected "
+            f"by the pre-filter, {stages['cached']} from cache, {stages['model']} by the model"
+            + (
+                f" ({stages['cheap_accepted']} kept from the cheap model, {stages['escalated']} escalated)"
+                if settings.filter_cascade_enabled else ""
+            )
+        )
+        return verdicts
+    
+    def stats(self) -> Dict[str, Any]:
+        """Return per-stage decision counts, call latency per model, the concurrency limit and cache counters."""
+        return {
+            "stages": dict(self.stage_counts),
+            "latency": {
+                model: {
+                    "calls": len(samples),
+                    "p50": float(np.percentile(samples, 50)),
+                    "p95": float(np.percentile(samples, 95)),
+                }
+                for model, samples in self.latencies.items()
+            },
+            "concurrency_limit": self.limiter.limit,
+            "verdict_cache": self.verdict_cache.stats() if self.verdict_cache else None,
+        }
+    
+    async def filter_topics(
+        self,
+        articles: List[ArticleCreate],
+        topics: List[str],
+        batch_size: Optional[int] = None
+    ) -> Dict[str, List[ArticleCreate]]:
+        """
+        Filter articles against several topics in a single pass.
+        
+        Each article is classified against all topics at once, so the number
+        of model requests depends on the number of articles only.
         
         Args:
             articles: List of articles to filter
-            topic: Topic to filter by
+            topics: Topics to filter by
+            batch_size: Articles classified per request (defaults to
+                ``settings.filter_batch_size``; 1 sends one request per article
+                and topic)
             
         Returns:
-            List of relevant articles
+            Relevant articles per topic; an article relevant to several topics
+            is listed under each and its ``topic`` is the first of them
+            
+        Raises:
+            ArticleFilterError: If filtering fails
+        """
+        relevant_articles, _ = await self.filter_topics_split(articles, topics, batch_size)
+        return relevant_articles
+    
+    async def filter_topics_split(
+        self,
+        articles: List[ArticleCreate],
+        topics: List[str],
+        batch_size: Optional[int] = None
+    ) -> Tuple[Dict[str, List[ArticleCreate]], List[ArticleCreate]]:
+        """
+        Filter articles like filter_topics and report the ones left undecided.
+        
+        Returns:
+            Tuple of the relevant articles per topic and the articles for
+            which some topic got no verdict (e.g. the API was down); those
+            are not listed as relevant to the undecided topics
             
         Raises:
             ArticleFilterError: If filtering fails
         """
+        topics = list(dict.fromkeys(topics))
         try:
-            relevant_articles = []
+            verdicts = await self._decide(
+                articles,
+                topics,
+                batch_size if batch_size is not None else settings.filter_batch_size
+            )
             
-            for article in articles:
-                try:
-                    if await self._is_article_relevant(article, topic):
-                        article.topic = topic
-                        relevant_articles.append(article)
-                except ArticleFilterError as e:
-                    logger.warning(f"Failed to filter article '{article.title}': {e}")
-                    continue
+            # Articles whose classification failed are treated as not relevant
+            relevant_articles: Dict[str, List[ArticleCreate]] = {topic: [] for topic in topics}
+            undecided: List[ArticleCreate] = []
+            for article, verdict in zip(articles, verdicts):
+                matched = [topic for topic in topics if verdict[topic]]
+                if matched:
+                    article.topic = matched[0]
+                for topic in matched:
+                    relevant_articles[topic].append(article)
+                if any(verdict[topic] is None for topic in topics):
+                    undecided.append(article)
             
-            logger.info(
-                f"Filtered {len(relevant_articles)} relevant articles out of {len(articles)}"
-            )
-            return relevant_articles
+            for topic, relevant in relevant_articles.items():
+                logger.info(
+                    f"Filtered {len(relevant)} relevant articles out of {len(articles)} for '{topic}'"
+                )
+            if undecided:
+                logger.warning(f"{len(undecided)} of {len(articles)} articles could not be classified")
+            return relevant_articles, undecided
             
         except Exception as e:
             logger.error(f"Article filtering failed: {e}")
             raise ArticleFilterError("Failed to filter articles") from e
+    
+    async def filter(
+        self,
+        articles: List[ArticleCreate],
+        topic: str,
+        batch_size: Optional[int] = None
+    ) -> List[ArticleCreate]:
+        """
+        Filter articles based on topic.
+        
+        Args:
+            articles: List of articles to filter
+            topic: Topic to filter by
+            batch_size: Articles classified per request (defaults to
+                ``settings.filter_batch_size``; 1 sends one request per article)
+            
+        Returns:
+            List of relevant articles
+            
+        Raises:
+            ArticleFilterError: If filtering fails
+        """
+        return (await self.filter_topics(articles, [topic], batch_size))[topic]
@@ -0,0 +1,101 @@
+import asyncio
+import time
+from collections import deque
+from typing import Deque
+from loguru import logger
+
+class AdaptiveConcurrencyLimiter:
+    """
+    AIMD concurrency limit for calls to a rate-limited API.
+
+    The limit grows by one after a full window of healthy calls and is
+    halved on overload (rate-limit errors or latency above the target).
+    After a decrease the limit is frozen for a cool-down, so a burst of
+    failures counts once and the limit does not climb straight back.
+    """
+
+    def __init__(
+        self,
+        initial: int,
+        minimum: int,
+        maximum: int,
+        latency_target: float,
+        cooldown: float,
+        backoff: float = 0.5
+    ):
+        """
+        Initialize the limiter.
+
+        Args:
+            initial: Starting concurrency limit
+            minimum: Lowest limit the backoff may reach
+            maximum: Highest limit the increase may reach
+            latency_target: Call latency in seconds treated as congestion
+            cooldown: Seconds the limit stays frozen after a decrease
+            backoff: Factor applied to the limit on overload
+        """
+        self.limit = max(minimum, min(initial, maximum))
+        self.minimum = minimum
+        self.maximum = maximum
+        self.latency_target = latency_target
+        self.cooldown = cooldown
+        self.backoff = backoff
+        self.in_flight = 0
+        self._healthy_calls = 0
+        self._last_decrease = 0.0
+        self._waiters: Deque[asyncio.Future] = deque()
+
+    async def acquire(self) -> None:
+        """Wait until a call may start under the current limit."""
+        while self.in_flight >= self.limit:
+            future = asyncio.get_running_loop().create_future()
+            self._waiters.append(future)
+            try:
+                await future
+            except asyncio.CancelledError:
+                # Pass the wake-up on if we were woken and then cancelled
+                if future.done() and not future.cancelled():
+                    self._wake()
+                raise
+        self.in_flight += 1
+
+    def release(self) -> None:
+        """Mark a call as finished and wake waiters that now fit under the limit."""
+        self.in_flight -= 1
+        self._wake()
+
+    def _wake(self) -> None:
+        free = self.limit - self.in_flight
+        while free > 0 and self._waiters:
+            future = self._waiters.popleft()
+            if not future.done():
+                future.set_result(None)
+                free -= 1
+
+    def record_success(self, latency: float) -> None:
+        """Record a completed call; slow calls count as congestion."""
+        if latency > self.latency_target:
+            self._decrease(f"latency {latency:.1f}s above target")
+            return
+        if time.monotonic() - self._last_decrease < self.cooldown:
+            return
+        self._healthy_calls += 1
+        if self._healthy_calls >= self.limit and self.limit < self.maximum:
+            self.limit += 1
+            self._healthy_calls = 0
+            self._wake()
+
+    def record_overload(self) -> None:
+        """Record a rate-limit response."""
+        self._decrease("rate limited")
+
+    def _decrease(self, reason: str) -> None:
+        now = time.monotonic()
+        self._healthy_calls = 0
+        if now - self._last_decrease < self.cooldown:
+            return
+        self._last_decrease = now
+        new_limit = max(self.minimum, int(self.limit * self.backoff))
+        if new_limit < self.limit:
+            logger.info(f"Reducing concurrency limit {self.limit} -> {new_limit} ({reason})")
+            self.limit = new_limit
@@ -0,0 +1,186 @@
+import hashlib
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Dict, List, NamedTuple, Optional, Tuple
+import numpy as np
+from loguru import logger
+
+from src.filters.lexical import tokenize
+from src.models.article import ArticleCreate
+
+# Fixed seed so signatures are comparable across runs and instances
+_SEED = 20240101
+
+class Cluster(NamedTuple):
+    """Near-duplicate articles; only the representative gets classified."""
+    representative: ArticleCreate
+    members: List[ArticleCreate]
+    # The representative was indexed by an earlier call, not passed to this one
+    earlier: bool = False
+
+class _Entry(NamedTuple):
+    article: ArticleCreate
+    signature: np.ndarray
+    root: int
+    added_at: datetime
+
+class NearDuplicateIndex:
+    """
+    MinHash/LSH index of recently seen articles.
+    
+    Articles are shingled into word 3-grams and reduced to MinHash
+    signatures; banding the signatures yields candidate pairs whose
+    estimated Jaccard similarity is then checked against the threshold.
+    Every article joins the cluster of its best match, and the first
+    article of a cluster stays its representative across runs until it
+    falls out of the window.
+    """
+    
+    def __init__(
+        self,
+        threshold: float = 0.6,
+        num_perm: int = 64,
+        bands: int = 16,
+        window: timedelta = timedelta(hours=48),
+        max_entries: int = 50_000
+    ):
+        """
+        Initialize the index.
+        
+        Args:
+            threshold: Estimated Jaccard similarity above which articles are duplicates
+            num_perm: MinHash signature length
+            bands: LSH bands; ``num_perm`` must be a multiple of it
+            window: How long articles stay in the index
+            max_entries: Maximum number of indexed articles
+        """
+        if num_perm % bands:
+            raise ValueError("num_perm must be a multiple of bands")
+        self.threshold = threshold
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.window = window
+        self.max_entries = max_entries
+        random = np.random.RandomState(_SEED)
+        self._a = random.randint(0, 2**64, size=num_perm, dtype=np.uint64) | np.uint64(1)
+        self._b = random.randint(0, 2**64, size=num_perm, dtype=np.uint64)
+        self.entries: Dict[int, _Entry] = {}
+        self.buckets: Dict[Tuple[int, bytes], List[int]] = defaultdict(list)
+        self.urls: Dict[str, int] = {}
+        self._next_id = 0
+    
+    def signature(self, article: ArticleCreate) -> Optional[np.ndarray]:
+        """Return the MinHash signature of an article, or None if it has no text."""
+        tokens = tokenize(f"{article.title} {article.content[:2000]}")
+        if len(tokens) >= 3:
+            shingles = {" ".join(tokens[i:i + 3]) for i in range(len(tokens) - 2)}
+        else:
+            shingles = set(tokens)
+        if not shingles:
+            return None
+        hashes = np.fromiter(
+            (int.from_bytes(hashlib.blake2b(s.encode(), digest_size=8).digest(), "little") for s in shingles),
+            dtype=np.uint64,
+            count=len(shingles)
+        )
+        # Multiply-shift hashing; uint64 arithmetic wraps around by design
+        permuted = (self._a[:, None] * hashes[None, :] + self._b[:, None]) >> np.uint64(32)
+        return permuted.min(axis=1).astype(np.uint32)
+    
+    def _band_keys(self, signature: np.ndarray) -> List[Tuple[int, bytes]]:
+        return [(band, signature[band * self.rows:(band + 1) * self.rows].tobytes()) for band in range(self.bands)]
+    
+    def _expire(self, now: datetime) -> None:
+        cutoff = now - self.window
+        # entries is ordered by insertion, so the oldest come first
+        dropped = {entry_id for entry_id, entry in self.entries.items() if entry.added_at < cutoff}
+        overflow = len(self.entries) - len(dropped) - self.max_entries
+        if overflow > 0:
+            dropped.update([entry_id for entry_id in self.entries if entry_id not in dropped][:overflow])
+        if not dropped:
+            return
+        for entry_id in dropped:
+            del self.urls[str(self.entries.pop(entry_id).article.url)]
+        # The oldest surviving member of a cluster whose root expired becomes its root
+        new_roots: Dict[int, int] = {}
+        for entry_id, entry in self.entries.items():
+            if entry.root in dropped:
+                root = new_roots.setdefault(entry.root, entry_id)
+                self.entries[entry_id] = entry._replace(root=root)
+        for key in list(self.buckets):
+            kept = [entry_id for entry_id in self.buckets[key] if entry_id not in dropped]
+            if kept:
+                self.buckets[key] = kept
+            else:
+                del self.buckets[key]
+    
+    def _add(self, article: ArticleCreate, signature: np.ndarray, root: Optional[int], now: datetime) -> int:
+        entry_id = self._next_id
+        self._next_id += 1
+        self.entries[entry_id] = _Entry(article, signature, entry_id if root is None else root, now)
+        self.urls[str(article.url)] = entry_id
+        for key in self._band_keys(signature):
+            self.buckets[key].append(entry_id)
+        return entry_id
+    
+    def _refresh(self, entry_id: int, article: ArticleCreate, now: datetime) -> int:
+        """Replace an indexed article with a new copy of itself, keeping its cluster and signature."""
+        # Re-inserting moves the entry to the end, keeping entries ordered by age
+        entry = self.entries.pop(entry_id)
+        self.entries[entry_id] = entry._replace(article=article, added_at=now)
+        return entry.root
+    
+    def _best_match(self, signature: np.ndarray) -> Optional[int]:
+        candidates = {entry_id for key in self._band_keys(signature) for entry_id in self.buckets.get(key, ())}
+        best, best_score = None, self.threshold
+        for entry_id in candidates:
+            score = float(np.mean(self.entries[entry_id].signature == signature))
+            if score >= best_score:
+                best, best_score = entry_id, score
+        return best
+    
+    def group(self, articles: List[ArticleCreate]) -> List[Cluster]:
+        """
+        Group articles with each other and with recently indexed articles.
+        
+        An article whose URL is already indexed replaces its earlier copy
+        rather than joining it as a near-duplicate.
+        
+        Args:
+            articles: Newly collected articles
+            
+        Returns:
+            One cluster per distinct story, in order of first appearance;
+            the representative may be an article indexed by an earlier call
+            (``Cluster.earlier``), in which case all members are new
+        """
+        now = datetime.utcnow()
+        self._expire(now)
+        clusters: Dict[int, Cluster] = {}
+        for article in articles:
+            signature = self.signature(article)
+            if signature is None:
+                clusters[-len(clusters) - 1] = Cluster(article, [])
+                continue
+            existing = self.urls.get(str(article.url))
+            if existing is not None:
+                # Seen before under the same URL: it must not count as its own duplicate
+                root = self._refresh(existing, article, now)
+                if root == existing:
+                    clusters[root] = Cluster(article, clusters[root].members if root in clusters else [])
+                    continue
+            else:
+                match = self._best_match(signature)
+                root = self.entries[match].root if match is not None else None
+                existing = self._add(article, signature, root, now)
+            if root is None:
+                clusters[existing] = Cluster(article, [])
+            elif root in clusters:
+                clusters[root].members.append(article)
+            else:
+                clusters[root] = Cluster(self.entries[root].article, [article], earlier=True)
+        
+        duplicates = sum(len(cluster.members) for cluster in clusters.values())
+        if duplicates:
+            logger.info(f"Grouped {len(articles)} articles into {len(clusters)} stories ({duplicates} near-duplicates)")
+        return list(clusters.values())
@@ -0,0 +1,154 @@
+import re
+from typing import Dict, List, Optional, Sequence, Tuple
+import numpy as np
+
+from src.models.article import ArticleCreate
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+_STOPWORDS = frozenset(
+    "a an and are as at be by for from in into is it of on or the to with about news".split()
+)
+
+_SIBILANTS = ("s", "x", "z", "ch", "sh")
+
+def _strip(token: str, suffix: str) -> str:
+    """Remove ``suffix`` if at least three letters remain."""
+    if token.endswith(suffix) and len(token) - len(suffix) >= 3:
+        return token[: -len(suffix)]
+    return token
+
+def _stem(token: str) -> str:
+    """
+    Light suffix stripping so plurals and verb forms share a term.
+
+    One inflection is removed ("es" only after a sibilant, as in "boxes"),
+    then a final silent "e" and a doubled final consonant, so "rate",
+    "rates", "rated" and "rating" all become "rat".
+    """
+    if token.endswith("ies") and len(token) >= 6:
+        return token[:-3] + "y"
+    for suffix in ("ing", "ed"):
+        stem = _strip(token, suffix)
+        if stem != token:
+            # "ed" and "ing" already took the silent "e" ("rated", "rating")
+            if stem[-1] == stem[-2] and stem[-1] not in "aeiouylsz":
+                stem = stem[:-1]
+            return stem
+    if token.endswith("es") and token[:-2].endswith(_SIBILANTS):
+        token = _strip(token, "es")
+    elif token.endswith("s") and not token.endswith(("ss", "us", "is")):
+        token = _strip(token, "s")
+    return _strip(token, "e")
+
+def tokenize(text: str) -> List[str]:
+    """Lower-case, split on non-alphanumerics and stem."""
+    return [_stem(token) for token in _TOKEN.findall(text.lower())]
+
+def expand_topic(topic: str, extra_terms: Sequence[str] = ()) -> List[str]:
+    """
+    Build the query term set for a topic.
+
+    Uses the topic words without stop words, the acronym of multi-word
+    topics ("artificial intelligence" -> "ai") and any extra terms.
+    """
+    words = [word for word in _TOKEN.findall(topic.lower()) if word not in _STOPWORDS]
+    terms = [_stem(word) for word in words]
+    if len(words) > 1:
+        terms.append("".join(word[0] for word in words))
+    for term in extra_terms:
+        terms.extend(tokenize(term))
+    return list(dict.fromkeys(terms))
+
+class LexicalPrefilter:
+    """
+    BM25 scoring of a batch of articles against topic term sets.
+
+    Scores are normalised by the best score a document could reach for the
+    query, so they fall in [0, 1) and thresholds do not depend on batch size.
+    """
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75, title_weight: int = 2):
+        """
+        Initialize the scorer.
+
+        Args:
+            k1: BM25 term frequency saturation
+            b: BM25 document length normalisation
+            title_weight: How many times title tokens are counted
+        """
+        self.k1 = k1
+        self.b = b
+        self.title_weight = title_weight
+
+    def score(self, articles: List[ArticleCreate], term_sets: List[List[str]]) -> np.ndarray:
+        """
+        Score every article against several topics in one pass.
+
+        Args:
+            articles: Articles to score
+            term_sets: Query terms of each topic
+
+        Returns:
+            Matrix of normalised BM25 scores, one row per article and one
+            column per topic
+        """
+        vocabulary = list(dict.fromkeys(term for terms in term_sets for term in terms))
+        if not articles or not vocabulary:
+            return np.zeros((len(articles), len(term_sets)))
+        index = {term: i for i, term in enumerate(vocabulary)}
+        # Which vocabulary terms belong to which topic
+        membership = np.zeros((len(vocabulary), len(term_sets)))
+        for column, terms in enumerate(term_sets):
+            membership[[index[term] for term in terms], column] = 1
+
+        counts = np.zeros((len(articles), len(vocabulary)))
+        lengths = np.zeros(len(articles))
+        for row, article in enumerate(articles):
+            title = tokenize(article.title)
+            body = tokenize(article.content[:5000])
+            lengths[row] = self.title_weight * len(title) + len(body)
+            for weight, tokens in ((self.title_weight, title), (1, body)):
+                hits = [index[token] for token in tokens if token in index]
+                np.add.at(counts[row], hits, weight)
+
+        n_docs = len(articles)
+        doc_freq = np.count_nonzero(counts, axis=0)
+        idf = np.log1p((n_docs - doc_freq + 0.5) / (doc_freq + 0.5))
+        avg_length = max(lengths.mean(), 1.0)
+        norm = self.k1 * (1 - self.b + self.b * lengths / avg_length)
+        tf = counts * (self.k1 + 1) / (counts + norm[:, None])
+        best = (self.k1 + 1) * (idf @ membership)
+        return (tf * idf) @ membership / np.where(best > 0, best, 1.0)
+
+    def split(
+        self,
+        articles: List[ArticleCreate],
+        topics: List[str],
+        reject_below: float,
+        accept_above: float,
+        extra_terms: Optional[Dict[str, Sequence[str]]] = None
+    ) -> Tuple[List[Dict[str, Optional[bool]]], np.ndarray]:
+        """
+        Decide the clear cases locally.
+
+        Args:
+            articles: Articles to score
+            topics: Topics to score against
+            reject_below: Scores below this are rejected
+            accept_above: Scores above this are accepted
+            extra_terms: Additional query terms per topic
+
+        Returns:
+            Tuple of the verdicts per article and topic (None for the
+            ambiguous band that still needs the model) and the scores
+        """
+        extra_terms = extra_terms or {}
+        scores = self.score(articles, [expand_topic(topic, extra_terms.get(topic, ())) for topic in topics])
+        verdicts = [
+            {
+                topic: False if score < reject_below else True if score > accept_above else None
+                for topic, score in zip(topics, row)
+            }
+            for row in scores.tolist()
+        ]
+        return verdicts, scores
@@ -0,0 +1,126 @@
+import hashlib
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+from loguru import logger
+from sqlmodel import Session, delete, select, col, func
+
+from src.models.article import ArticleCreate
+from src.models.database import get_session, run_in_session
+from src.models.verdict import RelevanceVerdict
+from src.utils.config import get_settings
+
+settings = get_settings()
+
+# SQLite caps the number of bound parameters per statement
+_CHUNK = 500
+
+def content_hash(article: ArticleCreate) -> str:
+    """Hash the part of an article the classifier sees (title and truncated content)."""
+    return hashlib.sha256(f"{article.title}\n{article.content[:1000]}".encode()).hexdigest()
+
+class VerdictCache:
+    """Persistent relevance verdicts keyed by content hash, topic, model and prompt version."""
+
+    def __init__(self, model: str, prompt_version: str):
+        """
+        Initialize the cache and drop entries that can no longer be used.
+
+        Args:
+            model: Model whose verdicts are cached
+            prompt_version: Version of the classification prompts
+        """
+        self.model = model
+        self.prompt_version = prompt_version
+        self.hits = 0
+        self.misses = 0
+        # Row count as of the last purge plus the rows stored since
+        self.size = 0
+        self.purge()
+
+    def _select_hashes(self, session: Session, columns: Tuple[Any, ...], hashes: List[str], topic: str) -> List[Any]:
+        rows: List[Any] = []
+        for i in range(0, len(hashes), _CHUNK):
+            rows.extend(session.exec(
+                select(*columns).where(
+                    col(RelevanceVerdict.content_hash).in_(hashes[i:i + _CHUNK]),
+                    RelevanceVerdict.topic == topic,
+                    RelevanceVerdict.model == self.model,
+                    RelevanceVerdict.prompt_version == self.prompt_version
+                )
+            ).all())
+        return rows
+
+    async def lookup(self, articles: List[ArticleCreate], topic: str) -> List[Optional[bool]]:
+        """Return the cached verdict per article, or None where there is none."""
+        hashes = [content_hash(article) for article in articles]
+        unique = list(dict.fromkeys(hashes))
+        found: Dict[str, bool] = dict(await run_in_session(
+            lambda session: self._select_hashes(
+                session, (RelevanceVerdict.content_hash, RelevanceVerdict.relevant), unique, topic
+            )
+        ))
+        verdicts = [found.get(h) for h in hashes]
+        hits = sum(verdict is not None for verdict in verdicts)
+        self.hits += hits
+        self.misses += len(verdicts) - hits
+        return verdicts
+
+    async def store(self, articles: List[ArticleCreate], topic: str, verdicts: List[Optional[bool]]) -> None:
+        """Save verdicts, purging once the cache outgrows its limit; None (classification failed) is not cached."""
+        rows = {
+            content_hash(article): verdict
+            for article, verdict in zip(articles, verdicts)
+            if verdict is not None
+        }
+        if not rows:
+            return
+        
+        def write(session: Session) -> int:
+            existing = set(self._select_hashes(session, (RelevanceVerdict.content_hash,), list(rows), topic))
+            new_rows = [
+                RelevanceVerdict(
+                    content_hash=h,
+                    topic=topic,
+                    model=self.model,
+                    prompt_version=self.prompt_version,
+                    relevant=verdict
+                )
+                for h, verdict in rows.items()
+                if h not in existing
+            ]
+            session.add_all(new_rows)
+            session.commit()
+            if self.size + len(new_rows) > settings.verdict_cache_max_entries:
+                return self._purge(session)
+            return self.size + len(new_rows)
+        
+        self.size = await run_in_session(write)
+
+    def purge(self) -> None:
+        """Delete verdicts from other models or prompt versions, expired ones and the overflow."""
+        with get_session() as session:
+            self.size = self._purge(session)
+
+    def _purge(self, session: Session) -> int:
+        """Purge within a session and return the number of verdicts left."""
+        cutoff = datetime.utcnow() - timedelta(days=settings.verdict_cache_ttl_days)
+        session.exec(
+            delete(RelevanceVerdict).where(
+                (RelevanceVerdict.model != self.model)
+                | (RelevanceVerdict.prompt_version != self.prompt_version)
+                | (RelevanceVerdict.created_at < cutoff)
+            )
+        )
+        size = session.exec(select(func.count(RelevanceVerdict.id))).one()
+        overflow = size - settings.verdict_cache_max_entries
+        if overflow > 0:
+            oldest = select(RelevanceVerdict.id).order_by(RelevanceVerdict.created_at, RelevanceVerdict.id).limit(overflow)
+            session.exec(delete(RelevanceVerdict).where(col(RelevanceVerdict.id).in_(oldest)))
+            size -= overflow
+            logger.info(f"Evicted {overflow} cached verdicts")
+        session.commit()
+        return size
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit and miss counters."""
+        return {"hits": self.hits, "misses": self.misses}
@@ -1,30 +1,93 @@
 from datetime import datetime
 from typing import Optional
-from sqlmodel import SQLModel, Field
+from sqlalchemy import Index, UniqueConstraint
+from sqlmodel import SQLModel, Field, Relationship
 from pydantic import HttpUrl
 
+from src.models.compression import decompress
+
 class ArticleBase(SQLModel):
     """Base model for article data."""
     title: str = Field(index=True)
     url: str = Field(unique=True)  # Use str for SQLModel compatibility
     publication_date: datetime = Field(index=True)
     source: str = Field(index=True)
-    content: str
     topic: Optional[str] = Field(default=None, index=True)
 
 class Article(ArticleBase, table=True):
     """Database model for articles."""
+    # Topic listings page through (publication_date, id) within a topic; unfiltered
+    # listings use the publication_date index, which already ends in the rowid
+    __table_args__ = (Index("ix_article_topic_publication_date_id", "topic", "publication_date", "id"),)
+    
     id: Optional[int] = Field(default=None, primary_key=True)
+    # Hash of the canonical URL, see src.utils.urls.url_hash
+    url_hash: Optional[int] = Field(default=None, index=True)
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
+    
+    # Bodies live in their own table; listings leave them unloaded
+    body: Optional["ArticleBody"] = Relationship(
+        sa_relationship_kwargs={"uselist": False, "cascade": "all, delete-orphan"}
+    )
+    
+    @property
+    def content(self) -> str:
+        """Article text. Outside a session the body must have been loaded, see src.models.body."""
+        return self.body.text if self.body is not None else ""
+
+class ArticleBodyDictionary(SQLModel, table=True):
+    """Shared zlib preset dictionary article bodies are compressed with."""
+    id: Optional[int] = Field(default=None, primary_key=True)
+    data: bytes
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+
+class ArticleBody(SQLModel, table=True):
+    """Compressed text of a saved article."""
+    article_id: int = Field(foreign_key="article.id", primary_key=True)
+    dictionary_id: Optional[int] = Field(default=None, foreign_key="articlebodydictionary.id")
+    data: bytes
+    
+    dictionary: Optional[ArticleBodyDictionary] = Relationship()
+    
+    @property
+    def text(self) -> str:
+        return decompress(self.data, self.dictionary.data if self.dictionary is not None else None)
+
+class ArticleTopic(SQLModel, table=True):
+    """Topic a saved article was classified as relevant to."""
+    # Topic listings walk this index in (publication_date, article_id) order,
+    # which is why links carry a copy of their article's publication date
+    __table_args__ = (
+        UniqueConstraint("article_id", "topic"),
+        Index("ix_articletopic_topic_publication_date_article_id", "topic", "publication_date", "article_id"),
+    )
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    article_id: int = Field(foreign_key="article.id", index=True)
+    topic: str = Field(index=True)
+    # Nullable only so the column can be added to existing tables
+    publication_date: Optional[datetime] = None
+
+class ArticleDuplicate(SQLModel, table=True):
+    """Near-duplicate copy of a saved article that was not classified or stored itself."""
+    id: Optional[int] = Field(default=None, primary_key=True)
+    article_id: int = Field(foreign_key="article.id", index=True)
+    url: str = Field(unique=True)
+    title: str
+    source: str = Field(index=True)
+    publication_date: datetime
+    created_at: datetime = Field(default_factory=datetime.utcnow)
 
 class ArticleCreate(ArticleBase):
     """Schema for creating new articles."""
     url: HttpUrl  # Use HttpUrl for Pydantic validation
+    content: str
 
 class ArticleRead(ArticleBase):
     """Schema for reading articles."""
     id: int
+    content: str
     created_at: datetime
     updated_at: datetime
 
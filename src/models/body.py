@@ -0,0 +1,134 @@
+from datetime import datetime
+from typing import Iterable, Optional
+from loguru import logger
+from sqlalchemy import Connection, func, inspect, text
+from sqlalchemy.orm import selectinload
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlmodel import Session, col, select
+
+from src.models.article import Article, ArticleBody, ArticleBodyDictionary
+from src.models.compression import compress, train_dictionary
+from src.utils.config import get_settings
+
+settings = get_settings()
+
+# Rows per query when loading or moving bodies
+BATCH_SIZE = 500
+
+def with_body():
+    """Loader option that fetches articles' bodies together with the articles."""
+    return selectinload(Article.body).selectinload(ArticleBody.dictionary)
+
+def load_bodies(session: Session, articles: Iterable[Article]) -> None:
+    """
+    Fetch the bodies of articles that were loaded without them.
+
+    Works on articles from closed sessions too, so lists can be fetched
+    without bodies and a body loaded only once it is displayed or
+    exported.
+    """
+    pending = {article.id: article for article in articles if "body" in inspect(article).unloaded}
+    ids = list(pending)
+    for start in range(0, len(ids), BATCH_SIZE):
+        batch = ids[start:start + BATCH_SIZE]
+        bodies = session.exec(
+            select(ArticleBody)
+            .where(col(ArticleBody.article_id).in_(batch))
+            .options(selectinload(ArticleBody.dictionary))
+        ).all()
+        by_id = {body.article_id: body for body in bodies}
+        for article_id in batch:
+            set_committed_value(pending[article_id], "body", by_id.get(article_id))
+
+def train_body_dictionary(session: Session) -> Optional[ArticleBodyDictionary]:
+    """
+    Train a preset dictionary on a sample of stored bodies and make it current.
+
+    Bodies already stored keep the dictionary they were compressed with.
+
+    Returns:
+        The new dictionary, or None if the samples share nothing
+    """
+    sample = session.exec(
+        select(ArticleBody)
+        .options(selectinload(ArticleBody.dictionary))
+        .order_by(func.random())
+        .limit(settings.body_dictionary_samples)
+    ).all()
+    data = train_dictionary(body.text for body in sample)
+    if not data:
+        return None
+    dictionary = ArticleBodyDictionary(data=data)
+    session.add(dictionary)
+    session.flush()
+    logger.info(f"Trained a {len(data)} byte body dictionary on {len(sample)} articles")
+    return dictionary
+
+def current_dictionary(session: Session) -> Optional[ArticleBodyDictionary]:
+    """
+    Get the dictionary new bodies are compressed with.
+
+    The first one is trained once settings.body_dictionary_samples bodies
+    are stored; until then bodies are compressed without a dictionary.
+    """
+    dictionary = session.exec(
+        select(ArticleBodyDictionary).order_by(col(ArticleBodyDictionary.id).desc()).limit(1)
+    ).first()
+    if dictionary is None:
+        stored = session.exec(select(func.count()).select_from(ArticleBody)).one()
+        if stored >= settings.body_dictionary_samples:
+            dictionary = train_body_dictionary(session)
+    return dictionary
+
+def move_inline_bodies(conn: Connection) -> int:
+    """
+    Move article bodies from the old article.content column into compressed
+    ArticleBody rows and drop the column.
+
+    Args:
+        conn: Connection inside the transaction the move should happen in
+
+    Returns:
+        Number of bodies moved
+    """
+    if "content" not in {column["name"] for column in inspect(conn).get_columns("article")}:
+        return 0
+
+    if conn.dialect.name == "sqlite":
+        # Triggers of the old search index reference the column
+        for trigger in ("article_fts_ai", "article_fts_ad", "article_fts_au"):
+            conn.execute(text(f"DROP TRIGGER IF EXISTS {trigger}"))
+
+    samples = conn.execute(
+        text("SELECT content FROM article ORDER BY random() LIMIT :limit"),
+        {"limit": settings.body_dictionary_samples}
+    ).scalars().all()
+    dictionary = train_dictionary(samples) if len(samples) >= settings.body_dictionary_samples else b""
+    dictionary_id = None
+    if dictionary:
+        dictionary_id = conn.execute(
+            ArticleBodyDictionary.__table__.insert().values(data=dictionary, created_at=datetime.utcnow())
+        ).inserted_primary_key[0]
+
+    moved = 0
+    last_id = 0
+    while True:
+        rows = conn.execute(
+            text("SELECT id, content FROM article WHERE id > :last_id ORDER BY id LIMIT :limit"),
+            {"last_id": last_id, "limit": BATCH_SIZE}
+        ).all()
+        if not rows:
+            break
+        conn.execute(
+            ArticleBody.__table__.insert(),
+            [
+                {"article_id": row.id, "dictionary_id": dictionary_id, "data": compress(row.content or "", dictionary)}
+                for row in rows
+            ]
+        )
+        moved += len(rows)
+        last_id = rows[-1].id
+
+    conn.execute(text("ALTER TABLE article DROP COLUMN content"))
+    logger.info(f"Moved {moved} article bodies out of the article table")
+    return moved
@@ -0,0 +1,236 @@
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from sqlalchemy import insert, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlmodel import Session, col, select
+
+from src.models.article import Article, ArticleBody, ArticleCreate, ArticleDuplicate, ArticleTopic
+from src.models.body import current_dictionary
+from src.models.compression import compress
+from src.utils.urls import url_hash
+
+# Rows per INSERT statement; SQLite allows 32766 bound parameters per statement
+BATCH_SIZE = 500
+
+# Databases whose INSERT supports ON CONFLICT ... DO NOTHING / DO UPDATE
+_ON_CONFLICT_INSERTS = {"sqlite": sqlite.insert, "postgresql": postgresql.insert}
+
+def _insert(session: Session, table: Any) -> Optional[Any]:
+    """Return an INSERT construct supporting ON CONFLICT, or None if the database has none."""
+    insert_on_conflict = _ON_CONFLICT_INSERTS.get(session.get_bind().dialect.name)
+    return insert_on_conflict(table) if insert_on_conflict else None
+
+def _insert_new(session: Session, table: Any, rows: List[Dict[str, Any]], keys: List[str]) -> List[Dict[str, Any]]:
+    """
+    Insert the rows whose unique ``keys`` are not stored yet and return them.
+
+    Portable stand-in for INSERT ... ON CONFLICT DO NOTHING: the stored keys
+    are selected first, so concurrent writers can still collide.
+    """
+    stored = {
+        tuple(row)
+        for row in session.execute(
+            select(*(getattr(table, key) for key in keys))
+            .where(col(getattr(table, keys[0])).in_({row[keys[0]] for row in rows}))
+        ).all()
+    }
+    new: Dict[Tuple[Any, ...], Dict[str, Any]] = {}
+    for row in rows:
+        key = tuple(row[key] for key in keys)
+        if key not in stored:
+            new.setdefault(key, row)
+    if new:
+        session.execute(insert(table), list(new.values()))
+    return list(new.values())
+
+def _batches(rows: List[Any], size: int) -> Iterable[List[Any]]:
+    for i in range(0, len(rows), size):
+        yield rows[i:i + size]
+
+def upsert_articles(
+    session: Session,
+    articles: List[ArticleCreate],
+    update_existing: bool = False,
+    batch_size: int = BATCH_SIZE
+) -> Dict[str, int]:
+    """
+    Insert articles in batches and return the row ID of every article.
+
+    Articles whose canonical URL is already stored map to the existing row.
+    The caller owns the transaction. Databases without ON CONFLICT support
+    take a slower path that selects stored URLs before inserting.
+
+    Args:
+        session: Open database session
+        articles: Articles to save
+        update_existing: Overwrite title, content and topic of rows that
+            already exist instead of keeping them unchanged
+        batch_size: Rows per statement
+
+    Returns:
+        Mapping of each article's URL to its row ID
+    """
+    now = datetime.utcnow()
+    rows: Dict[int, Dict[str, Any]] = {}
+    contents: Dict[int, str] = {}
+    urls_by_hash: Dict[int, List[str]] = {}
+    for article in articles:
+        url = str(article.url)
+        key = url_hash(url)
+        urls_by_hash.setdefault(key, []).append(url)
+        contents.setdefault(key, article.content)
+        rows.setdefault(key, {
+            "title": article.title,
+            "url": url,
+            "url_hash": key,
+            "publication_date": article.publication_date,
+            "source": article.source,
+            "topic": article.topic,
+            "created_at": now,
+            "updated_at": now,
+        })
+
+    ids: Dict[int, int] = {}
+    inserted: List[int] = []
+    existing: Dict[int, Dict[str, Any]] = {}
+    for batch in _batches(list(rows.values()), batch_size):
+        hashes = [row["url_hash"] for row in batch]
+        # Rows stored under another spelling of the same canonical URL
+        for row_id, key in session.exec(
+            select(Article.id, Article.url_hash).where(col(Article.url_hash).in_(hashes))
+        ).all():
+            ids.setdefault(key, row_id)
+        existing.update((row["url_hash"], row) for row in batch if row["url_hash"] in ids)
+
+        pending = [row for row in batch if row["url_hash"] not in ids]
+        if not pending:
+            continue
+        statement = _insert(session, Article)
+        if statement is None:
+            new_urls = {row["url"] for row in _insert_new(session, Article, pending, ["url"])}
+            inserted.extend(row["url_hash"] for row in pending if row["url"] in new_urls)
+            # Stored under the same URL without url_hash; their IDs are looked up below
+            existing.update((row["url_hash"], row) for row in pending if row["url"] not in new_urls)
+        else:
+            statement = statement.values(pending)
+            if update_existing:
+                statement = statement.on_conflict_do_update(
+                    index_elements=["url"],
+                    set_={
+                        "title": statement.excluded.title,
+                        "topic": statement.excluded.topic,
+                        "updated_at": statement.excluded.updated_at,
+                    }
+                )
+            else:
+                statement = statement.on_conflict_do_nothing(index_elements=["url"])
+            for row_id, key in session.execute(statement.returning(Article.id, Article.url_hash)).all():
+                ids[key] = row_id
+                inserted.append(key)
+
+        # DO NOTHING returns no row for a conflict, e.g. a row saved without url_hash;
+        # the portable path returns no rows at all
+        missing = [row["url"] for row in pending if row["url_hash"] not in ids]
+        if missing:
+            for row_id, url in session.exec(select(Article.id, Article.url).where(col(Article.url).in_(missing))).all():
+                ids[url_hash(url)] = row_id
+
+    if update_existing and existing:
+        session.execute(
+            update(Article),
+            [
+                {"id": ids[key], "title": row["title"], "topic": row["topic"], "updated_at": now}
+                for key, row in existing.items()
+            ]
+        )
+
+    written = list(ids) if update_existing else inserted
+    store_bodies(session, {ids[key]: contents[key] for key in written}, replace=update_existing, batch_size=batch_size)
+
+    return {url: ids[key] for key, urls in urls_by_hash.items() if key in ids for url in urls}
+
+def store_bodies(
+    session: Session,
+    bodies: Dict[int, str],
+    replace: bool = False,
+    batch_size: int = BATCH_SIZE
+) -> None:
+    """
+    Compress and store article bodies keyed by article ID.
+
+    Args:
+        session: Open database session
+        bodies: Text of each article
+        replace: Overwrite bodies that are already stored instead of keeping them
+        batch_size: Rows per statement
+    """
+    if not bodies:
+        return
+    dictionary = current_dictionary(session)
+    rows = [
+        {
+            "article_id": article_id,
+            "dictionary_id": dictionary.id if dictionary else None,
+            "data": compress(text, dictionary.data if dictionary else None),
+        }
+        for article_id, text in bodies.items()
+    ]
+    for batch in _batches(rows, batch_size):
+        statement = _insert(session, ArticleBody)
+        if statement is None:
+            new = {row["article_id"] for row in _insert_new(session, ArticleBody, batch, ["article_id"])}
+            stored = [row for row in batch if row["article_id"] not in new]
+            if replace and stored:
+                session.execute(update(ArticleBody), stored)
+            continue
+        statement = statement.values(batch)
+        if replace:
+            statement = statement.on_conflict_do_update(
+                index_elements=["article_id"],
+                set_={"dictionary_id": statement.excluded.dictionary_id, "data": statement.excluded.data}
+            )
+        else:
+            statement = statement.on_conflict_do_nothing(index_elements=["article_id"])
+        session.execute(statement)
+
+def link_topics(session: Session, links: List[Tuple[int, str]], batch_size: int = BATCH_SIZE) -> None:
+    """Record (article ID, topic) links, ignoring ones that already exist."""
+    for batch in _batches(list(dict.fromkeys(links)), batch_size):
+        dates = dict(session.execute(
+            select(Article.id, Article.publication_date)
+            .where(col(Article.id).in_({article_id for article_id, _ in batch}))
+        ).all())
+        rows = [
+            {"article_id": article_id, "topic": topic, "publication_date": dates[article_id]}
+            for article_id, topic in batch
+        ]
+        statement = _insert(session, ArticleTopic)
+        if statement is None:
+            _insert_new(session, ArticleTopic, rows, ["article_id", "topic"])
+        else:
+            session.execute(statement.values(rows).on_conflict_do_nothing())
+
+def record_duplicates(
+    session: Session,
+    duplicates: List[Tuple[int, ArticleCreate]],
+    batch_size: int = BATCH_SIZE
+) -> None:
+    """Record near-duplicate copies of saved articles, ignoring URLs already recorded."""
+    now = datetime.utcnow()
+    rows = {
+        str(member.url): {
+            "article_id": article_id,
+            "url": str(member.url),
+            "title": member.title,
+            "source": member.source,
+            "publication_date": member.publication_date,
+            "created_at": now,
+        }
+        for article_id, member in duplicates
+    }
+    for batch in _batches(list(rows.values()), batch_size):
+        statement = _insert(session, ArticleDuplicate)
+        if statement is None:
+            _insert_new(session, ArticleDuplicate, batch, ["url"])
+        else:
+            session.execute(statement.values(batch).on_conflict_do_nothing(index_elements=["url"]))
@@ -0,0 +1,63 @@
+import re
+import zlib
+from collections import Counter
+from typing import Iterable, Optional
+
+# zlib only looks 32 KiB back, so a longer preset dictionary would be wasted
+DICTIONARY_SIZE = 32 * 1024
+COMPRESSION_LEVEL = 6
+
+_SENTENCE = re.compile(r"[^.!?\n]+[.!?]?")
+
+def train_dictionary(samples: Iterable[str], size: int = DICTIONARY_SIZE) -> bytes:
+    """
+    Build a zlib preset dictionary from sample article bodies.
+
+    Sentences repeated across articles (bylines, newsletter prompts,
+    copyright lines) and common words are scored by how many bytes they
+    would save, and the best ones fill the dictionary. They go last,
+    where zlib reaches them with the shortest distances.
+
+    Args:
+        samples: Article bodies representative of what will be stored
+        size: Maximum dictionary size in bytes
+
+    Returns:
+        The dictionary, empty if the samples share nothing
+    """
+    sentences: Counter = Counter()
+    words: Counter = Counter()
+    for text in samples:
+        # Count each piece once per article: repeats within one article compress anyway
+        sentences.update({match.group().strip() for match in _SENTENCE.finditer(text)})
+        words.update(set(text.split()))
+
+    candidates = [
+        (count * len(sentence), sentence)
+        for sentence, count in sentences.items()
+        if count > 1 and len(sentence) >= 20
+    ]
+    candidates += [(count * len(word), f"{word} ") for word, count in words.items() if count > 1 and len(word) > 3]
+    candidates.sort(reverse=True)
+
+    chosen = []
+    remaining = size
+    for _, piece in candidates:
+        encoded = piece.encode()
+        if len(encoded) <= remaining:
+            chosen.append(encoded)
+            remaining -= len(encoded)
+    return b"".join(reversed(chosen))
+
+def compress(text: str, dictionary: Optional[bytes] = None) -> bytes:
+    """Compress text with zlib, optionally primed with a preset dictionary."""
+    if dictionary:
+        compressor = zlib.compressobj(COMPRESSION_LEVEL, zdict=dictionary)
+    else:
+        compressor = zlib.compressobj(COMPRESSION_LEVEL)
+    return compressor.compress(text.encode()) + compressor.flush()
+
+def decompress(data: bytes, dictionary: Optional[bytes] = None) -> str:
+    """Reverse compress(); the dictionary must be the one the data was compressed with."""
+    decompressor = zlib.decompressobj(zdict=dictionary) if dictionary else zlib.decompressobj()
+    return (decompressor.decompress(data) + decompressor.flush()).decode()
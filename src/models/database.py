@@ -1,22 +1,233 @@
-from contextlib import contextmanager
-from typing import Generator
+import asyncio
+from contextlib import asynccontextmanager, contextmanager
+from functools import lru_cache
+from typing import Any, AsyncGenerator, Callable, Dict, Generator, TypeVar
+from sqlalchemy import event, inspect, text
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 from sqlmodel import Session, SQLModel, create_engine
+from sqlmodel.ext.asyncio.session import AsyncSession
 from loguru import logger
+from src.models.body import move_inline_bodies
+from src.models.compression import decompress
 from src.utils.config import get_settings
+from src.utils.urls import url_hash
 
 settings = get_settings()
 
+T = TypeVar("T")
+
+# Async drivers for the synchronous URLs in settings.database_url
+ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+    "postgresql+psycopg2": "postgresql+asyncpg",
+}
+
+def _is_memory_database(url: URL) -> bool:
+    """Whether a SQLite URL points at an in-memory database."""
+    return url.database in (None, "", ":memory:") or url.query.get("mode") == "memory"
+
+def _engine_options(url: URL) -> Dict[str, Any]:
+    """Connection and pool options shared by the sync and async engines."""
+    options: Dict[str, Any] = {"echo": settings.debug}
+    if url.get_backend_name() == "sqlite":
+        options["connect_args"] = {"check_same_thread": False}  # Needed for SQLite
+        if _is_memory_database(url):
+            # In-memory databases live in a single connection, so there is no pool to size
+            return options
+    options.update(
+        pool_size=settings.database_pool_size,
+        max_overflow=settings.database_max_overflow,
+        pool_timeout=settings.database_pool_timeout,
+        pool_pre_ping=True
+    )
+    return options
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    """
+    Tune each new SQLite connection.
+    
+    WAL lets readers (the Streamlit app) work while the pipeline writes,
+    and synchronous=NORMAL is durable enough in WAL mode while skipping an
+    fsync per commit. busy_timeout makes a second writer wait instead of
+    failing with "database is locked".
+    """
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.execute(f"PRAGMA journal_mode={settings.sqlite_journal_mode}")
+        cursor.execute(f"PRAGMA synchronous={settings.sqlite_synchronous}")
+        cursor.execute(f"PRAGMA cache_size=-{settings.sqlite_cache_size_kib}")
+        cursor.execute(f"PRAGMA mmap_size={settings.sqlite_mmap_size}")
+        cursor.execute(f"PRAGMA busy_timeout={settings.sqlite_busy_timeout_ms}")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+    finally:
+        cursor.close()
+
+def _register_functions(dbapi_connection, connection_record) -> None:
+    """Register the SQL functions the search index needs on each new SQLite connection."""
+    dbapi_connection.create_function("article_body_text", 2, decompress, deterministic=True)
+
+_url = make_url(settings.database_url)
+
 # Create database engine
-engine = create_engine(
-    settings.database_url,
-    echo=settings.debug,
-    connect_args={"check_same_thread": False}  # Needed for SQLite
-)
+engine = create_engine(_url, **_engine_options(_url))
+if _url.get_backend_name() == "sqlite":
+    event.listen(engine, "connect", _set_sqlite_pragmas)
+    event.listen(engine, "connect", _register_functions)
+
+@lru_cache
+def get_async_engine() -> AsyncEngine:
+    """
+    Get the async engine for settings.database_url.
+    
+    Created on first use so the async driver (aiosqlite or asyncpg) is
+    only needed when settings.database_async is enabled.
+    """
+    url = _url.set(drivername=ASYNC_DRIVERS.get(_url.drivername, _url.drivername))
+    async_engine = create_async_engine(url, **_engine_options(url))
+    if url.get_backend_name() == "sqlite":
+        event.listen(async_engine.sync_engine, "connect", _set_sqlite_pragmas)
+        event.listen(async_engine.sync_engine, "connect", _register_functions)
+    return async_engine
+
+def _add_missing_columns() -> None:
+    """Add columns (and their indexes) that were introduced after a table was created."""
+    inspector = inspect(engine)
+    existing_tables = set(inspector.get_table_names())
+    with engine.begin() as conn:
+        for table in SQLModel.metadata.sorted_tables:
+            if table.name not in existing_tables:
+                continue
+            present = {column["name"] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in present:
+                    continue
+                column_type = column.type.compile(dialect=engine.dialect)
+                conn.execute(text(f'ALTER TABLE {table.name} ADD COLUMN "{column.name}" {column_type}'))
+                logger.info(f"Added column {table.name}.{column.name}")
+                for index in table.indexes:
+                    if column in index.columns.values():
+                        index.create(conn, checkfirst=True)
+
+def _add_missing_indexes() -> None:
+    """Create indexes that were declared after their table was created."""
+    existing_tables = set(inspect(engine).get_table_names())
+    with engine.begin() as conn:
+        for table in SQLModel.metadata.sorted_tables:
+            if table.name in existing_tables:
+                for index in table.indexes:
+                    index.create(conn, checkfirst=True)
+
+def _backfill_url_hashes() -> None:
+    """Compute the canonical URL hash of articles saved before the column existed."""
+    with engine.begin() as conn:
+        rows = conn.execute(text("SELECT id, url FROM article WHERE url_hash IS NULL")).all()
+        if rows:
+            conn.execute(
+                text("UPDATE article SET url_hash = :url_hash WHERE id = :id"),
+                [{"id": row.id, "url_hash": url_hash(row.url)} for row in rows]
+            )
+            logger.info(f"Backfilled URL hashes of {len(rows)} articles")
+
+def _backfill_topic_dates() -> None:
+    """Copy publication dates onto topic links saved before links carried them."""
+    with engine.begin() as conn:
+        updated = conn.execute(text(
+            "UPDATE articletopic SET publication_date = "
+            "(SELECT publication_date FROM article WHERE article.id = articletopic.article_id) "
+            "WHERE publication_date IS NULL"
+        )).rowcount
+        # Superseded by ix_articletopic_topic_publication_date_article_id
+        conn.execute(text("DROP INDEX IF EXISTS ix_articletopic_topic_article_id"))
+    if updated:
+        logger.info(f"Backfilled publication dates of {updated} topic links")
+
+def _move_article_bodies() -> None:
+    """Move bodies of articles saved before they got their own table."""
+    with engine.begin() as conn:
+        move_inline_bodies(conn)
+
+# FTS5 index over article titles and bodies. Bodies are compressed, so the index
+# reads them through a view that decompresses them with article_body_text(), and
+# triggers on both tables keep it in sync.
+SEARCH_TABLE = "article_fts"
+SEARCH_VIEW = "article_text"
+_SEARCH_SOURCE = f"SELECT id, title, content FROM {SEARCH_VIEW}"
+_SEARCH_DDL = [
+    f"""CREATE VIEW IF NOT EXISTS {SEARCH_VIEW} AS
+        SELECT article.id AS id, article.title AS title,
+               article_body_text(articlebody.data, articlebodydictionary.data) AS content
+        FROM article
+        JOIN articlebody ON articlebody.article_id = article.id
+        LEFT JOIN articlebodydictionary ON articlebodydictionary.id = articlebody.dictionary_id""",
+    f"""CREATE VIRTUAL TABLE IF NOT EXISTS {SEARCH_TABLE} USING fts5(
+        title, content, content='{SEARCH_VIEW}', content_rowid='id', tokenize='porter unicode61 remove_diacritics 2'
+    )""",
+    f"""CREATE TRIGGER IF NOT EXISTS articlebody_fts_ai AFTER INSERT ON articlebody BEGIN
+        INSERT INTO {SEARCH_TABLE}(rowid, title, content) {_SEARCH_SOURCE} WHERE id = new.article_id;
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS articlebody_fts_bu BEFORE UPDATE ON articlebody BEGIN
+        INSERT INTO {SEARCH_TABLE}({SEARCH_TABLE}, rowid, title, content) SELECT 'delete', id, title, content FROM {SEARCH_VIEW} WHERE id = old.article_id;
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS articlebody_fts_au AFTER UPDATE ON articlebody BEGIN
+        INSERT INTO {SEARCH_TABLE}(rowid, title, content) {_SEARCH_SOURCE} WHERE id = new.article_id;
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS articlebody_fts_bd BEFORE DELETE ON articlebody BEGIN
+        INSERT INTO {SEARCH_TABLE}({SEARCH_TABLE}, rowid, title, content) SELECT 'delete', id, title, content FROM {SEARCH_VIEW} WHERE id = old.article_id;
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS article_fts_title_bu BEFORE UPDATE OF title ON article BEGIN
+        INSERT INTO {SEARCH_TABLE}({SEARCH_TABLE}, rowid, title, content) SELECT 'delete', id, title, content FROM {SEARCH_VIEW} WHERE id = old.id;
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS article_fts_title_au AFTER UPDATE OF title ON article BEGIN
+        INSERT INTO {SEARCH_TABLE}(rowid, title, content) {_SEARCH_SOURCE} WHERE id = new.id;
+    END""",
+    # Dropping the body first takes the article out of the index while its title is still there
+    """CREATE TRIGGER IF NOT EXISTS article_body_bd BEFORE DELETE ON article BEGIN
+        DELETE FROM articlebody WHERE article_id = old.id;
+    END""",
+]
+
+def search_supported() -> bool:
+    """Whether full-text search is available (SQLite with FTS5)."""
+    return engine.dialect.name == "sqlite"
+
+def rebuild_search_index() -> None:
+    """Re-index every saved article, e.g. after restoring a backup without the index."""
+    with engine.begin() as conn:
+        conn.execute(text(f"INSERT INTO {SEARCH_TABLE}({SEARCH_TABLE}) VALUES ('rebuild')"))
+        conn.execute(text(f"INSERT INTO {SEARCH_TABLE}({SEARCH_TABLE}) VALUES ('optimize')"))
+    logger.info("Rebuilt the full-text search index")
+
+def _create_search_index() -> None:
+    """Create the full-text index and its triggers, indexing existing articles once."""
+    if not search_supported():
+        logger.warning(f"Full-text search needs SQLite, not {engine.dialect.name}")
+        return
+    with engine.begin() as conn:
+        definition = conn.execute(
+            text("SELECT sql FROM sqlite_master WHERE name = :name"), {"name": SEARCH_TABLE}
+        ).scalar()
+        # Indexes created before bodies moved out of the article table read article.content
+        if definition is not None and f"content='{SEARCH_VIEW}'" not in definition:
+            conn.execute(text(f"DROP TABLE {SEARCH_TABLE}"))
+            definition = None
+        created = definition is None
+        for statement in _SEARCH_DDL:
+            conn.execute(text(statement))
+    if created:
+        rebuild_search_index()
 
 def create_db_and_tables() -> None:
-    """Create database and tables."""
+    """Create database and tables, and bring existing tables up to date."""
     try:
         SQLModel.metadata.create_all(engine)
+        _add_missing_columns()
+        _add_missing_indexes()
+        _move_article_bodies()
+        _backfill_url_hashes()
+        _backfill_topic_dates()
+        _create_search_index()
         logger.info("Database and tables created successfully")
     except Exception as e:
         logger.error(f"Error creating database and tables: {e}")
@@ -34,3 +245,40 @@ def get_session() -> Generator[Session, None, None]:
         raise
     finally:
         session.close()
+
+@asynccontextmanager
+async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
+    """Get async database session."""
+    session = AsyncSession(get_async_engine(), expire_on_commit=False)
+    try:
+        yield session
+    except Exception as e:
+        logger.error(f"Database session error: {e}")
+        await session.rollback()
+        raise
+    finally:
+        await session.close()
+
+async def run_in_session(work: Callable[[Session], T]) -> T:
+    """
+    Run synchronous session code from async code.
+    
+    Either way the queries do not block the event loop: with
+    settings.database_async the code runs on the async engine, otherwise
+    on a regular session in a worker thread.
+    
+    Args:
+        work: Function taking a session
+        
+    Returns:
+        Whatever work returns
+    """
+    if settings.database_async:
+        async with get_async_session() as session:
+            return await session.run_sync(work)
+    
+    def run() -> T:
+        with get_session() as session:
+            return work(session)
+    
+    return await asyncio.to_thread(run)
@@ -0,0 +1,9 @@
+from datetime import datetime
+from sqlmodel import SQLModel, Field
+
+class ArticleEmbedding(SQLModel, table=True):
+    """Embedding vector of a saved article, stored as a float32 blob."""
+    article_id: int = Field(foreign_key="article.id", primary_key=True)
+    model: str = Field(primary_key=True)
+    vector: bytes
+    created_at: datetime = Field(default_factory=datetime.utcnow)
@@ -0,0 +1,44 @@
+"""
+Bring an existing database up to date.
+
+Runs the same upgrades as application start-up (new tables, columns and
+indexes, moving article bodies into the compressed body table,
+rebuilding the search index) and can then VACUUM SQLite to hand the
+space freed by the move back to the file system.
+
+Usage:
+    python -m src.models.migrate [--vacuum]
+"""
+import argparse
+from pathlib import Path
+from typing import Optional
+
+from loguru import logger
+
+from src.models.database import create_db_and_tables, engine
+
+def _database_size() -> Optional[int]:
+    """Size of the SQLite database file including its write-ahead log."""
+    if engine.dialect.name != "sqlite" or not engine.url.database:
+        return None
+    path = Path(engine.url.database)
+    return sum(file.stat().st_size for file in (path, path.with_name(f"{path.name}-wal")) if file.exists())
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--vacuum", action="store_true", help="Compact the SQLite file afterwards")
+    args = parser.parse_args()
+
+    before = _database_size()
+    create_db_and_tables()
+    if args.vacuum and engine.dialect.name == "sqlite":
+        with engine.connect() as conn:
+            conn.exec_driver_sql("VACUUM")
+            # In WAL mode the compacted copy is written to the log first
+            conn.exec_driver_sql("PRAGMA wal_checkpoint(TRUNCATE)")
+    after = _database_size()
+    if before is not None:
+        logger.info(f"Database size: {before / 2**20:.1f} MiB -> {after / 2**20:.1f} MiB")
+
+if __name__ == "__main__":
+    main()
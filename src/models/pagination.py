@@ -0,0 +1,59 @@
+import base64
+from datetime import datetime
+from typing import Any, List, NamedTuple, Optional, Tuple
+from sqlalchemy import tuple_
+
+from src.models.article import Article
+
+class ArticlePage(NamedTuple):
+    """One page of saved articles, newest first."""
+    articles: List[Article]
+    # Pass back to get the following page; None on the last page
+    next_cursor: Optional[str]
+
+def keyset_window(
+    query: Any,
+    published: Any,
+    key: Any,
+    position: Optional[Tuple[datetime, int]],
+    start_date: Optional[datetime],
+    end_date: Optional[datetime],
+    limit: int
+) -> Any:
+    """
+    Restrict a query to the rows of one page, newest first.
+    
+    Args:
+        query: Select to restrict
+        published: Publication date column the page is ordered by
+        key: Article ID column breaking ties between equal dates
+        position: Decoded cursor of the previous page, None for the first page
+        start_date: Optional start date
+        end_date: Optional end date
+        limit: Number of rows to fetch
+    """
+    if start_date:
+        query = query.where(published >= start_date)
+    if end_date:
+        query = query.where(published <= end_date)
+    if position:
+        query = query.where(tuple_(published, key) < tuple_(*position))
+    return query.order_by(published.desc(), key.desc()).limit(limit)
+
+def encode_cursor(article: Article) -> str:
+    """Encode the keyset position after an article as an opaque cursor."""
+    position = f"{article.publication_date.isoformat()}|{article.id}"
+    return base64.urlsafe_b64encode(position.encode()).decode()
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """
+    Decode a cursor returned by encode_cursor.
+    
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        published, article_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        return datetime.fromisoformat(published), int(article_id)
+    except Exception as e:
+        raise ValueError(f"Invalid page cursor: {cursor!r}") from e
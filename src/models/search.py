@@ -0,0 +1,54 @@
+import argparse
+import re
+from datetime import datetime
+from typing import NamedTuple, Optional
+
+from src.models.article import Article
+from src.models.database import create_db_and_tables, rebuild_search_index
+
+# bm25() column weights: a match in the title counts as much as ten in the body
+TITLE_WEIGHT = 10.0
+CONTENT_WEIGHT = 1.0
+
+_TERM = re.compile(r"\w+", re.UNICODE)
+
+class SearchFilters(NamedTuple):
+    """Restrictions applied on top of a full-text query."""
+    topic: Optional[str] = None
+    source: Optional[str] = None
+    start_date: Optional[datetime] = None
+    end_date: Optional[datetime] = None
+
+class SearchHit(NamedTuple):
+    """Saved article matching a full-text query."""
+    article: Article
+    # bm25() score; lower is better
+    score: float
+    # Best matching fragment with the matched terms in **bold**
+    snippet: str
+
+def match_query(text: str) -> Optional[str]:
+    """
+    Turn free text into an FTS5 query matching articles containing every word.
+    
+    Words are quoted so punctuation and FTS5 operators in user input cannot
+    produce a syntax error.
+    
+    Returns:
+        The MATCH expression, or None if the text has no words
+    """
+    terms = _TERM.findall(text)
+    if not terms:
+        return None
+    return " ".join(f'"{term}"' for term in terms)
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Maintain the full-text search index.")
+    parser.add_argument("command", choices=["rebuild"])
+    parser.parse_args()
+    
+    create_db_and_tables()
+    rebuild_search_index()
+
+if __name__ == "__main__":
+    main()
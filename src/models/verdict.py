@@ -0,0 +1,16 @@
+from datetime import datetime
+from typing import Optional
+from sqlalchemy import UniqueConstraint
+from sqlmodel import SQLModel, Field
+
+class RelevanceVerdict(SQLModel, table=True):
+    """Cached relevance verdict for an article's content and a topic."""
+    __table_args__ = (UniqueConstraint("content_hash", "topic", "model", "prompt_version"),)
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    content_hash: str = Field(index=True)
+    topic: str
+    model: str
+    prompt_version: str
+    relevant: bool
+    created_at: datetime = Field(default_factory=datetime.utcnow, index=True)
@@ -0,0 +1,15 @@
+from datetime import datetime
+from typing import Optional
+from sqlalchemy import UniqueConstraint
+from sqlmodel import SQLModel, Field
+
+class SourceWatermark(SQLModel, table=True):
+    """Latest publication date ingested per source, topic and collector."""
+    __table_args__ = (UniqueConstraint("source", "topic", "collector"),)
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    source: str = Field(index=True)
+    topic: str
+    collector: str
+    watermark: datetime
+    updated_at: datetime = Field(default_factory=datetime.utcnow)
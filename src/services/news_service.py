@@ -1,20 +1,38 @@
-from datetime import datetime
+import asyncio
+from datetime import datetime, timedelta
+from itertools import product
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 from loguru import logger
-from sqlmodel import select
+from sqlalchemy import column, func, literal_column, table, union
+from sqlmodel import Session, col, or_, select
 
 from src.collectors.collector import ArticleCollector
+from src.collectors.content import ContentFetcher
+from src.embeddings.index import EmbeddingIndex
 from src.filters.article_filter import ArticleFilter
+from src.filters.dedup import Cluster, NearDuplicateIndex
 from src.generators.pdf_generator import PDFGenerator
-from src.models.article import Article, ArticleCreate
-from src.models.database import get_session
+from src.models.article import Article, ArticleCreate, ArticleDuplicate, ArticleTopic
+from src.models.body import load_bodies, with_body
+from src.models.bulk import link_topics, record_duplicates, upsert_articles
+from src.models.database import SEARCH_TABLE, get_session, run_in_session, search_supported
+from src.models.pagination import ArticlePage, decode_cursor, encode_cursor, keyset_window
+from src.models.search import CONTENT_WEIGHT, TITLE_WEIGHT, SearchFilters, SearchHit, match_query
+from src.models.watermark import SourceWatermark
+from src.utils.bloom import BloomFilter
+from src.utils.config import get_settings
+from src.utils.dates import to_naive_utc
 from src.utils.exceptions import (
     ArticleCollectionError,
     ArticleFilterError,
     DatabaseError,
+    EmbeddingError,
     PDFGenerationError
 )
+from src.utils.urls import url_hash
+
+settings = get_settings()
 
 class NewsService:
     """Main service orchestrating the news automation workflow."""
@@ -23,6 +41,18 @@ class NewsService:
         """Initialize components."""
         self.collector = ArticleCollector()
         self.filter = ArticleFilter()
+        self.embeddings = EmbeddingIndex()
+        self.content_fetcher = ContentFetcher() if settings.enrichment_enabled else None
+        self.deduplicator: Optional[NearDuplicateIndex] = None
+        if settings.dedup_enabled:
+            self.deduplicator = NearDuplicateIndex(
+                threshold=settings.dedup_threshold,
+                window=timedelta(hours=settings.dedup_window_hours),
+                max_entries=settings.dedup_max_entries
+            )
+        self._dedup_seeded = False
+        self.known_urls = BloomFilter(settings.known_urls_capacity, settings.known_urls_error_rate)
+        self._warm_known_urls()
         self.pdf_generator = PDFGenerator()
     
     async def collect_and_filter_articles(
@@ -30,7 +60,9 @@ class NewsService:
         source: str,
         topic: str,
         start_date: Optional[datetime] = None,
-        end_date: Optional[datetime] = None
+        end_date: Optional[datetime] = None,
+        stream: bool = False,
+        incremental: bool = False
     ) -> List[Article]:
         """
         Collect and filter articles.
@@ -40,6 +72,9 @@ class NewsService:
             topic: Topic to filter by
             start_date: Optional start date
             end_date: Optional end date
+            stream: Filter each page of results while later pages download
+            incremental: Only request articles published after each
+                collector's watermark for this source and topic
             
         Returns:
             List of filtered articles
@@ -49,44 +84,424 @@ class NewsService:
             ArticleFilterError: If filtering fails
             DatabaseError: If database operations fail
         """
+        results = await self.collect_and_filter_topics(
+            source, [topic], start_date, end_date, stream, incremental
+        )
+        return results[topic]
+    
+    async def collect_and_filter_topics(
+        self,
+        source: str,
+        topics: List[str],
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        stream: bool = False,
+        incremental: bool = False
+    ) -> Dict[str, List[Article]]:
+        """
+        Collect articles once and filter them against several topics.
+        
+        Args:
+            source: News source domain
+            topics: Topics to filter by
+            start_date: Optional start date
+            end_date: Optional end date
+            stream: Filter each page of results while later pages download
+            incremental: Only request articles published after each
+                collector's watermark for this source and these topics
+            
+        Returns:
+            Saved articles per topic, newly saved and already known alike,
+            without their bodies (see load_content)
+            
+        Raises:
+            ArticleCollectionError: If collection fails
+            ArticleFilterError: If filtering fails
+            DatabaseError: If database operations fail
+        """
+        topics = list(dict.fromkeys(topics))
         try:
-            # Collect articles
-            articles = await self.collector.get(
-                source=source,
-                start_date=start_date,
-                end_date=end_date
-            )
+            since = await self._get_watermarks(source, topics) if incremental else None
+            self.collector.latest_published.pop(source, None)
             
-            # Filter articles
-            filtered_articles = await self.filter.filter(articles, topic)
+            if stream:
+                filtered_articles, duplicates, known_articles, undecided = await self._collect_and_filter_stream(
+                    source, topics, start_date, end_date, since
+                )
+            else:
+                # Collect articles
+                articles = await self.collector.get(
+                    source=source,
+                    start_date=start_date,
+                    end_date=end_date,
+                    since=since
+                )
+                
+                # Articles already stored for these topics need no classification
+                articles, known_articles = await self._drop_known(articles, topics)
+                if self.content_fetcher:
+                    articles = await self.content_fetcher.enrich(articles)
+                
+                # Classify one representative per near-duplicate cluster
+                representatives, duplicates = await self._deduplicate(articles)
+                
+                # Filter articles
+                filtered_articles, undecided = await self.filter.filter_topics_split(representatives, topics)
             
-            # Save to database
-            saved_articles = []
-            with get_session() as session:
-                for article in filtered_articles:
-                    try:
-                        article_dict = article.model_dump()
-                        article_dict["url"] = str(article_dict["url"])
-                        db_article = Article.model_validate(article_dict)
-                        # Check if article with same URL already exists
-                        existing_article = session.exec(select(Article).where(Article.url == db_article.url)).first()
-                        if existing_article is None:
-                            session.add(db_article)
-                            session.commit()
-                            session.refresh(db_article)
-                            saved_articles.append(db_article)
-                        else:
-                            saved_articles.append(existing_article)
-                            logger.info(f"Article with URL {db_article.url} already exists. Skipping insert.")
-                    except Exception as e:
-                        logger.warning(f"Failed to save article: {e}")
-                        session.rollback()
+            saved_articles = await self._save_articles(filtered_articles, duplicates)
+            await self._index_articles(
+                [article for articles in saved_articles.values() for article in articles]
+            )
+            for topic, articles in known_articles.items():
+                seen = {article.id for article in saved_articles[topic]}
+                for article in articles:
+                    if article.id not in seen:
+                        seen.add(article.id)
+                        saved_articles[topic].append(article)
+            
+            if incremental:
+                # Near-duplicates of an undecided article were not classified either
+                undecided += [member for article in undecided for member in duplicates.get(str(article.url), [])]
+                await self._advance_watermarks(source, topics, undecided)
             return saved_articles
             
         except Exception as e:
             logger.error(f"Failed to collect and filter articles: {e}")
             raise
     
+    def _warm_known_urls(self) -> None:
+        """Load the URL hashes of all saved articles into the Bloom filter."""
+        try:
+            with get_session() as session:
+                hashes = session.exec(select(Article.url_hash).where(Article.url_hash != None)).all()  # noqa: E711
+        except Exception as e:
+            logger.warning(f"Failed to load known article URLs: {e}")
+            return
+        self.known_urls.add_many(hashes)
+        logger.info(f"Loaded {len(hashes)} known article URLs")
+    
+    async def _drop_known(
+        self,
+        articles: List[ArticleCreate],
+        topics: List[str]
+    ) -> Tuple[List[ArticleCreate], Dict[str, List[Article]]]:
+        """
+        Split off articles that are already saved and linked to every requested topic.
+        
+        The Bloom filter rules out most new URLs without a query; possible
+        matches are confirmed against the database. Copies of the same
+        canonical URL within the batch are dropped too.
+        
+        Returns:
+            Tuple of the articles that still need classification and the
+            saved articles per topic for the known ones
+        """
+        known: Dict[str, List[Article]] = {topic: [] for topic in topics}
+        hashes: Dict[int, ArticleCreate] = {}
+        for article in articles:
+            hashes.setdefault(url_hash(str(article.url)), article)
+        maybe_known = [h for h, found in zip(hashes, self.known_urls.contains_many(hashes)) if found]
+        if not maybe_known:
+            return list(hashes.values()), known
+        
+        def lookup(session: Session) -> Tuple[List[Article], List[Tuple[int, str]]]:
+            rows = session.exec(select(Article).where(col(Article.url_hash).in_(maybe_known))).all()
+            links = session.exec(
+                select(ArticleTopic.article_id, ArticleTopic.topic).where(
+                    col(ArticleTopic.article_id).in_([row.id for row in rows])
+                )
+            ).all()
+            return rows, links
+        
+        try:
+            rows, links = await run_in_session(lookup)
+        except Exception as e:
+            logger.warning(f"Failed to look up known articles: {e}")
+            return list(hashes.values()), known
+        
+        linked: Dict[int, set] = {}
+        for article_id, topic in links:
+            linked.setdefault(article_id, set()).add(topic)
+        for row in rows:
+            row_topics = linked.get(row.id, set()) | {row.topic}
+            if set(topics) <= row_topics:
+                hashes.pop(row.url_hash, None)
+                for topic in topics:
+                    known[topic].append(row)
+        
+        skipped = len(articles) - len(hashes)
+        if skipped:
+            logger.info(f"Skipping {skipped} already saved or repeated articles")
+        return list(hashes.values()), known
+    
+    async def _deduplicate(
+        self,
+        articles: List[ArticleCreate]
+    ) -> Tuple[List[ArticleCreate], Dict[str, List[ArticleCreate]]]:
+        """
+        Group near-duplicate articles.
+        
+        Copies of a story saved by an earlier run are recorded as its
+        duplicates right away and need no classification. When the story
+        from an earlier run was not saved, its first new copy is classified
+        in its place.
+        
+        Returns:
+            Tuple of the cluster representatives and the other members of
+            each cluster keyed by the representative's URL
+        """
+        if self.deduplicator is None:
+            return articles, {}
+        if not self._dedup_seeded:
+            await self._seed_deduplicator()
+        clusters = self.deduplicator.group(articles)
+        
+        earlier = [cluster for cluster in clusters if cluster.earlier]
+        saved = await self._record_earlier_duplicates(earlier) if earlier else set()
+        representatives: List[ArticleCreate] = []
+        duplicates: Dict[str, List[ArticleCreate]] = {}
+        for cluster in clusters:
+            if cluster.earlier:
+                if str(cluster.representative.url) in saved:
+                    continue
+                cluster = Cluster(cluster.members[0], cluster.members[1:])
+            representatives.append(cluster.representative)
+            if cluster.members:
+                duplicates[str(cluster.representative.url)] = cluster.members
+        return representatives, duplicates
+    
+    async def _record_earlier_duplicates(self, clusters: List[Cluster]) -> set:
+        """
+        Record the members of clusters led by a saved article as its duplicates.
+        
+        Returns:
+            URLs of the representatives that are saved
+        """
+        by_hash = {url_hash(str(cluster.representative.url)): cluster for cluster in clusters}
+        
+        def record(session: Session) -> List[str]:
+            rows = session.exec(
+                select(Article.id, Article.url_hash).where(col(Article.url_hash).in_(list(by_hash)))
+            ).all()
+            saved = {h: article_id for article_id, h in rows}
+            record_duplicates(session, [
+                (article_id, member)
+                for h, article_id in saved.items()
+                for member in by_hash[h].members
+            ])
+            session.commit()
+            return [str(by_hash[h].representative.url) for h in saved]
+        
+        try:
+            saved = await run_in_session(record)
+        except Exception as e:
+            # Their copies are classified instead
+            logger.warning(f"Failed to record duplicates of saved articles: {e}")
+            return set()
+        if saved:
+            logger.info(f"Recorded copies of {len(saved)} already saved stories as duplicates")
+        return set(saved)
+    
+    async def _seed_deduplicator(self) -> None:
+        """Index recently saved articles so new copies of them are recognised."""
+        self._dedup_seeded = True
+        cutoff = datetime.utcnow() - timedelta(hours=settings.dedup_window_hours)
+        try:
+            recent = await run_in_session(lambda session: session.exec(
+                select(Article).where(Article.created_at >= cutoff).options(with_body())
+            ).all())
+        except Exception as e:
+            logger.warning(f"Failed to load recent articles for deduplication: {e}")
+            return
+        self.deduplicator.group([
+            ArticleCreate.model_validate({
+                **article.model_dump(exclude={"id", "created_at", "updated_at", "topic"}),
+                "content": article.content
+            })
+            for article in recent
+        ])
+    
+    async def _save_articles(
+        self,
+        filtered_articles: Dict[str, List[ArticleCreate]],
+        duplicates: Optional[Dict[str, List[ArticleCreate]]] = None
+    ) -> Dict[str, List[Article]]:
+        """Save each relevant article once, linked to its topics and its near-duplicates."""
+        matches: Dict[str, Tuple[ArticleCreate, List[str]]] = {}
+        for topic, articles in filtered_articles.items():
+            for article in articles:
+                matches.setdefault(str(article.url), (article, []))[1].append(topic)
+        
+        if not matches:
+            return {topic: [] for topic in filtered_articles}
+        
+        def write(session: Session) -> Tuple[Dict[str, int], List[Article]]:
+            # One transaction: batched inserts, then the topic and duplicate links
+            ids = upsert_articles(session, [article for article, _ in matches.values()])
+            link_topics(session, [(ids[url], topic) for url, (_, topics) in matches.items() for topic in topics])
+            record_duplicates(session, [
+                (ids[url], member)
+                for url, members in (duplicates or {}).items()
+                if url in ids
+                for member in members
+                if str(member.url) != url
+            ])
+            session.commit()
+            
+            return ids, session.exec(select(Article).where(col(Article.id).in_(set(ids.values())))).all()
+        
+        try:
+            ids, rows = await run_in_session(write)
+        except Exception as e:
+            logger.error(f"Failed to save articles: {e}")
+            raise DatabaseError("Failed to save articles") from e
+        
+        self.known_urls.add_many(row.url_hash for row in rows if row.url_hash is not None)
+        by_id = {row.id: row for row in rows}
+        logger.info(f"Saved {len(matches)} articles")
+        return {
+            topic: [by_id[ids[str(article.url)]] for article in articles if str(article.url) in ids]
+            for topic, articles in filtered_articles.items()
+        }
+    
+    async def _index_articles(self, articles: List[Article]) -> None:
+        """Add newly saved articles to the embedding index; failures only cost search coverage."""
+        try:
+            await self.embeddings.add(articles)
+        except Exception as e:
+            logger.warning(f"Failed to embed saved articles: {e}")
+    
+    async def _collect_and_filter_stream(
+        self,
+        source: str,
+        topics: List[str],
+        start_date: Optional[datetime],
+        end_date: Optional[datetime],
+        since: Optional[Dict[str, datetime]] = None
+    ) -> Tuple[
+        Dict[str, List[ArticleCreate]],
+        Dict[str, List[ArticleCreate]],
+        Dict[str, List[Article]],
+        List[ArticleCreate]
+    ]:
+        """
+        Filter collected pages as they arrive instead of after the last one.
+        
+        Returns:
+            Tuple of the relevant articles per topic, the near-duplicates per
+            representative URL, the already saved articles per topic and the
+            articles left without a verdict
+        """
+        tasks = []
+        duplicates: Dict[str, List[ArticleCreate]] = {}
+        known: Dict[str, List[Article]] = {topic: [] for topic in topics}
+        submitted = set()
+        try:
+            async for page in self.collector.stream(
+                source=source,
+                start_date=start_date,
+                end_date=end_date,
+                since=since
+            ):
+                page, page_known = await self._drop_known(page, topics)
+                for topic, articles in page_known.items():
+                    known[topic].extend(articles)
+                if self.content_fetcher:
+                    page = await self.content_fetcher.enrich(page)
+                representatives, page_duplicates = await self._deduplicate(page)
+                for url, members in page_duplicates.items():
+                    duplicates.setdefault(url, []).extend(members)
+                # A story seen on an earlier page is already being classified
+                representatives = [article for article in representatives if str(article.url) not in submitted]
+                submitted.update(str(article.url) for article in representatives)
+                tasks.append(asyncio.create_task(self.filter.filter_topics_split(representatives, topics)))
+            pages = await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+        filtered = {topic: [article for relevant, _ in pages for article in relevant[topic]] for topic in topics}
+        undecided = [article for _, page_undecided in pages for article in page_undecided]
+        return filtered, duplicates, known, undecided
+    
+    async def _get_watermarks(self, source: str, topics: List[str]) -> Dict[str, datetime]:
+        """
+        Load the per-collector watermarks for a source and topics.
+        
+        A collector only gets a watermark when every topic has one, and then
+        the oldest, so a shared collection run covers all topics.
+        """
+        try:
+            rows = await run_in_session(lambda session: session.exec(
+                select(SourceWatermark).where(
+                    SourceWatermark.source == source,
+                    col(SourceWatermark.topic).in_(topics)
+                )
+            ).all())
+            per_collector: Dict[str, List[datetime]] = {}
+            for row in rows:
+                per_collector.setdefault(row.collector, []).append(row.watermark)
+            return {
+                collector: min(watermarks)
+                for collector, watermarks in per_collector.items()
+                if len(watermarks) == len(topics)
+            }
+        except Exception as e:
+            logger.error(f"Failed to load watermarks for {source}: {e}")
+            raise DatabaseError("Failed to load collection watermarks") from e
+    
+    async def _advance_watermarks(
+        self,
+        source: str,
+        topics: List[str],
+        undecided: Optional[List[ArticleCreate]] = None
+    ) -> None:
+        """
+        Persist the newest publication date each collector returned in this run.
+        
+        Articles left without a verdict (e.g. during an API outage) must be
+        collected again, so the watermarks stop just before the oldest of them.
+        """
+        latest = self.collector.latest_published.pop(source, {})
+        if undecided:
+            # Collectors fetch from the watermark onwards, so this one is re-fetched
+            limit = min(to_naive_utc(article.publication_date) for article in undecided) - timedelta(seconds=1)
+            latest = {collector: min(published, limit) for collector, published in latest.items()}
+            logger.warning(
+                f"{len(undecided)} articles from {source} have no verdict; "
+                f"watermarks advance no further than {limit}"
+            )
+        
+        def write(session: Session) -> None:
+            for topic, (collector, published) in product(topics, latest.items()):
+                watermark = session.exec(
+                    select(SourceWatermark).where(
+                        SourceWatermark.source == source,
+                        SourceWatermark.topic == topic,
+                        SourceWatermark.collector == collector
+                    )
+                ).first()
+                if watermark is None:
+                    watermark = SourceWatermark(
+                        source=source,
+                        topic=topic,
+                        collector=collector,
+                        watermark=published
+                    )
+                elif published > watermark.watermark:
+                    watermark.watermark = published
+                    watermark.updated_at = datetime.utcnow()
+                else:
+                    continue
+                session.add(watermark)
+            session.commit()
+        
+        try:
+            await run_in_session(write)
+        except Exception as e:
+            logger.error(f"Failed to advance watermarks for {source}: {e}")
+            raise DatabaseError("Failed to save collection watermarks") from e
+    
     def get_saved_articles(
         self,
         topic: Optional[str] = None,
@@ -102,7 +517,7 @@ class NewsService:
             end_date: Optional end date
             
         Returns:
-            List of articles
+            List of articles without their bodies (see load_content)
             
         Raises:
             DatabaseError: If database query fails
@@ -112,7 +527,8 @@ class NewsService:
                 query = select(Article)
                 
                 if topic:
-                    query = query.where(Article.topic == topic)
+                    linked = select(ArticleTopic.article_id).where(ArticleTopic.topic == topic)
+                    query = query.where(or_(Article.topic == topic, col(Article.id).in_(linked)))
                 if start_date:
                     query = query.where(Article.publication_date >= start_date)
                 if end_date:
@@ -124,6 +540,257 @@ class NewsService:
             logger.error(f"Failed to get articles from database: {e}")
             raise DatabaseError("Failed to query database") from e
     
+    def get_articles_page(
+        self,
+        topic: Optional[str] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        cursor: Optional[str] = None,
+        limit: int = 50,
+        include_content: bool = False
+    ) -> ArticlePage:
+        """
+        Get one page of saved articles, newest first.
+        
+        Pages are keyed on (publication_date, id) rather than an offset, so
+        every page costs the same however deep into the archive it is, and
+        topic pages cost the same however rare the topic is.
+        
+        Args:
+            topic: Optional topic filter
+            start_date: Optional start date
+            end_date: Optional end date
+            cursor: next_cursor of the previous page, None for the first page
+            limit: Maximum number of articles on the page
+            include_content: Load article bodies; otherwise call
+                load_content() before reading content of the returned articles
+            
+        Returns:
+            The page of articles and the cursor of the next page
+            
+        Raises:
+            ValueError: If the cursor is malformed
+            DatabaseError: If database query fails
+        """
+        position = decode_cursor(cursor) if cursor else None
+        try:
+            with get_session() as session:
+                window = dict(position=position, start_date=start_date, end_date=end_date, limit=limit + 1)
+                if topic:
+                    # Articles of a topic are those whose primary topic it is and those linked
+                    # to it. Each branch walks its own (topic, publication_date, id) index in
+                    # page order and stops after one page; the union of the two is merged.
+                    primary = keyset_window(
+                        select(col(Article.publication_date).label("published"), col(Article.id).label("id"))
+                        .where(Article.topic == topic),
+                        col(Article.publication_date), col(Article.id), **window
+                    ).subquery()
+                    linked = keyset_window(
+                        select(col(ArticleTopic.publication_date).label("published"), col(ArticleTopic.article_id).label("id"))
+                        .where(ArticleTopic.topic == topic),
+                        col(ArticleTopic.publication_date), col(ArticleTopic.article_id), **window
+                    ).subquery()
+                    page = union(select(primary), select(linked)).subquery()
+                    query = select(Article).join(page, page.c.id == Article.id).order_by(
+                        page.c.published.desc(), page.c.id.desc()
+                    ).limit(limit + 1)
+                else:
+                    query = keyset_window(select(Article), col(Article.publication_date), col(Article.id), **window)
+                
+                if include_content:
+                    query = query.options(with_body())
+                articles = session.exec(query).all()
+        except Exception as e:
+            logger.error(f"Failed to get articles from database: {e}")
+            raise DatabaseError("Failed to query database") from e
+        
+        if len(articles) > limit:
+            return ArticlePage(articles[:limit], encode_cursor(articles[limit - 1]))
+        return ArticlePage(articles, None)
+    
+    def search(
+        self,
+        query: str,
+        filters: Optional[SearchFilters] = None,
+        limit: int = 20
+    ) -> List[SearchHit]:
+        """
+        Full-text search over the titles and bodies of saved articles.
+        
+        Args:
+            query: Words to search for; articles must contain all of them
+            filters: Optional topic, source and date restrictions
+            limit: Maximum number of results
+            
+        Returns:
+            Matching articles without their bodies (see load_content), best
+            BM25 score first, with a snippet each
+            
+        Raises:
+            DatabaseError: If full-text search is unavailable or the query fails
+        """
+        match = match_query(query)
+        if match is None:
+            return []
+        if not search_supported():
+            raise DatabaseError("Full-text search requires a SQLite database")
+        filters = filters or SearchFilters()
+        
+        index = table(SEARCH_TABLE, column("rowid"))
+        matches = literal_column(SEARCH_TABLE).op("MATCH")(match)
+        score = func.bm25(literal_column(SEARCH_TABLE), TITLE_WEIGHT, CONTENT_WEIGHT)
+        snippet = func.snippet(literal_column(SEARCH_TABLE), -1, "**", "**", "…", 24)
+        try:
+            with get_session() as session:
+                def restrict(statement):
+                    statement = statement.join(Article, Article.id == index.c.rowid).where(matches)
+                    if filters.topic:
+                        linked = select(ArticleTopic.id).where(
+                            ArticleTopic.article_id == Article.id,
+                            ArticleTopic.topic == filters.topic
+                        ).exists()
+                        statement = statement.where(or_(Article.topic == filters.topic, linked))
+                    if filters.source:
+                        statement = statement.where(Article.source == filters.source)
+                    if filters.start_date:
+                        statement = statement.where(Article.publication_date >= filters.start_date)
+                    if filters.end_date:
+                        statement = statement.where(Article.publication_date <= filters.end_date)
+                    return statement
+                
+                # BM25 has to score every match before sorting, so broad queries are
+                # limited to the newest candidates that pass the filters; walking
+                # matches by rowid is cheap
+                cutoff = session.exec(
+                    restrict(select(index.c.rowid)).order_by(index.c.rowid.desc())
+                    .offset(settings.search_max_candidates - 1).limit(1)
+                ).first() or 0
+                
+                ranked = (
+                    restrict(select(index.c.rowid, score))
+                    .where(index.c.rowid >= cutoff)
+                    .order_by(score)
+                    .limit(limit)
+                )
+                scores = dict(session.exec(ranked).all())
+                if not scores:
+                    return []
+                
+                # Snippets only for the returned page
+                rows = session.exec(
+                    select(Article, snippet)
+                    .join(index, index.c.rowid == Article.id)
+                    .where(matches, col(index.c.rowid).in_(scores))
+                ).all()
+        except Exception as e:
+            logger.error(f"Full-text search for {query!r} failed: {e}")
+            raise DatabaseError("Failed to search articles") from e
+        
+        hits = [SearchHit(article, scores[article.id], hit_snippet) for article, hit_snippet in rows]
+        return sorted(hits, key=lambda hit: hit.score)
+    
+    async def find_similar(self, text: str, k: int = 10) -> List[Tuple[Article, float]]:
+        """
+        Find saved articles semantically close to a text such as a topic.
+        
+        Args:
+            text: Query text
+            k: Number of results
+            
+        Returns:
+            List of (article without its body, cosine similarity), most
+            similar first
+            
+        Raises:
+            EmbeddingError: If embedding or searching fails
+        """
+        try:
+            if not self.embeddings.loaded:
+                await self.embeddings.load()
+            query = (await self.embeddings.embedder.embed([text]))[0]
+            return await self._load_hits(self.embeddings.search(query, k))
+        except Exception as e:
+            logger.error(f"Similarity search failed: {e}")
+            raise EmbeddingError("Failed to search similar articles") from e
+    
+    async def find_similar_to_article(self, article_id: int, k: int = 10) -> List[Tuple[Article, float]]:
+        """
+        Find saved articles semantically close to a saved article.
+        
+        Args:
+            article_id: ID of the saved article
+            k: Number of results, not counting the article itself
+            
+        Returns:
+            List of (article without its body, cosine similarity), most
+            similar first
+            
+        Raises:
+            EmbeddingError: If the article is not indexed or searching fails
+        """
+        try:
+            if not self.embeddings.loaded:
+                await self.embeddings.load()
+            query = self.embeddings.vector_of(article_id)
+            if query is None:
+                raise EmbeddingError(f"Article {article_id} has no embedding")
+            return await self._load_hits(self.embeddings.search(query, k, exclude=[article_id]))
+        except EmbeddingError:
+            raise
+        except Exception as e:
+            logger.error(f"Similarity search failed: {e}")
+            raise EmbeddingError("Failed to search similar articles") from e
+    
+    async def _load_hits(self, hits: List[Tuple[int, float]]) -> List[Tuple[Article, float]]:
+        """Fetch the articles of search hits without their bodies, keeping the ranking."""
+        articles = await run_in_session(lambda session: session.exec(
+            select(Article).where(col(Article.id).in_([article_id for article_id, _ in hits]))
+        ).all())
+        by_id = {article.id: article for article in articles}
+        return [(by_id[article_id], score) for article_id, score in hits if article_id in by_id]
+    
+    def get_duplicates(self, article_id: int) -> List[ArticleDuplicate]:
+        """
+        Get the near-duplicate copies recorded for a saved article.
+        
+        Args:
+            article_id: ID of the saved article
+            
+        Returns:
+            List of duplicates
+            
+        Raises:
+            DatabaseError: If database query fails
+        """
+        try:
+            with get_session() as session:
+                return session.exec(
+                    select(ArticleDuplicate).where(ArticleDuplicate.article_id == article_id)
+                ).all()
+        except Exception as e:
+            logger.error(f"Failed to get duplicates of article {article_id}: {e}")
+            raise DatabaseError("Failed to query database") from e
+    
+    def load_content(self, articles: List[Article]) -> None:
+        """
+        Load the bodies of articles fetched without them, e.g. from a listing.
+        
+        Listings and search results leave bodies unloaded, so only the
+        articles that are displayed or exported pay for reading them.
+        
+        Args:
+            articles: Saved articles; ones with a loaded body are skipped
+            
+        Raises:
+            DatabaseError: If database query fails
+        """
+        try:
+            with get_session() as session:
+                load_bodies(session, articles)
+        except Exception as e:
+            logger.error(f"Failed to load article bodies: {e}")
+            raise DatabaseError("Failed to query database") from e
+    
     def generate_pdf_report(self, articles: List[Article], topic: str) -> Path:
         """
         Generate PDF report for articles.
@@ -136,8 +803,10 @@ class NewsService:
             Path to generated PDF
             
         Raises:
+            DatabaseError: If loading article bodies fails
             PDFGenerationError: If PDF generation fails
         """
+        self.load_content(articles)
         try:
             return self.pdf_generator.generate_articles_pdf(articles, topic)
         except Exception as e:
@@ -0,0 +1,60 @@
+import asyncio
+import atexit
+import threading
+from typing import Awaitable, Optional, TypeVar
+
+from loguru import logger
+
+from src.utils.http import close_http_client
+
+T = TypeVar("T")
+
+class BackgroundLoop:
+    """
+    Event loop running in a daemon thread for the lifetime of the process.
+
+    Synchronous callers such as the Streamlit script submit coroutines here
+    instead of calling ``asyncio.run``, which would start a fresh loop each
+    time. On one long-lived loop the pooled HTTP client keeps its keep-alive
+    connections between calls, and the asyncio primitives of long-lived
+    services stay bound to the loop that created them.
+    """
+
+    def __init__(self):
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def _ensure_started(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(
+                    target=self._loop.run_forever, name="background-event-loop", daemon=True
+                )
+                self._thread.start()
+                logger.debug("Started background event loop")
+            return self._loop
+
+    def run(self, coroutine: Awaitable[T]) -> T:
+        """Run a coroutine on the background loop and wait for its result."""
+        loop = self._ensure_started()
+        return asyncio.run_coroutine_threadsafe(coroutine, loop).result()
+
+    def close(self) -> None:
+        """Close the loop's HTTP client and stop the loop."""
+        with self._lock:
+            loop, self._loop = self._loop, None
+        if loop is None:
+            return
+        asyncio.run_coroutine_threadsafe(close_http_client(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        self._thread.join()
+        loop.close()
+
+_background = BackgroundLoop()
+atexit.register(_background.close)
+
+def run_in_background(coroutine: Awaitable[T]) -> T:
+    """Run a coroutine on the shared background loop from synchronous code."""
+    return _background.run(coroutine)
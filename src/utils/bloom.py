@@ -0,0 +1,57 @@
+import math
+from typing import Iterable
+import numpy as np
+
+class BloomFilter:
+    """
+    Bloom filter over 64-bit integer hashes.
+
+    Bit positions are derived from the hash by double hashing, so callers
+    hash their keys once (e.g. with ``url_hash``) and the filter never
+    rehashes strings.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        """
+        Initialize an empty filter.
+
+        Args:
+            capacity: Number of keys the filter is sized for
+            error_rate: False positive rate at ``capacity`` keys
+        """
+        self.size = max(64, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.num_hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = np.zeros((self.size + 7) // 8, dtype=np.uint8)
+        self.count = 0
+
+    def _positions(self, hashes: np.ndarray) -> np.ndarray:
+        values = hashes.astype(np.uint64)
+        low = values & np.uint64(0xFFFFFFFF)
+        high = (values >> np.uint64(32)) | np.uint64(1)
+        steps = np.arange(self.num_hashes, dtype=np.uint64)
+        return (low[:, None] + steps[None, :] * high[:, None]) % np.uint64(self.size)
+
+    def add_many(self, hashes: Iterable[int]) -> None:
+        """Add hashes to the filter."""
+        values = np.fromiter(hashes, dtype=np.int64)
+        if not len(values):
+            return
+        positions = self._positions(values).ravel()
+        np.bitwise_or.at(self.bits, positions >> np.uint64(3), (1 << (positions & np.uint64(7))).astype(np.uint8))
+        self.count += len(values)
+
+    def add(self, value: int) -> None:
+        """Add one hash to the filter."""
+        self.add_many([value])
+
+    def contains_many(self, hashes: Iterable[int]) -> np.ndarray:
+        """Return a boolean array telling which hashes may have been added."""
+        values = np.fromiter(hashes, dtype=np.int64)
+        if not len(values):
+            return np.zeros(0, dtype=bool)
+        positions = self._positions(values)
+        bits = (self.bits[positions >> np.uint64(3)] >> (positions & np.uint64(7)).astype(np.uint8)) & 1
+        return bits.all(axis=1)
+
+    def __contains__(self, value: int) -> bool:
+        return bool(self.contains_many([value])[0])
@@ -1,6 +1,6 @@
 from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import HttpUrl, validator
 
@@ -14,6 +14,22 @@ class Settings(BaseSettings):
     
     # Database
     database_url: str = "sqlite:///./news_automation.db"
+    # Run the pipeline's queries on an async engine (aiosqlite / asyncpg) instead
+    # of blocking the event loop
+    database_async: bool = False
+    database_pool_size: int = 5
+    database_max_overflow: int = 10
+    database_pool_timeout: int = 30
+    # SQLite pragmas, applied to every connection (cache size in KiB)
+    sqlite_journal_mode: str = "WAL"
+    sqlite_synchronous: str = "NORMAL"
+    sqlite_cache_size_kib: int = 64_000
+    sqlite_mmap_size: int = 256 * 1024 * 1024
+    sqlite_busy_timeout_ms: int = 5000
+    # Article bodies are compressed with a dictionary trained on this many stored bodies
+    body_dictionary_samples: int = 1000
+    # Full-text queries matching more articles (after filters) only rank the most recently saved ones
+    search_max_candidates: int = 10_000
     
     # Application
     debug: bool = False
@@ -29,11 +45,85 @@ class Settings(BaseSettings):
     openai_timeout: int = 30
     max_retries: int = 3
     retry_delay: int = 1
+    http_max_connections: int = 100
+    http_max_keepalive_connections: int = 20
+    http_max_connections_per_host: int = 10
+    
+    # Provider rate limits (requests per second, burst size, requests per UTC day; 0 = no daily cap)
+    news_api_rate_per_second: float = 1.0
+    news_api_burst: int = 5
+    news_api_daily_quota: int = 100
+    news_data_rate_per_second: float = 0.5
+    news_data_burst: int = 5
+    news_data_daily_quota: int = 200
+    rate_limit_pause: int = 60
+    
+    # Collection
+    collector_max_concurrency: int = 5
+    collector_hedging: bool = False
+    collector_hedge_delay: float = 2.0
+    collector_failure_threshold: int = 3
+    collector_circuit_cooldown: int = 300
+    collector_sharding: bool = True
+    collector_shard_days: int = 1
+    collector_shard_threshold_days: int = 2
+    collector_shard_result_cap: int = 100
+    collector_min_shard_hours: int = 1
+    collector_cache_enabled: bool = True
+    collector_cache_path: Path = base_dir / "cache" / "collector_responses.db"
+    collector_cache_max_entries: int = 5000
+    collector_cache_ttl_recent: int = 900
+    collector_cache_ttl_past: int = 30 * 24 * 3600
+    feed_cache_path: Path = base_dir / "cache" / "feeds.db"
+    feed_discovery_ttl: int = 7 * 24 * 3600
+    enrichment_enabled: bool = False
+    enrichment_concurrency: int = 50
+    enrichment_min_length: int = 1000
+    enrichment_max_bytes: int = 2_000_000
+    enrichment_cache_path: Path = base_dir / "cache" / "article_content.db"
+    enrichment_cache_ttl: int = 24 * 3600
     
     # OpenAI Configuration
     openai_model: str = "gpt-4o"
     max_tokens: int = 100
     temperature: float = 0.3
+    filter_initial_concurrency: int = 4
+    filter_min_concurrency: int = 1
+    filter_max_concurrency: int = 32
+    filter_latency_target: float = 10.0
+    filter_backoff_cooldown: float = 5.0
+    filter_batch_size: int = 10
+    filter_batch_tokens_per_article: int = 16
+    # Cascade: answer with filter_cheap_model first and escalate answers whose
+    # probability is below filter_cascade_confidence to openai_model
+    filter_cascade_enabled: bool = False
+    filter_cheap_model: str = "gpt-4o-mini"
+    filter_cascade_confidence: float = 0.9
+    # Lexical pre-filter (opt-in): normalised BM25 scores below/above the
+    # thresholds are rejected/accepted without a model call. Keyword matching
+    # misses paraphrases, so enabling it trades some recall for fewer calls
+    filter_prefilter_enabled: bool = False
+    filter_reject_threshold: float = 0.05
+    filter_accept_threshold: float = 0.5
+    filter_topic_terms: Dict[str, List[str]] = {}
+    verdict_cache_enabled: bool = True
+    verdict_cache_ttl_days: int = 30
+    verdict_cache_max_entries: int = 100_000
+    
+    # Bloom filter of saved article URLs (false positives are checked in the database)
+    known_urls_capacity: int = 1_000_000
+    known_urls_error_rate: float = 0.001
+    
+    # Near-duplicate detection (estimated Jaccard similarity of word 3-grams)
+    dedup_enabled: bool = True
+    dedup_threshold: float = 0.6
+    dedup_window_hours: int = 48
+    dedup_max_entries: int = 50_000
+    
+    # Embeddings ("hashing" runs locally, "openai" uses embedding_model)
+    embedding_provider: str = "hashing"
+    embedding_model: str = "text-embedding-3-small"
+    embedding_dim: int = 256
     
     @validator("pdf_export_dir")
     def create_export_dir(cls, v: Path) -> Path:
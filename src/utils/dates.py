@@ -0,0 +1,7 @@
+from datetime import datetime, timezone
+
+def to_naive_utc(value: datetime) -> datetime:
+    """Convert a datetime to naive UTC, the form stored in the database."""
+    if value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
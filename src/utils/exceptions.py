@@ -6,6 +6,10 @@ class ArticleCollectionError(NewsAutomationError):
     """Raised when article collection fails."""
     pass
 
+class QuotaExceededError(ArticleCollectionError):
+    """Raised when a provider's request quota is exhausted."""
+    pass
+
 class ArticleFilterError(NewsAutomationError):
     """Raised when article filtering fails."""
     pass
@@ -17,3 +21,7 @@ class PDFGenerationError(NewsAutomationError):
 class DatabaseError(NewsAutomationError):
     """Raised when database operations fail."""
     pass
+
+class EmbeddingError(NewsAutomationError):
+    """Raised when computing or searching embeddings fails."""
+    pass
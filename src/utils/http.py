@@ -0,0 +1,92 @@
+import asyncio
+import weakref
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Optional
+from urllib.parse import urlsplit
+
+import httpx
+from loguru import logger
+
+from src.utils.config import get_settings
+
+settings = get_settings()
+
+class PooledHTTPClient:
+    """Async HTTP client with keep-alive pooling and per-host connection limits."""
+
+    def __init__(
+        self,
+        timeout: Optional[float] = None,
+        max_connections: Optional[int] = None,
+        max_keepalive_connections: Optional[int] = None,
+        max_connections_per_host: Optional[int] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None
+    ):
+        """
+        Initialize the underlying httpx client.
+
+        Args:
+            timeout: Request timeout in seconds (defaults to ``news_api_timeout``)
+            max_connections: Total connection limit across all hosts
+            max_keepalive_connections: Idle connections kept open for reuse
+            max_connections_per_host: Concurrent requests allowed per host
+            transport: Optional transport, e.g. ``httpx.MockTransport`` in tests
+        """
+        self.max_connections_per_host = max_connections_per_host or settings.http_max_connections_per_host
+        self.client = httpx.AsyncClient(
+            timeout=httpx.Timeout(timeout or settings.news_api_timeout),
+            limits=httpx.Limits(
+                max_connections=max_connections or settings.http_max_connections,
+                max_keepalive_connections=max_keepalive_connections or settings.http_max_keepalive_connections
+            ),
+            follow_redirects=True,
+            transport=transport
+        )
+        self._host_slots: Dict[str, asyncio.Semaphore] = {}
+
+    @asynccontextmanager
+    async def _host_slot(self, url: str) -> AsyncIterator[None]:
+        """Hold one of the per-host connection slots for ``url``."""
+        host = urlsplit(url).netloc.lower()
+        if host not in self._host_slots:
+            self._host_slots[host] = asyncio.Semaphore(self.max_connections_per_host)
+        async with self._host_slots[host]:
+            yield
+
+    async def get(self, url: str, **kwargs) -> httpx.Response:
+        """Send a GET request and return the fully read response."""
+        async with self._host_slot(url):
+            return await self.client.get(url, **kwargs)
+
+    @asynccontextmanager
+    async def stream(self, method: str, url: str, **kwargs) -> AsyncIterator[httpx.Response]:
+        """Send a request and yield the response before its body is read."""
+        async with self._host_slot(url):
+            async with self.client.stream(method, url, **kwargs) as response:
+                yield response
+
+    async def aclose(self) -> None:
+        """Close all pooled connections."""
+        await self.client.aclose()
+
+# One client per event loop: connections cannot be shared across loops. The app
+# runs everything on one background loop (see src.utils.background), so in
+# practice this holds a single client; other loops must close theirs with
+# close_http_client() before they finish.
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, PooledHTTPClient]" = weakref.WeakKeyDictionary()
+
+def get_http_client() -> PooledHTTPClient:
+    """Get the shared HTTP client for the running event loop."""
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None:
+        logger.debug("Creating pooled HTTP client for event loop")
+        client = _clients[loop] = PooledHTTPClient()
+    return client
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client of the running event loop, if it has one."""
+    client = _clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+        logger.debug("Closed pooled HTTP client for event loop")
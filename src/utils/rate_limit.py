@@ -0,0 +1,175 @@
+import asyncio
+import time
+from collections import OrderedDict, deque
+from datetime import date, datetime
+from functools import lru_cache
+from typing import Deque, Dict, Optional
+from loguru import logger
+
+from src.utils.config import get_settings
+from src.utils.exceptions import QuotaExceededError
+
+settings = get_settings()
+
+class TokenBucket:
+    """Token bucket refilled continuously at ``rate`` tokens per second."""
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def take(self) -> float:
+        """Take a token and return 0, or return the seconds until one is available."""
+        now = time.monotonic()
+        if now < self.blocked_until:
+            return self.blocked_until - now
+        self._refill(now)
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+    def block(self, seconds: float) -> None:
+        """Stop handing out tokens for ``seconds`` and drain the bucket."""
+        self.blocked_until = max(self.blocked_until, time.monotonic() + seconds)
+        self.tokens = 0.0
+
+class ProviderScheduler:
+    """Rate scheduler for one provider: token bucket, fair queueing and daily quota."""
+
+    def __init__(self, name: str, rate: float, burst: int, daily_quota: int = 0):
+        """
+        Initialize the scheduler.
+
+        Args:
+            name: Provider name used in logs and errors
+            rate: Sustained requests per second
+            burst: Requests that may be sent back to back
+            daily_quota: Requests allowed per UTC day (0 for unlimited)
+        """
+        self.name = name
+        self.bucket = TokenBucket(rate, burst)
+        self.daily_quota = daily_quota
+        self.used_today = 0
+        self.quota_day: date = datetime.utcnow().date()
+        # One waiting queue per key (source); keys are served round-robin
+        self.queues: "OrderedDict[str, Deque[asyncio.Future]]" = OrderedDict()
+        self._dispatcher: Optional[asyncio.Task] = None
+
+    def _roll_quota_day(self) -> None:
+        today = datetime.utcnow().date()
+        if today != self.quota_day:
+            self.quota_day = today
+            self.used_today = 0
+
+    @property
+    def quota_exhausted(self) -> bool:
+        """Whether today's request quota has been used up."""
+        self._roll_quota_day()
+        return bool(self.daily_quota) and self.used_today >= self.daily_quota
+
+    async def acquire(self, key: str = "") -> None:
+        """
+        Wait for permission to send one request.
+
+        Args:
+            key: Fairness key, usually the source domain
+
+        Raises:
+            QuotaExceededError: If the daily quota is exhausted
+        """
+        if self.quota_exhausted:
+            raise QuotaExceededError(f"{self.name} daily quota of {self.daily_quota} requests exhausted")
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self.queues.setdefault(key, deque()).append(future)
+        if self._dispatcher is None or self._dispatcher.done() or self._dispatcher.get_loop() is not loop:
+            self._dispatcher = loop.create_task(self._dispatch())
+        await future
+
+    async def _dispatch(self) -> None:
+        """Grant tokens to waiting requests, one key at a time in rotation."""
+        while self.queues:
+            key, queue = next(iter(self.queues.items()))
+            future = queue.popleft()
+            if queue:
+                self.queues.move_to_end(key)
+            else:
+                del self.queues[key]
+            if future.done():
+                continue
+
+            if self.quota_exhausted:
+                future.set_exception(
+                    QuotaExceededError(f"{self.name} daily quota of {self.daily_quota} requests exhausted")
+                )
+                continue
+
+            wait = self.bucket.take()
+            while wait:
+                await asyncio.sleep(wait)
+                wait = self.bucket.take()
+            if future.done():
+                # The waiter gave up while we slept; hand the token back
+                self.bucket.tokens += 1
+                continue
+            self.used_today += 1
+            future.set_result(None)
+
+    def penalize(self, seconds: float) -> None:
+        """Pause the provider after a rate-limit response (e.g. HTTP 429)."""
+        logger.warning(f"{self.name} rate limited, pausing requests for {seconds:.1f}s")
+        self.bucket.block(seconds)
+
+    def usage(self) -> Dict[str, object]:
+        """Return today's quota consumption and the queue length."""
+        self._roll_quota_day()
+        return {
+            "used_today": self.used_today,
+            "daily_quota": self.daily_quota,
+            "queued": sum(len(queue) for queue in self.queues.values()),
+        }
+
+class RateScheduler:
+    """Registry of per-provider schedulers configured from ``Settings``."""
+
+    def __init__(self):
+        self.providers: Dict[str, ProviderScheduler] = {
+            "newsapi": ProviderScheduler(
+                "NewsAPI",
+                rate=settings.news_api_rate_per_second,
+                burst=settings.news_api_burst,
+                daily_quota=settings.news_api_daily_quota
+            ),
+            "newsdata": ProviderScheduler(
+                "NewsDataAPI",
+                rate=settings.news_data_rate_per_second,
+                burst=settings.news_data_burst,
+                daily_quota=settings.news_data_daily_quota
+            ),
+        }
+
+    async def acquire(self, provider: str, key: str = "") -> None:
+        """Wait for a request slot with ``provider``."""
+        await self.providers[provider].acquire(key)
+
+    def penalize(self, provider: str, seconds: float) -> None:
+        """Pause ``provider`` for ``seconds``."""
+        self.providers[provider].penalize(seconds)
+
+    def usage(self) -> Dict[str, Dict[str, object]]:
+        """Return quota usage per provider."""
+        return {name: scheduler.usage() for name, scheduler in self.providers.items()}
+
+@lru_cache
+def get_rate_scheduler() -> RateScheduler:
+    """Get the process-wide rate scheduler."""
+    return RateScheduler()
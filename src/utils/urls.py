@@ -0,0 +1,37 @@
+import hashlib
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# Query parameters that only track the referrer or campaign
+TRACKING_PARAMS = frozenset({
+    "fbclid", "gclid", "dclid", "msclkid", "yclid", "igshid", "mc_cid", "mc_eid",
+    "ref", "ref_src", "referrer", "cmpid", "ocid", "ito", "ns_mchannel", "ns_campaign",
+    "ns_source", "ns_linkname", "ns_fee", "smid", "smtyp", "_ga", "_hsenc", "_hsmi",
+})
+TRACKING_PREFIXES = ("utm_", "at_", "pk_")
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+def canonicalize_url(url: str) -> str:
+    """
+    Normalise an article URL so copies with tracking decorations compare equal.
+
+    Lower-cases the scheme and host, drops default ports, fragments,
+    tracking parameters and trailing slashes, and sorts the remaining
+    query parameters.
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    if parts.port and parts.port != DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{parts.port}"
+    path = parts.path.rstrip("/") or "/"
+    query = urlencode(sorted(
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in TRACKING_PARAMS and not key.lower().startswith(TRACKING_PREFIXES)
+    ))
+    return urlunsplit((scheme, host, path, query, ""))
+
+def url_hash(url: str) -> int:
+    """Return a signed 64-bit hash of the canonical URL (fits an SQLite INTEGER)."""
+    digest = hashlib.blake2b(canonicalize_url(url).encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "little", signed=True)
@@ -0,0 +1,29 @@
+import os
+import tempfile
+
+# Settings are read when src modules are imported, so these must be set first
+_DIRECTORY = tempfile.mkdtemp(prefix="news_automation_test_")
+os.environ.setdefault("OPENAI_API_KEY", "test")
+os.environ.setdefault("NEWS_API_KEY", "test")
+os.environ.setdefault("NEWS_DATA_API_KEY", "test")
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{_DIRECTORY}/news_automation.db")
+os.environ.setdefault("COLLECTOR_CACHE_PATH", f"{_DIRECTORY}/collector_responses.db")
+os.environ.setdefault("FEED_CACHE_PATH", f"{_DIRECTORY}/feeds.db")
+os.environ.setdefault("ENRICHMENT_CACHE_PATH", f"{_DIRECTORY}/article_content.db")
+# No back-off between retries of failed calls
+os.environ.setdefault("RETRY_DELAY", "0")
+
+import pytest  # noqa: E402
+from sqlmodel import SQLModel  # noqa: E402
+
+from src.models.database import create_db_and_tables, engine, rebuild_search_index  # noqa: E402
+
+@pytest.fixture
+def database():
+    """Empty database with the current schema."""
+    create_db_and_tables()
+    with engine.begin() as conn:
+        for table in reversed(SQLModel.metadata.sorted_tables):
+            conn.execute(table.delete())
+    rebuild_search_index()
+    return engine
@@ -0,0 +1,43 @@
+import json
+import re
+from types import SimpleNamespace
+from typing import Callable, List
+
+_TOPIC = re.compile(r"^\s*\[(\d+)\] (?!Article Title:)(.+)$", re.MULTILINE)
+_ARTICLE = re.compile(r"\[(\d+)\] Article Title: (.+)")
+
+def completion(content: str) -> SimpleNamespace:
+    return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content), logprobs=None)], usage=None)
+
+class FakeOpenAI:
+    """
+    Stand-in for openai.AsyncOpenAI answering the filter's prompts.
+
+    ``relevant(title, topic)`` decides each verdict. While ``down`` is set
+    every call fails; ``reply`` overrides the answer to batch prompts.
+    """
+
+    def __init__(self, relevant: Callable[[str, str], bool] = lambda title, topic: True):
+        self.relevant = relevant
+        self.down = False
+        self.reply = None
+        self.calls: List[str] = []
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+
+    async def create(self, model, messages, **kwargs):
+        prompt = messages[-1]["content"]
+        self.calls.append(prompt)
+        if self.down:
+            raise ConnectionError("API unavailable")
+        if "response_format" in kwargs:
+            if self.reply is not None:
+                return completion(self.reply)
+            topics = [topic.strip() for _, topic in _TOPIC.findall(prompt)]
+            verdicts = [
+                {"id": int(i), "topics": [j for j, topic in enumerate(topics) if self.relevant(title.strip(), topic)]}
+                for i, title in _ARTICLE.findall(prompt)
+            ]
+            return completion(json.dumps({"verdicts": verdicts}))
+        topic = re.search(r"related to the topic: (.+)", prompt).group(1).strip()
+        title = re.search(r"Article Title: (.+)", prompt).group(1).strip()
+        return completion("yes" if self.relevant(title, topic) else "no")
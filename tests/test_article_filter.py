@@ -0,0 +1,113 @@
+from datetime import datetime, timedelta
+from typing import List
+
+import pytest
+
+from src.filters import article_filter as article_filter_module
+from src.filters.article_filter import ArticleFilter
+from src.models.article import ArticleCreate
+from tests.fakes import FakeOpenAI
+
+def make_articles(count: int) -> List[ArticleCreate]:
+    return [
+        ArticleCreate(
+            title=f"Story {i}",
+            url=f"https://example.com/story-{i}",
+            publication_date=datetime(2024, 1, 1) + timedelta(hours=i),
+            source="example.com",
+            content=f"Body of story {i}."
+        )
+        for i in range(count)
+    ]
+
+@pytest.fixture
+def article_filter(database, monkeypatch):
+    monkeypatch.setattr(article_filter_module.settings, "filter_prefilter_enabled", False)
+    monkeypatch.setattr(article_filter_module.settings, "verdict_cache_enabled", False)
+    article_filter = ArticleFilter()
+    article_filter.openai_client = FakeOpenAI(lambda title, topic: title in ("Story 0", "Story 3"))
+    return article_filter
+
+@pytest.mark.asyncio
+async def test_batch_classifies_all_articles_in_one_call(article_filter):
+    articles = make_articles(4)
+
+    relevant, undecided = await article_filter.filter_topics_split(articles, ["news"], batch_size=4)
+
+    assert [article.title for article in relevant["news"]] == ["Story 0", "Story 3"]
+    assert undecided == []
+    assert len(article_filter.openai_client.calls) == 1
+
+@pytest.mark.asyncio
+async def test_one_call_classifies_a_batch_against_every_topic(article_filter):
+    articles = make_articles(4)
+    article_filter.openai_client.relevant = lambda title, topic: (title == "Story 1") == (topic == "sport")
+
+    relevant = await article_filter.filter_topics(articles, ["news", "sport", "tech"], batch_size=4)
+
+    assert [article.title for article in relevant["news"]] == ["Story 0", "Story 2", "Story 3"]
+    assert [article.title for article in relevant["sport"]] == ["Story 1"]
+    assert [article.title for article in relevant["tech"]] == ["Story 0", "Story 2", "Story 3"]
+    assert len(article_filter.openai_client.calls) == 1
+
+@pytest.mark.parametrize("reply", ['{"verdicts": [{"id": 0, "topics": [0]}]}', "not json", '{"answer": "yes"}'])
+@pytest.mark.asyncio
+async def test_malformed_batch_reply_is_split_down_to_single_articles(article_filter, reply):
+    articles = make_articles(4)
+    article_filter.openai_client.reply = reply
+
+    relevant, undecided = await article_filter.filter_topics_split(articles, ["news"], batch_size=4)
+
+    assert [article.title for article in relevant["news"]] == ["Story 0", "Story 3"]
+    assert undecided == []
+    # 4 -> 2 + 2 -> four single-article prompts, none of them retried
+    assert len(article_filter.openai_client.calls) == 1 + 2 + 4
+
+@pytest.mark.asyncio
+async def test_api_failure_leaves_batch_undecided_without_splitting(article_filter):
+    articles = make_articles(4)
+    article_filter.openai_client.down = True
+
+    relevant, undecided = await article_filter.filter_topics_split(articles, ["news"], batch_size=4)
+
+    assert relevant == {"news": []}
+    assert undecided == articles
+    assert len(article_filter.openai_client.calls) == article_filter_module.settings.max_retries
+
+@pytest.fixture
+def cached_filter(article_filter, monkeypatch):
+    monkeypatch.setattr(article_filter_module.settings, "verdict_cache_enabled", True)
+    cached_filter = ArticleFilter()
+    cached_filter.openai_client = article_filter.openai_client
+    return cached_filter
+
+@pytest.mark.asyncio
+async def test_cached_verdicts_skip_the_model(cached_filter):
+    articles = make_articles(4)
+    await cached_filter.filter_topics_split(articles, ["news"], batch_size=4)
+    cached_filter.openai_client.calls.clear()
+
+    relevant, undecided = await cached_filter.filter_topics_split(articles, ["news"], batch_size=4)
+
+    assert [article.title for article in relevant["news"]] == ["Story 0", "Story 3"]
+    assert undecided == []
+    assert cached_filter.openai_client.calls == []
+    assert cached_filter.stats()["stages"]["cached"] == 4
+
+@pytest.mark.asyncio
+async def test_only_missing_article_topic_pairs_reach_the_model(cached_filter):
+    articles = make_articles(4)
+    await cached_filter.filter_topics_split(articles[:2], ["news"], batch_size=4)
+    cached_filter.openai_client.calls.clear()
+
+    relevant, _ = await cached_filter.filter_topics_split(articles, ["news", "sport"], batch_size=4)
+
+    assert [article.title for article in relevant["news"]] == ["Story 0", "Story 3"]
+    assert [article.title for article in relevant["sport"]] == ["Story 0", "Story 3"]
+    # Stories 0-1 only miss "sport" and stories 2-3 miss both topics: one prompt each
+    prompts = cached_filter.openai_client.calls
+    assert sorted(("Story 0" in prompt, "] news" in prompt) for prompt in prompts) == [(False, True), (True, False)]
+
+    cached_filter.openai_client.calls.clear()
+    await cached_filter.filter_topics_split(articles, ["news", "sport"], batch_size=4)
+    assert cached_filter.openai_client.calls == []
@@ -0,0 +1,34 @@
+import numpy as np
+
+from src.utils.bloom import BloomFilter
+from src.utils.urls import url_hash
+
+def test_added_hashes_are_found():
+    bloom = BloomFilter(capacity=1000)
+    hashes = [url_hash(f"https://example.com/{i}") for i in range(1000)]
+    bloom.add_many(hashes)
+    assert bloom.contains_many(hashes).all()
+    assert hashes[0] in bloom
+    assert bloom.count == 1000
+
+def test_false_positive_rate_near_target():
+    hashes = np.random.RandomState(0).randint(-2**63, 2**63 - 1, size=110_000, dtype=np.int64)
+    bloom = BloomFilter(capacity=10_000, error_rate=0.01)
+    bloom.add_many(hashes[:10_000])
+    false_positives = bloom.contains_many(hashes[10_000:]).mean()
+    assert false_positives < 0.02
+
+def test_empty_filter():
+    bloom = BloomFilter(capacity=10)
+    assert 42 not in bloom
+    assert bloom.contains_many([]).shape == (0,)
+    bloom.add_many([])
+    assert bloom.count == 0
+
+def test_negative_and_extreme_hashes():
+    bloom = BloomFilter(capacity=10)
+    values = [-1, -2**63, 2**63 - 1, 0]
+    for value in values:
+        bloom.add(value)
+    assert bloom.contains_many(values).all()
+    assert bloom.contains_many(np.array(values)).dtype == bool
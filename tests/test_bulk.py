@@ -0,0 +1,104 @@
+from datetime import datetime
+from typing import List
+
+import pytest
+from sqlmodel import col, select
+
+from src.models import bulk
+from src.models.article import Article, ArticleCreate, ArticleDuplicate, ArticleTopic
+from src.models.body import load_bodies
+from src.models.bulk import link_topics, record_duplicates, upsert_articles
+from src.models.database import get_session
+
+def make_article(url: str, title: str = "Title", content: str = "Body") -> ArticleCreate:
+    return ArticleCreate(
+        title=title,
+        url=url,
+        publication_date=datetime(2024, 1, 1),
+        source="example.com",
+        topic="news",
+        content=content
+    )
+
+@pytest.fixture(params=["on_conflict", "portable"])
+def session(database, request, monkeypatch):
+    """Session on the test database, optionally forced onto the path for databases without ON CONFLICT."""
+    if request.param == "portable":
+        monkeypatch.setattr(bulk, "_ON_CONFLICT_INSERTS", {})
+    with get_session() as session:
+        yield session
+
+def stored(session, urls: List[str]) -> List[Article]:
+    articles = session.exec(select(Article).where(col(Article.url).in_(urls)).order_by(Article.id)).all()
+    load_bodies(session, articles)
+    return articles
+
+def test_upsert_returns_ids_of_new_and_existing_articles(session):
+    first = upsert_articles(session, [make_article("https://example.com/a")])
+    session.commit()
+
+    ids = upsert_articles(session, [
+        make_article("https://example.com/a", title="Changed", content="Changed"),
+        make_article("https://example.com/b"),
+    ])
+    session.commit()
+
+    assert ids["https://example.com/a"] == first["https://example.com/a"]
+    assert ids["https://example.com/b"] != ids["https://example.com/a"]
+    a, b = stored(session, ["https://example.com/a", "https://example.com/b"])
+    # Existing rows are kept unchanged by default
+    assert (a.title, a.content) == ("Title", "Body")
+    assert b.id == ids["https://example.com/b"]
+
+def test_other_spellings_of_a_canonical_url_map_to_one_row(session):
+    ids = upsert_articles(session, [
+        make_article("https://example.com/a?utm_source=feed"),
+        make_article("https://example.com/a"),
+    ])
+    session.commit()
+
+    assert len(set(ids.values())) == 1
+    assert len(session.exec(select(Article)).all()) == 1
+
+def test_update_existing_overwrites_title_topic_and_body(session):
+    upsert_articles(session, [make_article("https://example.com/a")])
+    session.commit()
+
+    changed = make_article("https://example.com/a", title="Changed", content="New body")
+    changed.topic = "tech"
+    upsert_articles(session, [changed], update_existing=True)
+    session.commit()
+    session.expire_all()
+
+    [article] = stored(session, ["https://example.com/a"])
+    assert (article.title, article.topic, article.content) == ("Changed", "tech", "New body")
+
+def test_conflict_with_row_saved_without_url_hash(session):
+    session.add(Article(
+        title="Legacy",
+        url="https://example.com/legacy",
+        publication_date=datetime(2024, 1, 1),
+        source="example.com"
+    ))
+    session.commit()
+    [legacy] = stored(session, ["https://example.com/legacy"])
+
+    ids = upsert_articles(session, [make_article("https://example.com/legacy")])
+    session.commit()
+
+    assert ids == {"https://example.com/legacy": legacy.id}
+    assert len(session.exec(select(Article)).all()) == 1
+
+def test_links_and_duplicates_ignore_repeats(session):
+    ids = upsert_articles(session, [make_article("https://example.com/a")])
+    article_id = ids["https://example.com/a"]
+    copy = make_article("https://mirror.example.com/a")
+
+    for _ in range(2):
+        link_topics(session, [(article_id, "news"), (article_id, "tech"), (article_id, "news")])
+        record_duplicates(session, [(article_id, copy), (article_id, copy)])
+        session.commit()
+
+    topics = session.exec(select(ArticleTopic.topic).order_by(ArticleTopic.topic)).all()
+    assert topics == ["news", "tech"]
+    assert session.exec(select(ArticleDuplicate.url)).all() == ["https://mirror.example.com/a"]
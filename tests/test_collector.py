@@ -0,0 +1,199 @@
+import asyncio
+from datetime import datetime, timedelta
+from typing import List
+
+import pytest
+
+from src.collectors import collector as collector_module
+from src.collectors import health as health_module
+from src.collectors.cache import ResponseCache
+from src.collectors.collector import ArticleCollector
+from src.collectors.health import CollectorHealth
+from src.models.article import ArticleCreate
+from src.utils.exceptions import ArticleCollectionError
+
+START = datetime(2024, 1, 1)
+END = START + timedelta(hours=12)
+
+def make_articles(name: str, count: int = 2) -> List[ArticleCreate]:
+    return [
+        ArticleCreate(
+            title=f"{name} {i}",
+            url=f"https://example.com/{name}/{i}",
+            publication_date=START + timedelta(hours=i + 1),
+            source="example.com",
+            content="Body"
+        )
+        for i in range(count)
+    ]
+
+class StubCollector:
+    """Collector answering after a delay with articles, nothing or an error."""
+
+    def __init__(self, delay: float = 0.0, count: int = 2, error: bool = False):
+        self.delay = delay
+        self.count = count
+        self.error = error
+        self.calls = 0
+        self.cancelled = False
+
+    async def get_articles(self, source, start_date=None, end_date=None):
+        self.calls += 1
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        if self.error:
+            raise ArticleCollectionError(f"{type(self).__name__} failed")
+        return make_articles(type(self).__name__, self.count)
+
+def stub(name: str, **kwargs) -> StubCollector:
+    # Health is tracked per collector class name
+    return type(name, (StubCollector,), {})(**kwargs)
+
+def make_pool(*collectors: StubCollector, failure_threshold: int = 3, cooldown: float = 60) -> ArticleCollector:
+    pool = ArticleCollector()
+    pool.cache = None
+    pool.collectors = list(collectors)
+    pool.health = {
+        type(c).__name__: CollectorHealth(type(c).__name__, failure_threshold=failure_threshold, cooldown=cooldown)
+        for c in collectors
+    }
+    return pool
+
+def test_circuit_opens_after_consecutive_failures_and_half_opens(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(health_module.time, "monotonic", lambda: now[0])
+    health = CollectorHealth("A", failure_threshold=2, cooldown=30)
+
+    health.record_failure(0.1)
+    assert not health.is_open
+    health.record_failure(0.1)
+    assert health.is_open
+    assert health.error_rate == 1.0
+
+    now[0] += 31
+    assert not health.is_open
+    health.record_success(0.1)
+    assert health.opened_at is None
+    assert health.consecutive_failures == 0
+
+def test_success_resets_consecutive_failures():
+    health = CollectorHealth("A", failure_threshold=2, cooldown=30)
+    health.record_failure(0.1)
+    health.record_success(0.1)
+    health.record_failure(0.1)
+    assert not health.is_open
+
+def test_latency_is_smoothed():
+    health = CollectorHealth("A", failure_threshold=2, cooldown=30, smoothing=0.5)
+    health.record_success(1.0)
+    health.record_success(3.0)
+    assert health.latency == pytest.approx(2.0)
+
+def test_ranking_prefers_fewer_errors_then_lower_latency():
+    slow, fast, flaky = stub("Slow"), stub("Fast"), stub("Flaky")
+    pool = make_pool(slow, fast, flaky)
+    pool.health["Slow"].record_success(2.0)
+    pool.health["Fast"].record_success(0.5)
+    pool.health["Flaky"].record_failure(0.1)
+
+    assert pool._ranked_collectors() == [fast, slow, flaky]
+
+@pytest.mark.asyncio
+async def test_open_circuit_skips_collector():
+    broken, backup = stub("Broken", error=True), stub("Backup")
+    pool = make_pool(broken, backup, failure_threshold=1)
+
+    first = await pool.get("example.com", START, END, hedged=False, sharded=False)
+    second = await pool.get("example.com", START, END, hedged=False, sharded=False)
+
+    assert [a.title for a in first] == [a.title for a in second] == ["Backup 0", "Backup 1"]
+    assert broken.calls == 1
+    assert pool.stats()["Broken"]["circuit_open"]
+
+@pytest.mark.asyncio
+async def test_all_circuits_open_raises():
+    pool = make_pool(stub("Broken", error=True), failure_threshold=1)
+    with pytest.raises(ArticleCollectionError):
+        await pool.get("example.com", START, END, hedged=False, sharded=False)
+    with pytest.raises(ArticleCollectionError, match="circuit open"):
+        await pool.get("example.com", START, END, hedged=False, sharded=False)
+
+@pytest.mark.asyncio
+async def test_hedging_starts_next_collector_when_first_is_slow(monkeypatch):
+    monkeypatch.setattr(collector_module.settings, "collector_hedge_delay", 0.05)
+    slow, fast = stub("Slow", delay=5), stub("Fast")
+    pool = make_pool(slow, fast)
+
+    articles = await asyncio.wait_for(pool.get("example.com", START, END, hedged=True, sharded=False), 1)
+
+    assert [a.title for a in articles] == ["Fast 0", "Fast 1"]
+    await asyncio.sleep(0)
+    assert slow.cancelled
+
+@pytest.mark.asyncio
+async def test_hedging_moves_on_immediately_after_a_failure(monkeypatch):
+    monkeypatch.setattr(collector_module.settings, "collector_hedge_delay", 5)
+    broken, backup = stub("Broken", error=True), stub("Backup")
+    pool = make_pool(broken, backup)
+
+    articles = await asyncio.wait_for(pool.get("example.com", START, END, hedged=True, sharded=False), 1)
+
+    assert [a.title for a in articles] == ["Backup 0", "Backup 1"]
+    assert pool.health["Broken"].failures == 1
+
+@pytest.mark.asyncio
+async def test_hedging_raises_when_every_collector_fails(monkeypatch):
+    monkeypatch.setattr(collector_module.settings, "collector_hedge_delay", 0.01)
+    pool = make_pool(stub("A", error=True), stub("B", error=True))
+    with pytest.raises(ArticleCollectionError, match="No articles found"):
+        await pool.get("example.com", START, END, hedged=True, sharded=False)
+
+@pytest.mark.asyncio
+async def test_sharded_collection_splits_dense_shards(monkeypatch):
+    monkeypatch.setattr(collector_module.settings, "collector_shard_days", 1)
+    monkeypatch.setattr(collector_module.settings, "collector_shard_threshold_days", 1)
+    monkeypatch.setattr(collector_module.settings, "collector_shard_result_cap", 3)
+    monkeypatch.setattr(collector_module.settings, "collector_min_shard_hours", 6)
+    windows = []
+
+    class Windowed(StubCollector):
+        async def get_articles(self, source, start_date=None, end_date=None):
+            windows.append((start_date, end_date))
+            # The first day is dense: its full-day shard hits the cap
+            count = 3 if start_date.day == 1 and end_date - start_date == timedelta(days=1) else 1
+            return [
+                ArticleCreate(
+                    title=f"{start_date} {i}",
+                    url=f"https://example.com/{start_date:%d%H}/{i}",
+                    publication_date=start_date,
+                    source="example.com",
+                    content="Body"
+                )
+                for i in range(count)
+            ]
+
+    pool = make_pool(Windowed())
+    articles = await pool.get("example.com", START, START + timedelta(days=2), hedged=False, sharded=True)
+
+    assert (START, START + timedelta(days=1)) in windows
+    assert (START, START + timedelta(hours=12)) in windows
+    assert (START + timedelta(hours=12), START + timedelta(days=1)) in windows
+    # Day two was not dense, so it is fetched once
+    assert sum(start.day == 2 for start, _ in windows) == 1
+    # The first half repeats a URL of the full shard and is merged away
+    assert len(articles) == 3 + 1 + 1
+
+@pytest.mark.asyncio
+async def test_pool_serves_repeated_window_from_response_cache(tmp_path):
+    backend = stub("Cached")
+    pool = make_pool(backend)
+    pool.cache = ResponseCache(tmp_path / "responses.db")
+
+    first = await pool.get("example.com", START, END, hedged=False, sharded=False)
+    second = await pool.get("example.com", START, END + timedelta(seconds=30), hedged=False, sharded=False)
+
+    assert first == second
+    assert backend.calls == 1
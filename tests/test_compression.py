@@ -0,0 +1,37 @@
+import zlib
+
+import pytest
+
+from src.models.compression import compress, decompress, train_dictionary
+
+BOILERPLATE = "Sign up for the Example News morning briefing to get the day's top stories."
+BODIES = [
+    f"{BOILERPLATE} Story number {i} about markets, energy prices and the central bank. "
+    f"Copyright Example News. All rights reserved."
+    for i in range(50)
+]
+
+@pytest.mark.parametrize("text", ["", "short", "ünïcödé ✓ " * 100, BODIES[0]])
+def test_round_trip_without_dictionary(text):
+    assert decompress(compress(text)) == text
+
+def test_round_trip_with_dictionary():
+    dictionary = train_dictionary(BODIES)
+    assert decompress(compress(BODIES[0], dictionary), dictionary) == BODIES[0]
+
+def test_dictionary_shrinks_short_bodies():
+    dictionary = train_dictionary(BODIES[1:])
+    assert len(compress(BODIES[0], dictionary)) < len(compress(BODIES[0]))
+
+def test_dictionary_keeps_shared_sentences_and_respects_size():
+    dictionary = train_dictionary(BODIES)
+    assert BOILERPLATE.encode() in dictionary
+    assert len(train_dictionary(BODIES, size=64)) <= 64
+
+def test_dictionary_of_unrelated_samples_is_empty():
+    assert train_dictionary(["alpha", "beta"]) == b""
+
+def test_decompress_needs_the_same_dictionary():
+    data = compress(BODIES[0], train_dictionary(BODIES))
+    with pytest.raises(zlib.error):
+        decompress(data)
@@ -0,0 +1,115 @@
+import asyncio
+
+import pytest
+
+from src.filters import concurrency as concurrency_module
+from src.filters.concurrency import AdaptiveConcurrencyLimiter
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable monotonic clock for the limiter's cool-down."""
+    now = [1000.0]
+    monkeypatch.setattr(concurrency_module.time, "monotonic", lambda: now[0])
+    return now
+
+def make_limiter(initial: int = 4, **kwargs) -> AdaptiveConcurrencyLimiter:
+    options = {"minimum": 1, "maximum": 8, "latency_target": 10.0, "cooldown": 5.0}
+    options.update(kwargs)
+    return AdaptiveConcurrencyLimiter(initial, **options)
+
+def test_limit_grows_by_one_per_window_of_healthy_calls(clock):
+    limiter = make_limiter(initial=2)
+
+    limiter.record_success(1.0)
+    assert limiter.limit == 2
+    limiter.record_success(1.0)
+    assert limiter.limit == 3
+
+    for _ in range(3):
+        limiter.record_success(1.0)
+    assert limiter.limit == 4
+
+def test_limit_stops_at_maximum(clock):
+    limiter = make_limiter(initial=7)
+
+    for _ in range(50):
+        limiter.record_success(1.0)
+
+    assert limiter.limit == 8
+
+def test_overload_halves_limit_once_per_cooldown(clock):
+    limiter = make_limiter(initial=8)
+
+    limiter.record_overload()
+    limiter.record_overload()
+    assert limiter.limit == 4
+
+    clock[0] += 5
+    limiter.record_overload()
+    assert limiter.limit == 2
+
+def test_slow_call_counts_as_overload(clock):
+    limiter = make_limiter(initial=8)
+
+    limiter.record_success(11.0)
+
+    assert limiter.limit == 4
+
+def test_limit_does_not_grow_during_cooldown(clock):
+    limiter = make_limiter(initial=2)
+    limiter.record_overload()
+    assert limiter.limit == 1
+
+    limiter.record_success(1.0)
+    assert limiter.limit == 1
+
+    clock[0] += 5
+    limiter.record_success(1.0)
+    assert limiter.limit == 2
+
+def test_limit_never_drops_below_minimum(clock):
+    limiter = make_limiter(initial=2, minimum=2)
+
+    limiter.record_overload()
+
+    assert limiter.limit == 2
+
+@pytest.mark.asyncio
+async def test_acquire_waits_for_a_free_slot(clock):
+    limiter = make_limiter(initial=1)
+    await limiter.acquire()
+
+    waiter = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+    assert not waiter.done()
+
+    limiter.release()
+    await asyncio.wait_for(waiter, 1)
+    assert limiter.in_flight == 1
+
+@pytest.mark.asyncio
+async def test_growing_limit_wakes_waiters(clock):
+    limiter = make_limiter(initial=1)
+    await limiter.acquire()
+    waiter = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+
+    limiter.record_success(1.0)
+
+    await asyncio.wait_for(waiter, 1)
+    assert limiter.in_flight == 2
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_passes_wakeup_on(clock):
+    limiter = make_limiter(initial=1)
+    await limiter.acquire()
+    first = asyncio.create_task(limiter.acquire())
+    second = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+
+    limiter.release()
+    first.cancel()
+    await asyncio.gather(first, return_exceptions=True)
+
+    await asyncio.wait_for(second, 1)
+    assert limiter.in_flight == 1
@@ -0,0 +1,132 @@
+import time
+from datetime import datetime
+
+import httpx
+import pytest
+
+from src.collectors import content
+from src.collectors.content import ContentCache, ContentFetcher, extract_main_text
+from src.models.article import ArticleCreate
+from src.utils.http import PooledHTTPClient
+
+BODY = "The central bank raised interest rates for the third time this year on Tuesday."
+PAGE = f"""
+<html>
+  <head><title>Rates</title><script>var tracking = "a script that is long enough to count";</script></head>
+  <body>
+    <nav><p>Home, World, Business, Markets, Technology and all other sections</p></nav>
+    <article>
+      <p>{BODY}</p>
+      <p>Short byline</p>
+      <p>Officials said inflation in services remained&nbsp;too high<br>to pause yet.</p>
+    </article>
+    <footer><p>Copyright Example News. All rights reserved, all the time.</p></footer>
+  </body>
+</html>
+"""
+
+class Server:
+    """MockTransport handler serving one page with an ETag."""
+
+    def __init__(self, status_code: int = 200, content_type: str = "text/html; charset=utf-8"):
+        self.status_code = status_code
+        self.content_type = content_type
+        self.requests = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if request.headers.get("if-none-match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(
+            self.status_code,
+            headers={"content-type": self.content_type, "etag": '"v1"'},
+            text=PAGE
+        )
+
+@pytest.fixture
+def cache(tmp_path):
+    return ContentCache(tmp_path / "content.db")
+
+def make_fetcher(server: Server, cache: ContentCache) -> ContentFetcher:
+    return ContentFetcher(client=PooledHTTPClient(transport=httpx.MockTransport(server)), cache=cache)
+
+def make_article(content: str) -> ArticleCreate:
+    return ArticleCreate(
+        title="Bank raises rates",
+        url="https://example.com/news/rates",
+        publication_date=datetime(2024, 1, 1),
+        source="example.com",
+        content=content
+    )
+
+def test_extract_main_text_prefers_article_paragraphs():
+    assert extract_main_text(PAGE) == (
+        f"{BODY}\n\nOfficials said inflation in services remained too high to pause yet."
+    )
+
+def test_extract_main_text_falls_back_to_all_paragraphs():
+    html = f"<div><p>{BODY}</p></div><aside><p>{BODY} Related.</p></aside><p>Too short</p>"
+    assert extract_main_text(html) == BODY
+
+def test_extract_main_text_closes_unterminated_paragraph():
+    assert extract_main_text(f"<p>{BODY}") == BODY
+
+def test_extract_main_text_without_paragraphs():
+    assert extract_main_text("<html><body>Just text</body></html>") == ""
+
+@pytest.mark.asyncio
+async def test_fetch_extracts_and_caches(cache):
+    server = Server()
+    fetcher = make_fetcher(server, cache)
+
+    text = await fetcher.fetch("https://example.com/news/rates?utm_source=feed")
+
+    assert text.startswith(BODY)
+    cached = cache.get("https://example.com/news/rates")
+    assert cached["content"] == text
+    assert cached["etag"] == '"v1"'
+
+    # Fresh entries are served without a request
+    assert await fetcher.fetch("https://example.com/news/rates") == text
+    assert len(server.requests) == 1
+
+@pytest.mark.asyncio
+async def test_fetch_revalidates_stale_entry(cache, monkeypatch):
+    cache.put("https://example.com/news/rates", '"v1"', None, "cached text")
+    checked_at = cache.get("https://example.com/news/rates")["checked_at"]
+    monkeypatch.setattr(content.settings, "enrichment_cache_ttl", 0)
+    server = Server()
+    time.sleep(0.01)
+
+    text = await make_fetcher(server, cache).fetch("https://example.com/news/rates")
+
+    assert text == "cached text"
+    assert server.requests[0].headers["if-none-match"] == '"v1"'
+    assert cache.get("https://example.com/news/rates")["checked_at"] > checked_at
+
+@pytest.mark.asyncio
+async def test_fetch_skips_non_html(cache):
+    server = Server(content_type="application/pdf")
+    assert await make_fetcher(server, cache).fetch("https://example.com/report.pdf") is None
+
+@pytest.mark.asyncio
+async def test_fetch_error_falls_back_to_cache(cache, monkeypatch):
+    monkeypatch.setattr(content.settings, "enrichment_cache_ttl", 0)
+    fetcher = make_fetcher(Server(status_code=500), cache)
+
+    assert await fetcher.fetch("https://example.com/news/rates") is None
+
+    cache.put("https://example.com/news/rates", None, None, "cached text")
+    assert await fetcher.fetch("https://example.com/news/rates") == "cached text"
+
+@pytest.mark.asyncio
+async def test_enrich_replaces_truncated_content(cache):
+    truncated = make_article("The central bank raised… [+2000 chars]")
+    complete = make_article("x" * content.settings.enrichment_min_length)
+    server = Server()
+
+    await make_fetcher(server, cache).enrich([truncated, complete])
+
+    assert truncated.content.startswith(BODY)
+    assert complete.content == "x" * content.settings.enrichment_min_length
+    assert len(server.requests) == 1
@@ -0,0 +1,19 @@
+import threading
+
+import pytest
+from sqlalchemy import text
+
+from src.models import database as database_module
+from src.models.database import run_in_session
+
+@pytest.mark.asyncio
+async def test_sync_sessions_run_off_the_event_loop(database, monkeypatch):
+    monkeypatch.setattr(database_module.settings, "database_async", False)
+
+    thread = await run_in_session(lambda session: threading.get_ident())
+
+    assert thread != threading.get_ident()
+
+@pytest.mark.asyncio
+async def test_run_in_session_returns_query_results(database):
+    assert await run_in_session(lambda session: session.execute(text("SELECT 1")).one()) == (1,)
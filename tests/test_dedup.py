@@ -0,0 +1,78 @@
+from datetime import datetime, timedelta
+
+from src.filters.dedup import NearDuplicateIndex
+from src.models.article import ArticleCreate
+
+STORY = (
+    "The central bank raised interest rates by a quarter point on Tuesday, its third increase this year, "
+    "saying inflation in services remained too high and that further increases could follow in the spring."
+)
+OTHER = (
+    "The football club signed a young striker after a long negotiation with his former team, "
+    "and the coach said he expects him to start in the derby at the weekend."
+)
+
+def make_article(slug: str, content: str, title: str = "Headline") -> ArticleCreate:
+    return ArticleCreate(
+        title=title,
+        url=f"https://example.com/{slug}",
+        publication_date=datetime(2024, 1, 1),
+        source="example.com",
+        content=content
+    )
+
+def test_signature_is_deterministic():
+    index = NearDuplicateIndex()
+    article = make_article("a", STORY)
+
+    assert (index.signature(article) == NearDuplicateIndex().signature(article)).all()
+    assert index.signature(make_article("empty", "", title="")) is None
+
+def test_near_copies_share_a_cluster():
+    index = NearDuplicateIndex()
+    original = make_article("original", STORY)
+    syndicated = make_article("syndicated", STORY.replace("Tuesday", "Tuesday afternoon"))
+    unrelated = make_article("unrelated", OTHER)
+
+    clusters = index.group([original, syndicated, unrelated])
+
+    assert [(cluster.representative.url, cluster.members) for cluster in clusters] == [
+        (original.url, [syndicated]),
+        (unrelated.url, []),
+    ]
+    assert not any(cluster.earlier for cluster in clusters)
+
+def test_later_copy_joins_story_from_earlier_call():
+    index = NearDuplicateIndex()
+    original = make_article("original", STORY)
+    index.group([original])
+
+    copy = make_article("copy", STORY + " Markets fell.")
+    [cluster] = index.group([copy])
+
+    assert cluster.earlier
+    assert cluster.representative.url == original.url
+    assert cluster.members == [copy]
+
+def test_same_url_is_not_its_own_duplicate():
+    index = NearDuplicateIndex()
+    index.group([make_article("original", STORY)])
+
+    again = make_article("original", STORY + " Updated.")
+    [cluster] = index.group([again])
+
+    assert cluster.representative is again
+    assert cluster.members == []
+    assert not cluster.earlier
+
+def test_expired_articles_are_forgotten():
+    index = NearDuplicateIndex(window=timedelta(hours=1))
+    index.group([make_article("original", STORY)])
+    for entry_id, entry in index.entries.items():
+        index.entries[entry_id] = entry._replace(added_at=entry.added_at - timedelta(hours=2))
+
+    [cluster] = index.group([make_article("copy", STORY)])
+
+    assert cluster.representative.url == make_article("copy", STORY).url
+    assert not cluster.earlier
+    assert len(index.entries) == 1
@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+
+from src.embeddings.embedder import HashingEmbedder
+from src.embeddings.index import EmbeddingIndex
+
+def unit_vectors(count: int, dim: int = 8, seed: int = 0) -> np.ndarray:
+    vectors = np.random.default_rng(seed).normal(size=(count, dim)).astype(np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+def test_append_grows_buffer_geometrically():
+    index = EmbeddingIndex(HashingEmbedder(8))
+    vectors = unit_vectors(5000)
+    reallocations = 0
+    buffer = None
+
+    for i in range(len(vectors)):
+        index._append([i], vectors[i:i + 1])
+        if index._vectors is not buffer:
+            reallocations += 1
+            buffer = index._vectors
+
+    assert index.size == 5000
+    assert reallocations <= 4
+    np.testing.assert_array_equal(index.matrix, vectors)
+    np.testing.assert_array_equal(index.ids, np.arange(5000))
+
+def test_search_sees_rows_appended_after_growth():
+    index = EmbeddingIndex(HashingEmbedder(8))
+    vectors = unit_vectors(1500)
+    index._append(range(1000), vectors[:1000])
+    index._append(range(1000, 1500), vectors[1000:])
+
+    [(article_id, similarity)] = index.search(vectors[1234], k=1)
+    assert article_id == 1234
+    assert similarity == pytest.approx(1.0)
+    np.testing.assert_array_equal(index.vector_of(1499), vectors[1499])
+    assert 1234 not in [article_id for article_id, _ in index.search(vectors[1234], k=5, exclude=[1234])]
+
+def test_empty_index_returns_nothing():
+    index = EmbeddingIndex(HashingEmbedder(8))
+
+    assert index.matrix is None
+    assert len(index.ids) == 0
+    assert index.search(unit_vectors(1)[0]) == []
+    assert index.vector_of(1) is None
@@ -0,0 +1,148 @@
+from datetime import datetime, timezone
+
+import httpx
+import pytest
+
+from src.collectors import feed as feed_module
+from src.collectors.feed import FeedCollector, FeedStateStore, _FeedLinkParser, _parse_date
+from src.utils.exceptions import ArticleCollectionError
+from src.utils.http import PooledHTTPClient
+
+RSS = b"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0" xmlns:dc="http://purl.org/dc/elements/1.1/">
+  <channel>
+    <title>Example News</title>
+    <item>
+      <title>Bank raises rates</title>
+      <link>https://example.com/news/rates</link>
+      <pubDate>Tue, 02 Jan 2024 10:00:00 +0100</pubDate>
+      <description>The central bank raised interest rates.</description>
+    </item>
+    <item>
+      <title>Old story</title>
+      <link>https://example.com/news/old</link>
+      <dc:date>2023-06-01T08:00:00Z</dc:date>
+    </item>
+    <item>
+      <title>No date</title>
+      <link>https://example.com/news/undated</link>
+    </item>
+  </channel>
+</rss>
+"""
+
+ATOM = b"""<?xml version="1.0" encoding="utf-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+  <entry>
+    <title>Chip launch</title>
+    <link rel="replies" href="https://example.com/news/chip#comments"/>
+    <link href="https://example.com/news/chip"/>
+    <updated>2024-01-03T12:00:00Z</updated>
+    <summary>A new graphics processor.</summary>
+  </entry>
+</feed>
+"""
+
+class FeedServer:
+    """MockTransport handler serving a homepage and one feed with an ETag."""
+
+    def __init__(self, feed: bytes, feed_path: str = "/rss.xml"):
+        self.feed = feed
+        self.feed_path = feed_path
+        self.requests = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if request.url.path == "/":
+            return httpx.Response(
+                200,
+                headers={"content-type": "text/html"},
+                text=f'<html><head><link rel="alternate" type="application/rss+xml" href="{self.feed_path}"></head></html>'
+            )
+        if request.url.path != self.feed_path:
+            return httpx.Response(404)
+        if request.headers.get("if-none-match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(
+            200,
+            headers={"content-type": "application/rss+xml", "etag": '"v1"'},
+            content=self.feed
+        )
+
+@pytest.fixture
+def collector(tmp_path):
+    return FeedCollector(FeedStateStore(tmp_path / "feeds.db"))
+
+@pytest.fixture
+def serve(monkeypatch):
+    """Route the collector's HTTP client to a FeedServer."""
+    def serve(server: FeedServer) -> FeedServer:
+        client = PooledHTTPClient(transport=httpx.MockTransport(server))
+        monkeypatch.setattr(feed_module, "get_http_client", lambda: client)
+        return server
+    return serve
+
+def test_parse_date_accepts_rss_and_atom_formats():
+    assert _parse_date("Tue, 02 Jan 2024 10:00:00 +0100") == datetime(2024, 1, 2, 9, tzinfo=timezone.utc)
+    assert _parse_date(" 2024-01-03T12:00:00Z ") == datetime(2024, 1, 3, 12, tzinfo=timezone.utc)
+    assert _parse_date("yesterday") is None
+
+def test_link_parser_finds_only_feed_alternates():
+    parser = _FeedLinkParser()
+    parser.feed(
+        '<link rel="stylesheet" href="/style.css">'
+        '<link rel="alternate" type="application/atom+xml" href="/atom.xml">'
+        '<link rel="alternate" type="text/html" href="/fr/">'
+        '<link rel="Alternate Home" type="Application/RSS+XML" href="/rss">'
+    )
+    assert parser.feeds == ["/atom.xml", "/rss"]
+
+@pytest.mark.asyncio
+async def test_rss_entries_are_parsed_and_filtered_by_window(collector, serve):
+    serve(FeedServer(RSS))
+
+    articles = await collector.get_articles("example.com", start_date=datetime(2024, 1, 1))
+
+    assert len(articles) == 1
+    article = articles[0]
+    assert article.title == "Bank raises rates"
+    assert str(article.url) == "https://example.com/news/rates"
+    assert article.publication_date == datetime(2024, 1, 2, 9)
+    assert article.content == "The central bank raised interest rates."
+
+@pytest.mark.asyncio
+async def test_atom_entries_prefer_alternate_link(collector, serve):
+    serve(FeedServer(ATOM, feed_path="/atom.xml"))
+
+    articles = await collector.get_articles("example.com")
+
+    assert [str(article.url) for article in articles] == ["https://example.com/news/chip"]
+    assert articles[0].content == "A new graphics processor."
+
+@pytest.mark.asyncio
+async def test_not_modified_feed_reuses_stored_entries(collector, serve):
+    server = serve(FeedServer(RSS))
+
+    first = await collector.get_articles("example.com")
+    server.feed = b"<rss><channel></channel></rss>"
+    second = await collector.get_articles("example.com")
+
+    feed_requests = [request for request in server.requests if request.url.path == "/rss.xml"]
+    assert len(feed_requests) == 2
+    assert feed_requests[1].headers["if-none-match"] == '"v1"'
+    assert [article.url for article in second] == [article.url for article in first]
+    # Discovery is cached, so the homepage is only fetched once
+    assert sum(request.url.path == "/" for request in server.requests) == 1
+
+@pytest.mark.asyncio
+async def test_source_without_feed_raises(collector, monkeypatch):
+    def server(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/":
+            return httpx.Response(200, headers={"content-type": "text/html"}, text="<html></html>")
+        return httpx.Response(404)
+    client = PooledHTTPClient(transport=httpx.MockTransport(server))
+    monkeypatch.setattr(feed_module, "get_http_client", lambda: client)
+
+    with pytest.raises(ArticleCollectionError):
+        await collector.get_articles("example.com")
+    assert collector.store.get_feeds("example.com") == []
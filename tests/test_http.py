@@ -0,0 +1,29 @@
+import asyncio
+
+from src.utils.background import BackgroundLoop
+from src.utils.http import close_http_client, get_http_client
+
+async def current_client():
+    return get_http_client()
+
+def test_background_loop_reuses_one_client_and_closes_it():
+    loop = BackgroundLoop()
+
+    first = loop.run(current_client())
+    second = loop.run(current_client())
+    assert first is second
+    assert not first.client.is_closed
+
+    loop.close()
+    assert first.client.is_closed
+
+def test_close_http_client_of_a_finished_loop():
+    async def use_and_close():
+        client = get_http_client()
+        await close_http_client()
+        return client
+
+    client = asyncio.run(use_and_close())
+    assert client.client.is_closed
+    # A closed client is not handed out again
+    assert asyncio.run(use_and_close()) is not client
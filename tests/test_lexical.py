@@ -0,0 +1,88 @@
+from datetime import datetime
+
+import pytest
+
+from src.filters.lexical import LexicalPrefilter, expand_topic, tokenize
+from src.models.article import ArticleCreate
+
+def make_article(title: str, content: str) -> ArticleCreate:
+    return ArticleCreate(
+        title=title,
+        url=f"https://example.com/{abs(hash(title))}",
+        publication_date=datetime(2024, 1, 1),
+        source="example.com",
+        content=content
+    )
+
+ARTICLES = [
+    make_article(
+        "Artificial intelligence startups raise record funding",
+        "Investors poured money into artificial intelligence companies building AI models."
+    ),
+    make_article(
+        "Local team wins the football final",
+        "The football club celebrated after a late goal decided the match."
+    ),
+    make_article(
+        "Council reviews budget",
+        "The city council discussed the budget, including a small AI pilot for permits."
+    ),
+]
+
+@pytest.mark.parametrize("words", [
+    "rate rates rated rating",
+    "raise raises raised raising",
+    "box boxes",
+    "class classes",
+    "match matches",
+    "company companies",
+    "stop stops stopped stopping",
+    "agree agrees agreed",
+])
+def test_inflections_share_a_stem(words):
+    assert len(set(tokenize(words))) == 1
+
+@pytest.mark.parametrize("word", ["status", "analysis", "bus", "fed"])
+def test_short_and_non_plural_endings_are_kept(word):
+    assert tokenize(word) == [word]
+
+def test_expand_topic():
+    assert expand_topic("Artificial Intelligence", ["machine learning"]) == tokenize(
+        "artificial intelligence ai machine learning"
+    )
+    assert expand_topic("the economy") == ["economy"]
+
+def test_singular_mention_matches_plural_topic():
+    article = make_article("Fed holds rate steady", "The Federal Reserve kept its benchmark rate unchanged.")
+
+    verdicts, scores = LexicalPrefilter().split([article], ["Interest Rates"], reject_below=0.05, accept_above=0.5)
+
+    assert scores[0, 0] > 0.05
+    assert verdicts[0]["Interest Rates"] is not False
+
+def test_split_decides_clear_cases_and_defers_the_rest():
+    verdicts, scores = LexicalPrefilter().split(
+        ARTICLES, ["artificial intelligence", "football"], reject_below=0.05, accept_above=0.5
+    )
+
+    assert scores.shape == (3, 2)
+    assert ((scores >= 0) & (scores < 1)).all()
+    assert verdicts[0] == {"artificial intelligence": True, "football": False}
+    assert verdicts[1] == {"artificial intelligence": False, "football": True}
+    # A passing mention is neither a clear match nor a clear miss
+    assert verdicts[2]["artificial intelligence"] is None
+    assert verdicts[2]["football"] is False
+
+def test_split_uses_extra_terms():
+    plain, _ = LexicalPrefilter().split(ARTICLES[1:2], ["sport"], reject_below=0.05, accept_above=0.5)
+    extended, _ = LexicalPrefilter().split(
+        ARTICLES[1:2], ["sport"], reject_below=0.05, accept_above=0.5, extra_terms={"sport": ["football"]}
+    )
+    assert plain[0]["sport"] is False
+    assert extended[0]["sport"] is not False
+
+@pytest.mark.parametrize("articles, topics", [([], ["football"]), (ARTICLES, [])])
+def test_split_empty_input(articles, topics):
+    verdicts, scores = LexicalPrefilter().split(articles, topics, reject_below=0.05, accept_above=0.5)
+    assert scores.shape == (len(articles), len(topics))
+    assert verdicts == [{} for _ in articles]
@@ -0,0 +1,159 @@
+from datetime import datetime, timedelta
+from typing import List
+
+import pytest
+from sqlalchemy import inspect
+
+from src.models.article import ArticleCreate
+from src.services import news_service as news_service_module
+from src.services.news_service import NewsService
+from tests.fakes import FakeOpenAI
+
+START = datetime(2024, 1, 1)
+BODIES = [
+    "The central bank raised interest rates again, citing persistent inflation in services.",
+    "A new graphics processor promises faster training for large language models next year.",
+    "The football club signed a young striker after a long negotiation with his former team.",
+]
+
+def make_articles() -> List[ArticleCreate]:
+    return [
+        ArticleCreate(
+            title=f"Story {i}",
+            url=f"https://example.com/story-{i}",
+            publication_date=START + timedelta(hours=i),
+            source="example.com",
+            content=body
+        )
+        for i, body in enumerate(BODIES)
+    ]
+
+@pytest.fixture
+def service(database, monkeypatch):
+    monkeypatch.setattr(news_service_module.settings, "filter_prefilter_enabled", False)
+    service = NewsService()
+    service.filter.openai_client = FakeOpenAI()
+    return service
+
+def collect(service: NewsService, articles: List[ArticleCreate]) -> None:
+    """Make the collector return the articles, as NewsAPICollector would."""
+    async def get(source, start_date=None, end_date=None, since=None, **kwargs):
+        service.collector._record_published("NewsAPICollector", source, articles)
+        return [article.model_copy() for article in articles]
+    service.collector.get = get
+
+@pytest.mark.asyncio
+async def test_watermark_stays_before_articles_without_verdict(service):
+    articles = make_articles()
+    collect(service, articles)
+    service.filter.openai_client.down = True
+
+    saved = await service.collect_and_filter_topics("example.com", ["news"], incremental=True)
+
+    assert saved == {"news": []}
+    watermarks = await service._get_watermarks("example.com", ["news"])
+    assert watermarks["NewsAPICollector"] < articles[0].publication_date
+
+    # Once the API is back the same articles are classified and the watermark catches up
+    service.filter.openai_client.down = False
+    saved = await service.collect_and_filter_topics("example.com", ["news"], incremental=True)
+
+    assert sorted(article.url for article in saved["news"]) == sorted(str(a.url) for a in articles)
+    watermarks = await service._get_watermarks("example.com", ["news"])
+    assert watermarks["NewsAPICollector"] == articles[-1].publication_date
+
+@pytest.mark.asyncio
+async def test_watermark_advances_fully_when_every_verdict_is_definitive(service):
+    articles = make_articles()
+    collect(service, articles)
+    service.filter.openai_client.relevant = lambda title, topic: title == "Story 0"
+
+    saved = await service.collect_and_filter_topics("example.com", ["news"], incremental=True)
+
+    assert [article.title for article in saved["news"]] == ["Story 0"]
+    watermarks = await service._get_watermarks("example.com", ["news"])
+    assert watermarks["NewsAPICollector"] == articles[-1].publication_date
+
+def copy_of(article: ArticleCreate, slug: str) -> ArticleCreate:
+    """Syndicated copy of an article under another URL."""
+    return article.model_copy(update={"url": f"https://mirror.example.com/{slug}", "content": article.content + " Updated."})
+
+@pytest.mark.asyncio
+async def test_copy_of_saved_story_is_recorded_as_duplicate_without_classification(service):
+    articles = make_articles()
+    collect(service, articles[:1])
+    [original] = (await service.collect_and_filter_topics("example.com", ["news"]))["news"]
+
+    copy = copy_of(articles[0], "copy")
+    collect(service, [copy])
+    service.filter.openai_client.calls.clear()
+    saved = await service.collect_and_filter_topics("example.com", ["news"])
+
+    assert saved == {"news": []}
+    assert service.filter.openai_client.calls == []
+    assert [duplicate.url for duplicate in service.get_duplicates(original.id)] == [str(copy.url)]
+
+@pytest.mark.asyncio
+async def test_copy_of_unsaved_story_is_classified_in_its_place(service):
+    articles = make_articles()
+    service.filter.openai_client.relevant = lambda title, topic: False
+    collect(service, articles[:1])
+    assert await service.collect_and_filter_topics("example.com", ["news"]) == {"news": []}
+
+    copies = [copy_of(articles[0], "copy-1"), copy_of(articles[0], "copy-2")]
+    collect(service, copies)
+    service.filter.openai_client.relevant = lambda title, topic: True
+    service.filter.openai_client.calls.clear()
+    saved = await service.collect_and_filter_topics("example.com", ["news"])
+
+    assert [article.url for article in saved["news"]] == [str(copies[0].url)]
+    assert len(service.filter.openai_client.calls) == 1
+    assert [duplicate.url for duplicate in service.get_duplicates(saved["news"][0].id)] == [str(copies[1].url)]
+
+@pytest.mark.asyncio
+async def test_copy_of_story_saved_by_another_process_is_not_classified(service):
+    articles = make_articles()
+    collect(service, articles[:1])
+    [original] = (await service.collect_and_filter_topics("example.com", ["news"]))["news"]
+
+    # A new service seeds its near-duplicate index from the saved articles
+    restarted = NewsService()
+    restarted.filter.openai_client = FakeOpenAI()
+    copy = copy_of(articles[0], "copy")
+    collect(restarted, [copy])
+    saved = await restarted.collect_and_filter_topics("example.com", ["news"])
+
+    assert saved == {"news": []}
+    assert restarted.filter.openai_client.calls == []
+    assert [duplicate.url for duplicate in restarted.get_duplicates(original.id)] == [str(copy.url)]
+
+def body_loaded(article) -> bool:
+    return "body" not in inspect(article).unloaded
+
+@pytest.mark.asyncio
+async def test_results_come_without_bodies_until_loaded(service):
+    articles = make_articles()
+    collect(service, articles)
+    saved = (await service.collect_and_filter_topics("example.com", ["news"]))["news"]
+    # The second run finds every article already saved
+    known = (await service.collect_and_filter_topics("example.com", ["news"]))["news"]
+    similar = [article for article, _ in await service.find_similar(BODIES[1], k=3)]
+    # Newly saved articles had their bodies loaded to be embedded
+    assert all(body_loaded(article) for article in saved)
+    listings = [
+        known,
+        similar,
+        service.get_saved_articles(topic="news"),
+        [hit.article for hit in service.search("interest rates")],
+    ]
+
+    for listing in listings:
+        assert listing
+        assert not any(body_loaded(article) for article in listing)
+        service.load_content(listing)
+        assert [article.content for article in listing] == [
+            next(a.content for a in articles if str(a.url) == article.url) for article in listing
+        ]
+
+    # Bodies were loaded for embedding, so the closest article is the query's own text
+    assert similar[0].url == str(articles[1].url)
@@ -0,0 +1,75 @@
+from datetime import datetime, timedelta
+from typing import List, Optional
+
+import pytest
+from sqlmodel import col, or_, select
+
+from src.models.article import Article, ArticleCreate, ArticleTopic
+from src.models.bulk import link_topics, upsert_articles
+from src.models.database import get_session
+from src.services.news_service import NewsService
+
+START = datetime(2024, 1, 1)
+
+@pytest.fixture
+def service(database):
+    """Service over 30 articles, three per publication date, linked to topics in overlapping ways."""
+    articles = []
+    for i in range(30):
+        article = ArticleCreate(
+            title=f"Story {i}",
+            url=f"https://example.com/story-{i}",
+            publication_date=START + timedelta(hours=i // 3),
+            source="example.com",
+            content=f"Body {i}"
+        )
+        # Primary topic for every third article, a topic link for every other one
+        article.topic = "news" if i % 3 == 0 else "sport"
+        articles.append(article)
+    with get_session() as session:
+        ids = upsert_articles(session, articles)
+        link_topics(session, [(ids[f"https://example.com/story-{i}"], "news") for i in range(0, 30, 2)])
+        session.commit()
+    return NewsService()
+
+def reference(topic: Optional[str], start_date: Optional[datetime], end_date: Optional[datetime]) -> List[int]:
+    """IDs the listing returned before keyset paging: one OR query sorted in full."""
+    query = select(Article.id)
+    if topic:
+        linked = select(ArticleTopic.article_id).where(ArticleTopic.topic == topic)
+        query = query.where(or_(Article.topic == topic, col(Article.id).in_(linked)))
+    if start_date:
+        query = query.where(Article.publication_date >= start_date)
+    if end_date:
+        query = query.where(Article.publication_date <= end_date)
+    with get_session() as session:
+        return session.exec(query.order_by(col(Article.publication_date).desc(), col(Article.id).desc())).all()
+
+def all_pages(service: NewsService, limit: int, **kwargs) -> List[int]:
+    ids, cursor = [], None
+    while True:
+        page = service.get_articles_page(cursor=cursor, limit=limit, **kwargs)
+        assert len(page.articles) <= limit
+        ids.extend(article.id for article in page.articles)
+        if page.next_cursor is None:
+            return ids
+        cursor = page.next_cursor
+
+@pytest.mark.parametrize("topic", ["news", "sport", None])
+@pytest.mark.parametrize("limit", [1, 4, 7, 100])
+def test_pages_match_the_full_query(service, topic, limit):
+    assert all_pages(service, limit, topic=topic) == reference(topic, None, None)
+
+@pytest.mark.parametrize("topic", ["news", None])
+def test_pages_respect_date_window(service, topic):
+    start_date, end_date = START + timedelta(hours=2), START + timedelta(hours=7)
+
+    ids = all_pages(service, 4, topic=topic, start_date=start_date, end_date=end_date)
+
+    assert ids == reference(topic, start_date, end_date)
+    assert ids
+
+def test_article_with_primary_topic_and_link_is_listed_once(service):
+    ids = all_pages(service, 5, topic="news")
+
+    assert len(ids) == len(set(ids))
@@ -0,0 +1,77 @@
+import asyncio
+
+import pytest
+
+from src.utils import rate_limit as rate_limit_module
+from src.utils.exceptions import QuotaExceededError
+from src.utils.rate_limit import ProviderScheduler, TokenBucket
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable monotonic clock for the rate limiter."""
+    now = [1000.0]
+    monkeypatch.setattr(rate_limit_module.time, "monotonic", lambda: now[0])
+    return now
+
+def test_bucket_allows_burst_then_refills_at_rate(clock):
+    bucket = TokenBucket(rate=2.0, capacity=3)
+
+    assert [bucket.take() for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert bucket.take() == pytest.approx(0.5)
+
+    clock[0] += 0.5
+    assert bucket.take() == 0.0
+    assert bucket.take() == pytest.approx(0.5)
+
+def test_bucket_never_exceeds_capacity(clock):
+    bucket = TokenBucket(rate=10.0, capacity=2)
+
+    clock[0] += 60
+    assert [bucket.take() for _ in range(2)] == [0.0, 0.0]
+    assert bucket.take() > 0
+
+def test_block_drains_bucket_until_it_expires(clock):
+    bucket = TokenBucket(rate=1.0, capacity=5)
+
+    bucket.block(30)
+    assert bucket.take() == pytest.approx(30)
+
+    clock[0] += 30
+    assert bucket.take() == 0.0
+
+@pytest.mark.asyncio
+async def test_scheduler_serves_sources_round_robin():
+    scheduler = ProviderScheduler("Test", rate=1000.0, burst=1)
+    order = []
+
+    async def request(key):
+        await scheduler.acquire(key)
+        order.append(key)
+
+    await asyncio.gather(*(request(key) for key in ["a", "a", "a", "b", "c"]))
+
+    assert order == ["a", "b", "c", "a", "a"]
+
+@pytest.mark.asyncio
+async def test_scheduler_enforces_daily_quota():
+    scheduler = ProviderScheduler("Test", rate=1000.0, burst=5, daily_quota=2)
+
+    await scheduler.acquire("a")
+    await scheduler.acquire("b")
+
+    with pytest.raises(QuotaExceededError):
+        await scheduler.acquire("a")
+    assert scheduler.usage()["used_today"] == 2
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_returns_its_token():
+    scheduler = ProviderScheduler("Test", rate=1.0, burst=1)
+    await scheduler.acquire("a")
+
+    waiter = asyncio.create_task(scheduler.acquire("a"))
+    await asyncio.sleep(0)
+    waiter.cancel()
+    await asyncio.sleep(1.1)
+
+    assert scheduler.usage() == {"used_today": 1, "daily_quota": 0, "queued": 0}
+    assert scheduler.bucket.take() == 0.0
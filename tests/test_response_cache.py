@@ -0,0 +1,71 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.collectors import cache as cache_module
+from src.collectors.cache import ResponseCache, normalize_window
+from src.models.article import ArticleCreate
+
+PAST = datetime(2024, 1, 1)
+ARTICLES = [
+    ArticleCreate(
+        title="Bank raises rates",
+        url="https://example.com/rates",
+        publication_date=PAST,
+        source="example.com",
+        content="Body"
+    )
+]
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1_000_000.0]
+    monkeypatch.setattr(cache_module.time, "time", lambda: now[0])
+    return now
+
+@pytest.fixture
+def cache(tmp_path):
+    return ResponseCache(tmp_path / "responses.db", max_entries=2, ttl_recent=60, ttl_past=3600)
+
+def test_round_trip_and_counters(cache):
+    assert cache.get("A", "example.com", PAST, PAST + timedelta(days=1)) is None
+    cache.put("A", "example.com", PAST, PAST + timedelta(days=1), ARTICLES)
+
+    assert cache.get("A", "EXAMPLE.com", PAST, PAST + timedelta(days=1)) == ARTICLES
+    assert cache.get("B", "example.com", PAST, PAST + timedelta(days=1)) is None
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 2
+
+def test_recent_windows_expire_sooner(cache, clock):
+    recent_end = datetime.utcnow()
+    cache.put("A", "example.com", PAST, PAST + timedelta(days=1), ARTICLES)
+    cache.put("A", "example.com", recent_end - timedelta(days=1), recent_end, ARTICLES)
+
+    clock[0] += 61
+    assert cache.get("A", "example.com", recent_end - timedelta(days=1), recent_end) is None
+    assert cache.get("A", "example.com", PAST, PAST + timedelta(days=1)) == ARTICLES
+
+    clock[0] += 3600
+    assert cache.get("A", "example.com", PAST, PAST + timedelta(days=1)) is None
+    # Expired entries are deleted on lookup
+    assert cache.stats()["entries"] == 0
+
+def test_least_recently_used_entry_is_evicted(cache, clock):
+    for day in range(2):
+        cache.put("A", "example.com", PAST + timedelta(days=day), PAST + timedelta(days=day + 1), ARTICLES)
+        clock[0] += 1
+    # Touch the first entry so the second becomes the least recently used
+    assert cache.get("A", "example.com", PAST, PAST + timedelta(days=1)) is not None
+    clock[0] += 1
+
+    cache.put("A", "example.com", PAST + timedelta(days=2), PAST + timedelta(days=3), ARTICLES)
+
+    assert cache.stats()["entries"] == 2
+    assert cache.stats()["evictions"] == 1
+    assert cache.get("A", "example.com", PAST + timedelta(days=1), PAST + timedelta(days=2)) is None
+    assert cache.get("A", "example.com", PAST, PAST + timedelta(days=1)) is not None
+
+def test_normalize_window_truncates_to_minutes():
+    start, end = normalize_window(datetime(2024, 1, 1, 8, 30, 15, 5), datetime(2024, 1, 2, 8, 30, 59))
+    assert start == datetime(2024, 1, 1, 8, 30)
+    assert end == datetime(2024, 1, 2, 8, 30)
@@ -0,0 +1,66 @@
+from datetime import datetime
+
+import pytest
+
+from src.models.article import ArticleCreate
+from src.models.bulk import upsert_articles
+from src.models.database import get_session
+from src.models.search import SearchFilters, match_query
+from src.services.news_service import NewsService
+
+@pytest.mark.parametrize("text, expected", [
+    ("interest rates", '"interest" "rates"'),
+    ("  rates  ", '"rates"'),
+    ('rates" OR title:*', '"rates" "OR" "title"'),
+    ("NEAR(a b)", '"NEAR" "a" "b"'),
+    ("café zürich", '"café" "zürich"'),
+    ("covid-19", '"covid" "19"'),
+])
+def test_match_query_quotes_every_word(text, expected):
+    assert match_query(text) == expected
+
+@pytest.mark.parametrize("text", ["", "   ", '"*"():-'])
+def test_match_query_without_words(text):
+    assert match_query(text) is None
+
+@pytest.fixture
+def service(database):
+    """Service over a few saved articles."""
+    articles = [
+        ("Central bank raises interest rates", "Borrowing costs climb as the bank fights inflation.", "economy", "bank.example.com"),
+        ("Markets slip", "Stocks fell after the central bank said interest rates would stay high.", "economy", "markets.example.com"),
+        ("Striker signs for derby rivals", "The club confirmed the transfer on Monday.", "sport", "club.example.com"),
+    ]
+    with get_session() as session:
+        upsert_articles(session, [
+            ArticleCreate(
+                title=title,
+                url=f"https://{source}/{i}",
+                publication_date=datetime(2024, 1, 1 + i),
+                source=source,
+                topic=topic,
+                content=content
+            )
+            for i, (title, content, topic, source) in enumerate(articles)
+        ])
+        session.commit()
+    return NewsService()
+
+def test_search_ranks_title_matches_first(service):
+    hits = service.search("interest rates")
+
+    assert [hit.article.title for hit in hits] == ["Central bank raises interest rates", "Markets slip"]
+    assert hits[0].score <= hits[1].score
+    assert "**interest**" in hits[1].snippet
+
+def test_search_applies_filters(service):
+    assert [hit.article.title for hit in service.search("bank", SearchFilters(source="markets.example.com"))] == [
+        "Markets slip"
+    ]
+    assert service.search("bank", SearchFilters(topic="sport")) == []
+    assert [hit.article.title for hit in service.search("bank", SearchFilters(start_date=datetime(2024, 1, 2)))] == [
+        "Markets slip"
+    ]
+
+def test_search_without_words_returns_nothing(service):
+    assert service.search("  ?! ") == []
@@ -0,0 +1,36 @@
+from datetime import datetime, timedelta
+
+from src.collectors.sharding import merge_unique, shard_window, split_in_half
+from src.models.article import ArticleCreate
+
+START = datetime(2024, 1, 1)
+
+def test_shard_window_covers_window_without_gaps():
+    shards = shard_window(START, START + timedelta(hours=10), timedelta(hours=4))
+    assert shards == [
+        (START, START + timedelta(hours=4)),
+        (START + timedelta(hours=4), START + timedelta(hours=8)),
+        (START + timedelta(hours=8), START + timedelta(hours=10)),
+    ]
+
+def test_shard_window_exact_multiple():
+    shards = shard_window(START, START + timedelta(days=2), timedelta(days=1))
+    assert shards == [(START, START + timedelta(days=1)), (START + timedelta(days=1), START + timedelta(days=2))]
+
+def test_shard_window_shorter_than_step():
+    end = START + timedelta(minutes=5)
+    assert shard_window(START, end, timedelta(hours=1)) == [(START, end)]
+
+def test_shard_window_empty_window():
+    assert shard_window(START, START, timedelta(hours=1)) == [(START, START)]
+
+def test_split_in_half():
+    end = START + timedelta(hours=3)
+    middle = START + timedelta(hours=1, minutes=30)
+    assert split_in_half(START, end) == [(START, middle), (middle, end)]
+
+def test_merge_unique_keeps_first_copy_of_each_url():
+    first = ArticleCreate(title="First", url="https://example.com/a", publication_date=START, source="example.com", content="")
+    again = ArticleCreate(title="Again", url="https://example.com/a", publication_date=START, source="example.com", content="")
+    other = ArticleCreate(title="Other", url="https://example.com/b", publication_date=START, source="example.com", content="")
+    assert [a.title for a in merge_unique([[first], [again, other]])] == ["First", "Other"]
@@ -0,0 +1,25 @@
+import pytest
+
+from src.utils.urls import canonicalize_url, url_hash
+
+@pytest.mark.parametrize("url, expected", [
+    ("HTTPS://Example.COM/News/Story/", "https://example.com/News/Story"),
+    ("https://example.com:443/a", "https://example.com/a"),
+    ("http://example.com:80/a", "http://example.com/a"),
+    ("https://example.com:8443/a", "https://example.com:8443/a"),
+    ("https://example.com/a#comments", "https://example.com/a"),
+    ("https://example.com", "https://example.com/"),
+    ("  https://example.com/a  ", "https://example.com/a"),
+    ("https://example.com/a?utm_source=x&UTM_Medium=y&fbclid=z&id=3", "https://example.com/a?id=3"),
+    ("https://example.com/a?b=2&a=1&a=0", "https://example.com/a?a=0&a=1&b=2"),
+    ("https://example.com/a?flag=", "https://example.com/a?flag="),
+])
+def test_canonicalize_url(url, expected):
+    assert canonicalize_url(url) == expected
+
+def test_url_hash_ignores_tracking_decorations():
+    assert url_hash("https://example.com/a?utm_campaign=x#top") == url_hash("https://EXAMPLE.com/a/")
+    assert url_hash("https://example.com/a") != url_hash("https://example.com/b")
+
+def test_url_hash_fits_signed_64_bits():
+    assert -2**63 <= url_hash("https://example.com/a") < 2**63
@@ -0,0 +1,68 @@
+from datetime import datetime, timedelta
+from typing import List
+
+import pytest
+from sqlmodel import func, select
+
+from src.filters import verdict_cache as verdict_cache_module
+from src.filters.verdict_cache import VerdictCache
+from src.models.article import ArticleCreate
+from src.models.database import get_session
+from src.models.verdict import RelevanceVerdict
+
+def make_articles(count: int) -> List[ArticleCreate]:
+    return [
+        ArticleCreate(
+            title=f"Story {i}",
+            url=f"https://example.com/story-{i}",
+            publication_date=datetime(2024, 1, 1) + timedelta(hours=i),
+            source="example.com",
+            content=f"Body of story {i}."
+        )
+        for i in range(count)
+    ]
+
+def count_rows() -> int:
+    with get_session() as session:
+        return session.exec(select(func.count(RelevanceVerdict.id))).one()
+
+@pytest.mark.asyncio
+async def test_lookup_hits_stored_verdicts_and_misses_the_rest(database):
+    cache = VerdictCache("gpt-test", "1")
+    articles = make_articles(3)
+
+    await cache.store(articles[:2], "news", [True, False])
+
+    assert await cache.lookup(articles, "news") == [True, False, None]
+    assert await cache.lookup(articles, "sport") == [None, None, None]
+    assert cache.stats() == {"hits": 2, "misses": 4}
+
+@pytest.mark.asyncio
+async def test_failed_verdicts_are_not_cached(database):
+    cache = VerdictCache("gpt-test", "1")
+    articles = make_articles(2)
+
+    await cache.store(articles, "news", [None, True])
+
+    assert await cache.lookup(articles, "news") == [None, True]
+    assert count_rows() == 1
+
+@pytest.mark.asyncio
+async def test_other_model_or_prompt_version_misses(database):
+    articles = make_articles(1)
+    await VerdictCache("gpt-test", "1").store(articles, "news", [True])
+
+    assert await VerdictCache("gpt-test", "1").lookup(articles, "news") == [True]
+    assert await VerdictCache("gpt-other", "1").lookup(articles, "news") == [None]
+
+@pytest.mark.asyncio
+async def test_store_evicts_oldest_verdicts_over_the_limit(database, monkeypatch):
+    monkeypatch.setattr(verdict_cache_module.settings, "verdict_cache_max_entries", 3)
+    cache = VerdictCache("gpt-test", "1")
+    articles = make_articles(5)
+
+    for article in articles:
+        await cache.store([article], "news", [True])
+
+    assert count_rows() == 3
+    assert await cache.lookup(articles, "news") == [None, None, True, True, True]